@@ -0,0 +1,6 @@
+"""
+BMAD - Build, Measure, Analyze, Decide campaign optimization toolkit
+
+Commands run through one entry point, python -m bmad <command>. The package
+itself imports nothing, so each command loads only the modules it uses.
+"""
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+BMAD Command Line
+Single entry point that lazily dispatches the measure, decide, orchestrate, track and webhook tools
+"""
+
+import sys
+import importlib
+from typing import List, Optional
+
+# Command -> (module with a main(argv) function, description)
+COMMANDS = {
+    "measure": ("bmad.measure_tracking_system", "Collect metrics, manage KPIs, backfill and report"),
+    "decide": ("bmad.decide_workflow_system", "Analyze metrics and review recommendations"),
+    "orchestrate": ("bmad.bmad_integration_system", "Run and schedule complete BMAD cycles"),
+    "track": ("bmad.bmad_tracking_system", "Track optimizations, proposals and campaign metrics"),
+    "webhook": ("campaign.webhook_handler", "Serve the pricing calculator webhook"),
+}
+
+def usage() -> str:
+    lines = ["usage: python -m bmad <command> [options]", "", "commands:"]
+    lines += [f"  {name:<12} {description}" for name, (_, description) in COMMANDS.items()]
+    lines += ["", "Run 'python -m bmad <command> --help' for command options."]
+    return "\n".join(lines)
+
+def run(command: str, argv: Optional[List[str]] = None):
+    """Run one command in this process
+
+    Modules are imported on first use and stay loaded, so a long-lived
+    process can run any sequence of commands without re-importing them.
+    """
+    if command not in COMMANDS:
+        raise ValueError(f"Unknown command {command!r}; expected one of {', '.join(COMMANDS)}")
+
+    module = importlib.import_module(COMMANDS[command][0])
+    return module.main(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    # argparse in the command derives its usage line from argv[0]
+    sys.argv[0] = f"python -m bmad {command}"
+    run(command, rest)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,20 +7,22 @@ Orchestrates the complete Build-Measure-Analyze-Decide cycle with campaign autom
 import json
 import os
 import subprocess
-import schedule
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 
 # Import our BMAD components
-from measure_tracking_system import BMADMeasureSystem, MeasureTracker
-from decide_workflow_system import DecisionEngine, DecisionType, Priority
+from .measure_tracking_system import BMADMeasureSystem, MeasureTracker
+from .decide_workflow_system import DecisionEngine, DecisionType, Priority
+from .scheduler import Scheduler, daily_at, weekly_at, every
+from .recommendation_ranking import RankedRecommendations
+from .lazy_imports import lazy_import
+
+smtplib = lazy_import("smtplib")
+mime_text = lazy_import("email.mime.text")
+mime_multipart = lazy_import("email.mime.multipart")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -58,6 +60,10 @@ class BMADOrchestrator:
             "measure_phase_days": 14,
             "analyze_phase_days": 5,
             "decide_phase_days": 2,
+            "analysis": {
+                "segment_key": None,  # Dimension to split each campaign by, e.g. "tier"
+                "max_workers": None
+            },
             "email_notifications": {
                 "enabled": True,
                 "recipients": ["team@example.com"],
@@ -203,17 +209,20 @@ class BMADOrchestrator:
         conn = sqlite3.connect(self.decision_engine.db_path)
         cursor = conn.cursor()
         
+        # Latest decision per recommendation (maintained by DecisionEngine.make_decision),
+        # for recommendations a run has produced in the last 30 days
         query = '''
             SELECT r.id, r.title, r.description, r.implementation_timeline,
                    r.required_resources, d.approved_budget, d.assigned_team
-            FROM recommendations r
-            JOIN decisions d ON r.id = d.recommendation_id
-            WHERE d.decision = 'approve' 
-            AND d.status = 'approved'
-            AND r.created_at >= date('now', '-30 days')
+            FROM recommendation_status s
+            JOIN recommendations r ON r.id = s.recommendation_id
+            JOIN decisions d ON d.id = s.decision_id
+            WHERE s.decision = 'approve' 
+            AND s.status = 'approved'
+            AND r.last_seen_at >= ?
         '''
         
-        cursor.execute(query)
+        cursor.execute(query, ((datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'),))
         results = cursor.fetchall()
         conn.close()
         
@@ -354,9 +363,12 @@ class BMADOrchestrator:
             # Generate performance reports
             self.measure_system.generate_daily_report()
             
-            # Generate recommendations based on collected data
-            recommendations = self.decision_engine.analyze_performance_data(
-                self.measure_system.tracker.db_path
+            # Generate recommendations per campaign (and segment), merged into one ranked view
+            analysis = self.config.get("analysis", {})
+            recommendations = self.decision_engine.analyze_segmented_performance_data(
+                self.measure_system.tracker.db_path,
+                segment_key=analysis.get("segment_key"),
+                max_workers=analysis.get("max_workers")
             )
             
             # Save recommendations
@@ -377,7 +389,7 @@ class BMADOrchestrator:
             logger.error(f"ANALYZE phase failed: {e}")
             return False
     
-    def generate_analysis_report(self, recommendations: List) -> str:
+    def generate_analysis_report(self, recommendations: RankedRecommendations) -> str:
         """Generate comprehensive analysis report"""
         report = f"# BMAD Analysis Report - {self.current_cycle.cycle_id}\n\n"
         report += f"**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
@@ -387,24 +399,33 @@ class BMADOrchestrator:
         report += "## Key Findings\n\n"
         
         if recommendations:
-            # Categorize recommendations
-            quick_wins = [r for r in recommendations if hasattr(r, 'category') and r.category == 'quick_win']
-            major_projects = [r for r in recommendations if hasattr(r, 'category') and r.category == 'major_project']
+            # Ranked slices per category from the top-K heaps
+            quick_wins = recommendations.top(3, category='quick_win')
+            major_projects = recommendations.top(3, category='major_project')
             
             if quick_wins:
                 report += "### Quick Wins (High Impact, Low Effort)\n"
-                for rec in quick_wins[:3]:
+                for rec in quick_wins:
                     report += f"- **{rec.title}:** {rec.estimated_impact:.1f}% improvement ({rec.implementation_timeline} days)\n"
                 report += "\n"
             
             if major_projects:
                 report += "### Major Projects (High Impact, High Effort)\n"
-                for rec in major_projects[:3]:
+                for rec in major_projects:
                     report += f"- **{rec.title}:** {rec.estimated_impact:.1f}% improvement ({rec.implementation_timeline} days)\n"
                 report += "\n"
             
+            segments = getattr(recommendations, 'segments', {})
+            if segments:
+                report += "### By Segment\n"
+                for label, segment_recommendations in segments.items():
+                    top = segment_recommendations.top(1)
+                    lead = f" - top: {top[0].title}" if top else ""
+                    report += f"- **{label}:** {len(segment_recommendations)} recommendations{lead}\n"
+                report += "\n"
+            
             report += f"## All Recommendations ({len(recommendations)} total)\n\n"
-            for i, rec in enumerate(recommendations[:10], 1):
+            for i, rec in enumerate(recommendations.top(10), 1):
                 report += f"{i}. **{rec.title}**\n"
                 report += f"   - Impact: {rec.estimated_impact:.1f}%\n"
                 report += f"   - Effort: {rec.implementation_effort}\n"
@@ -505,7 +526,7 @@ class BMADOrchestrator:
             # Email notification
             smtp_config = self.config["email_notifications"]
             
-            msg = MIMEMultipart()
+            msg = mime_multipart.MIMEMultipart()
             msg['From'] = smtp_config["smtp_user"]
             msg['To'] = ", ".join(smtp_config["recipients"])
             msg['Subject'] = f"BMAD System: {message}"
@@ -515,7 +536,7 @@ class BMADOrchestrator:
             if include_report and report_content:
                 body += f"Report:\n\n{report_content}"
             
-            msg.attach(MIMEText(body, 'plain'))
+            msg.attach(mime_text.MIMEText(body, 'plain'))
             
             server = smtplib.SMTP(smtp_config["smtp_host"], smtp_config["smtp_port"])
             server.starttls()
@@ -536,18 +557,21 @@ class BMADOrchestrator:
         # Schedule cycle phases
         cycle_duration = self.config["cycle_duration_days"]
         
+        scheduler = Scheduler(
+            self.measure_system.tracker.db_path,
+            on_run=self.measure_system.tracker.record_job_run
+        )
+        
         # Start new cycle every cycle_duration days
-        schedule.every(cycle_duration).days.do(self.start_new_cycle)
+        scheduler.add_job("start_new_cycle", self.start_new_cycle, every(timedelta(days=cycle_duration)))
         
         # Daily health checks
-        schedule.every().day.at("09:00").do(self.daily_health_check)
+        scheduler.add_job("daily_health_check", self.daily_health_check, daily_at("09:00"))
         
         # Weekly progress reports
-        schedule.every().monday.at("10:00").do(self.send_weekly_progress)
+        scheduler.add_job("send_weekly_progress", self.send_weekly_progress, weekly_at("monday", "10:00"))
         
-        while True:
-            schedule.run_pending()
-            time.sleep(3600)  # Check every hour
+        scheduler.run_forever()
     
     def daily_health_check(self):
         """Perform daily system health check"""
@@ -589,7 +613,7 @@ class BMADOrchestrator:
         
         self.send_notification("📈 Weekly BMAD Progress Report", True, progress_report)
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main function for BMAD integration system"""
     import argparse
     
@@ -601,7 +625,7 @@ def main():
     parser.add_argument('--schedule', action='store_true', help='Start automated scheduling')
     parser.add_argument('--status', action='store_true', help='Show current cycle status')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     orchestrator = BMADOrchestrator()
     
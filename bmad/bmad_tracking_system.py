@@ -7,12 +7,23 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import logging
+from .metric_retention import RetentionEngine, DEFAULT_POLICIES, format_retention_report
+from .impact_statistics import compare_groups
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Metrics compared before and after each optimization
+IMPACT_METRICS = [
+    'calculator_completion_rate',
+    'form_submission_rate',
+    'overall_conversion_rate',
+    'proposal_response_rate'
+]
+
 class BMADTracker:
     """Real-time tracking system for BMAD optimization results"""
     
@@ -25,6 +36,9 @@ class BMADTracker:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # Incremental auto_vacuum lets retention hand freed pages back without a full VACUUM
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        
         # Campaign metrics table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS campaign_metrics (
@@ -67,6 +81,12 @@ class BMADTracker:
             )
         ''')
         
+        # Per-metric time windows around each optimization's implementation date
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_campaign_metrics_name_timestamp
+            ON campaign_metrics (metric_name, timestamp)
+        ''')
+        
         conn.commit()
         conn.close()
         logger.info("BMAD tracking database initialized")
@@ -189,65 +209,87 @@ class BMADTracker:
     
     def calculate_optimization_impact(self, optimization_id: str, days_back: int = 7):
         """Calculate the actual impact of an optimization"""
+        return self.calculate_optimization_impacts([optimization_id], days_back).get(optimization_id)
+    
+    def calculate_optimization_impacts(self, optimization_ids: Optional[List[str]] = None,
+                                       days_back: int = 7) -> Dict[str, dict]:
+        """Impact of several optimizations with significance tests, every metric in one batch
+        
+        Raw samples from days_back before and after each implementation date
+        are compared with Welch's t-test, a bootstrap interval on the percent
+        change and a sequential test scaled to the optimization's expected
+        impact. Samples tagged with a different optimization are left out.
+        Defaults to every recorded optimization. Retention keeps raw
+        samples within OPTIMIZATION_WINDOW_DAYS of every implementation date,
+        so a wider days_back misses samples that have already expired.
+        """
         conn = sqlite3.connect(self.db_path)
         
-        # Get optimization details
-        opt_query = "SELECT title, expected_impact, implemented_date FROM optimizations WHERE id = ?"
-        opt_result = conn.execute(opt_query, (optimization_id,)).fetchone()
-        
-        if not opt_result:
-            conn.close()
-            return None
-        
-        title, expected_impact, implemented_date = opt_result
-        impl_date = datetime.fromisoformat(implemented_date)
-        
-        # Calculate before/after metrics
-        before_date = impl_date - timedelta(days=days_back)
-        after_date = impl_date + timedelta(days=days_back)
-        
-        # Key metrics to analyze
-        key_metrics = [
-            'calculator_completion_rate',
-            'form_submission_rate', 
-            'overall_conversion_rate',
-            'proposal_response_rate'
-        ]
-        
-        impact_analysis = {}
-        
-        for metric in key_metrics:
-            # Get before values
-            before_query = '''
-                SELECT AVG(metric_value) FROM campaign_metrics 
-                WHERE metric_name = ? AND timestamp BETWEEN ? AND ?
-            '''
-            before_avg = conn.execute(before_query, (metric, before_date, impl_date)).fetchone()[0]
-            
-            # Get after values
-            after_query = '''
-                SELECT AVG(metric_value) FROM campaign_metrics 
-                WHERE metric_name = ? AND timestamp BETWEEN ? AND ?
-            '''
-            after_avg = conn.execute(after_query, (metric, impl_date, after_date)).fetchone()[0]
-            
-            if before_avg and after_avg:
-                impact_percent = ((after_avg - before_avg) / before_avg) * 100
-                impact_analysis[metric] = {
-                    'before': before_avg,
-                    'after': after_avg,
-                    'impact_percent': impact_percent
-                }
+        id_filter = ""
+        id_params: List[str] = []
+        if optimization_ids is not None:
+            id_filter = f"WHERE o.id IN ({', '.join('?' * len(optimization_ids))})"
+            id_params = list(optimization_ids)
+        
+        optimizations = {row[0]: row[1:] for row in conn.execute(f'''
+            SELECT o.id, o.title, o.expected_impact, o.implemented_date FROM optimizations o {id_filter}
+        ''', id_params)}
+        
+        # Raw samples of every window in one query; after samples in arrival order
+        cursor = conn.execute(f'''
+            SELECT o.id, m.metric_name, m.metric_value, m.timestamp >= o.implemented_date
+            FROM optimizations o
+            JOIN campaign_metrics m
+              ON m.metric_name IN ({', '.join('?' * len(IMPACT_METRICS))})
+             AND (m.optimization_id IS NULL OR m.optimization_id = o.id)
+             AND m.timestamp BETWEEN datetime(o.implemented_date, ?) AND datetime(o.implemented_date, ?)
+            {id_filter}
+            ORDER BY o.id, m.metric_name, m.timestamp, m.id
+        ''', IMPACT_METRICS + [f'-{days_back} days', f'+{days_back} days'] + id_params)
+        
+        samples: Dict[Tuple[str, str], Tuple[List[float], List[float]]] = {}
+        for opt_id, metric, value, after in cursor:
+            samples.setdefault((opt_id, metric), ([], []))[1 if after else 0].append(value)
         
         conn.close()
         
-        return {
-            'optimization_id': optimization_id,
-            'title': title,
-            'expected_impact': expected_impact,
-            'impact_analysis': impact_analysis,
-            'implementation_date': impl_date
+        # A percent change needs data on both sides and a non-zero before mean
+        keys = [key for key, (before, after) in samples.items() if before and after and sum(before)]
+        tau = []
+        for opt_id, metric in keys:
+            before = samples[opt_id, metric][0]
+            tau.append(abs((optimizations[opt_id][1] or 0) / 100 * sum(before) / len(before)))
+        
+        statistics = compare_groups([samples[key][0] for key in keys],
+                                    [samples[key][1] for key in keys], tau=tau)
+        
+        results = {
+            opt_id: {
+                'optimization_id': opt_id,
+                'title': title,
+                'expected_impact': expected_impact,
+                'impact_analysis': {},
+                'implementation_date': datetime.fromisoformat(implemented_date)
+            }
+            for opt_id, (title, expected_impact, implemented_date) in optimizations.items()
         }
+        
+        for (opt_id, metric), stats in zip(keys, statistics):
+            results[opt_id]['impact_analysis'][metric] = {
+                'before': stats.before_mean,
+                'after': stats.after_mean,
+                'impact_percent': stats.impact_percent,
+                'before_samples': stats.before_samples,
+                'after_samples': stats.after_samples,
+                't_statistic': stats.t_statistic,
+                'p_value': stats.p_value,
+                'ci_low': stats.ci_low,
+                'ci_high': stats.ci_high,
+                'sequential_p_value': stats.sequential_p_value,
+                'significant': stats.significant
+            }
+        
+        return results
     
     def generate_performance_report(self, days_back: int = 30):
         """Generate comprehensive performance report"""
@@ -325,6 +367,14 @@ class BMADTracker:
         
         return report
     
+    def apply_retention(self, dry_run: bool = False):
+        """Compact expired campaign metrics into daily rollups"""
+        engine = RetentionEngine(self.db_path, [DEFAULT_POLICIES["campaign_metrics"]])
+        results = engine.run(dry_run=dry_run)
+        
+        logger.info(f"Retention {'dry run' if dry_run else 'run'} completed")
+        return results
+    
     def save_report(self, report_content: str, filename: str = None):
         """Save report to file"""
         if filename is None:
@@ -339,7 +389,7 @@ class BMADTracker:
         logger.info(f"Report saved: reports/{filename}")
         return f"reports/{filename}"
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Initialize BMAD tracking system"""
     import argparse
     
@@ -351,8 +401,12 @@ def main():
                        help='Record metric: NAME VALUE')
     parser.add_argument('--report', action='store_true', help='Generate performance report')
     parser.add_argument('--test-proposal', action='store_true', help='Test proposal tracking')
+    parser.add_argument('--impact', nargs='*', metavar='ID',
+                       help='Significance-tested impact of optimizations (all when no ID is given)')
+    parser.add_argument('--retention', action='store_true', help='Compact and delete expired campaign metrics')
+    parser.add_argument('--dry-run', action='store_true', help='With --retention, only report what would be reclaimed')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     tracker = BMADTracker()
     
@@ -405,6 +459,20 @@ def main():
         print(f"✅ Report generated: {filename}")
         print("\n" + report)
     
+    elif args.impact is not None:
+        impacts = tracker.calculate_optimization_impacts(args.impact or None)
+        for impact in impacts.values():
+            print(f"📈 {impact['title']} (Expected: {impact['expected_impact']:.0f}%)")
+            for metric, stats in impact['impact_analysis'].items():
+                verdict = "significant" if stats['significant'] else "not significant"
+                print(f"   {metric}: {stats['impact_percent']:+.1f}% "
+                      f"[{stats['ci_low']:+.1f}%, {stats['ci_high']:+.1f}%] "
+                      f"p={stats['p_value']:.3f} sequential p={stats['sequential_p_value']:.3f} ({verdict})")
+    
+    elif args.retention:
+        results = tracker.apply_retention(dry_run=args.dry_run)
+        print(format_retention_report(results))
+    
     else:
         parser.print_help()
 
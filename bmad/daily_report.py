@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+BMAD Daily Report
+Per-day, per-source metric rollups maintained incrementally, and the report
+renderer that reads them
+"""
+
+import sqlite3
+import logging
+from functools import lru_cache
+from string import Template
+from typing import Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPORT_TEMPLATE = Template("# Daily Performance Report - $day\n\n$sections")
+SECTION_TEMPLATE = Template("## $source Metrics\n$lines\n")
+LINE_TEMPLATE = Template("- **$label:** $value\n")
+
+# (name keywords, format) checked in order; the first match wins
+VALUE_FORMATS = [
+    (("rate", "bounce"), "{:.1f}%"),
+    (("revenue",), "${:,.0f}"),
+    (("duration",), "{:.1f}s"),
+]
+DEFAULT_FORMAT = "{:,.0f}"
+
+@lru_cache(maxsize=1024)
+def metric_label_and_format(metric_name: str, source: str) -> Tuple[str, str]:
+    """Display label and value format for a metric (computed once per name)"""
+    label = metric_name.replace(f"{source}_", "").replace("_", " ").title()
+    lowered = metric_name.lower()
+    for keywords, fmt in VALUE_FORMATS:
+        if any(k in lowered for k in keywords):
+            return label, fmt
+    return label, DEFAULT_FORMAT
+
+def render_daily_report(day: str, rows: List[Tuple[str, str, float]]) -> str:
+    """Render (source, metric_name, value) rows, ordered by source then metric, as markdown"""
+    sections = []
+    lines = []
+    current_source = None
+
+    for source, metric_name, value in rows:
+        if source != current_source:
+            if lines:
+                sections.append(SECTION_TEMPLATE.substitute(source=current_source.upper(), lines="".join(lines)))
+            current_source, lines = source, []
+
+        label, fmt = metric_label_and_format(metric_name, source)
+        lines.append(LINE_TEMPLATE.substitute(label=label, value=fmt.format(value)))
+
+    if lines:
+        sections.append(SECTION_TEMPLATE.substitute(source=current_source.upper(), lines="".join(lines)))
+
+    return REPORT_TEMPLATE.substitute(day=day, sections="".join(sections))
+
+class DailyRollup:
+    """Folds new metric rows into daily_metric_rollup and tracks which days need a new report
+
+    Rows are kept per day, source, metric, campaign and dimension set so
+    segmented analysis reads the same rollup; rows without a campaign or
+    dimensions use '' and 0. Each refresh reads only rows with an id above
+    the stored watermark. Every day it touches gets its data_version bumped;
+    a day is stale until a report has been rendered at its current version.
+    """
+
+    @staticmethod
+    def init_schema(cursor: sqlite3.Cursor):
+        """Create the rollup and report-state tables
+
+        A rollup from before campaigns and dimension sets were part of its key
+        is dropped and rebuilt from the raw metric rows by the next refresh.
+        """
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(daily_metric_rollup)")}
+        rebuild = bool(columns) and "dimension_set_id" not in columns
+        if rebuild:
+            cursor.execute("DROP TABLE daily_metric_rollup")
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_metric_rollup (
+                day TEXT NOT NULL,
+                source TEXT NOT NULL,
+                metric_name TEXT NOT NULL,
+                campaign_id TEXT NOT NULL,
+                dimension_set_id INTEGER NOT NULL,
+                sample_count INTEGER NOT NULL,
+                value_sum REAL NOT NULL,
+                value_min REAL,
+                value_max REAL,
+                last_value REAL,
+                last_timestamp TEXT,
+                PRIMARY KEY (day, source, metric_name, campaign_id, dimension_set_id)
+            ) WITHOUT ROWID
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_report_state (
+                day TEXT PRIMARY KEY,
+                data_version INTEGER NOT NULL DEFAULT 0,
+                rendered_version INTEGER NOT NULL DEFAULT 0,
+                report_path TEXT,
+                generated_at DATETIME
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS rollup_watermarks (
+                name TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL
+            )
+        ''')
+        if rebuild:
+            cursor.execute("DELETE FROM rollup_watermarks WHERE name = 'daily_metric_rollup'")
+
+    def refresh(self, conn: sqlite3.Connection) -> Set[str]:
+        """Fold metric rows added since the last refresh; returns the days touched
+
+        The watermark read, the upserts and the watermark update share one
+        BEGIN IMMEDIATE transaction, so concurrent refreshes serialize on the
+        write lock instead of folding the same rows twice.
+        """
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            days, folded = self._fold_new_rows(cursor)
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
+        if folded:
+            logger.info(f"Rolled up {folded} metric rows into {len(days)} days")
+        return days
+
+    def _fold_new_rows(self, cursor: sqlite3.Cursor) -> Tuple[Set[str], int]:
+        """Upsert rows above the watermark and advance it; returns (days touched, rows folded)"""
+        row = cursor.execute("SELECT last_id FROM rollup_watermarks WHERE name = 'daily_metric_rollup'").fetchone()
+        last_id = row[0] if row else 0
+
+        new_rows = cursor.execute('''
+            SELECT id, timestamp, source, metric_name, campaign_id, dimension_set_id, metric_value
+            FROM metrics
+            WHERE id > ?
+            ORDER BY id
+        ''', (last_id,)).fetchall()
+
+        if not new_rows:
+            return set(), 0
+
+        groups: Dict[Tuple[str, str, str, str, int], List] = {}
+        for _, timestamp, source, metric_name, campaign_id, dimension_set_id, value in new_rows:
+            key = (str(timestamp)[:10], source or "unknown", metric_name, campaign_id or "", dimension_set_id or 0)
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [1, value, value, value, value, str(timestamp)]
+            else:
+                group[0] += 1
+                group[1] += value
+                group[2] = min(group[2], value)
+                group[3] = max(group[3], value)
+                if str(timestamp) >= group[5]:
+                    group[4], group[5] = value, str(timestamp)
+
+        cursor.executemany('''
+            INSERT INTO daily_metric_rollup
+                (day, source, metric_name, campaign_id, dimension_set_id,
+                 sample_count, value_sum, value_min, value_max, last_value, last_timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (day, source, metric_name, campaign_id, dimension_set_id) DO UPDATE SET
+                sample_count = sample_count + excluded.sample_count,
+                value_sum = value_sum + excluded.value_sum,
+                value_min = MIN(COALESCE(value_min, excluded.value_min), excluded.value_min),
+                value_max = MAX(COALESCE(value_max, excluded.value_max), excluded.value_max),
+                last_value = CASE WHEN excluded.last_timestamp >= COALESCE(last_timestamp, '')
+                                  THEN excluded.last_value ELSE last_value END,
+                last_timestamp = MAX(COALESCE(last_timestamp, ''), excluded.last_timestamp)
+        ''', [key + tuple(values) for key, values in groups.items()])
+
+        days = {key[0] for key in groups}
+        cursor.executemany('''
+            INSERT INTO daily_report_state (day, data_version) VALUES (?, 1)
+            ON CONFLICT (day) DO UPDATE SET data_version = data_version + 1
+        ''', [(day,) for day in days])
+
+        cursor.execute('''
+            INSERT INTO rollup_watermarks (name, last_id) VALUES ('daily_metric_rollup', ?)
+            ON CONFLICT (name) DO UPDATE SET last_id = excluded.last_id
+        ''', (new_rows[-1][0],))
+
+        return days, len(new_rows)
+
+    def stale_days(self, conn: sqlite3.Connection, start_day: str, end_day: str) -> List[Tuple[str, int]]:
+        """(day, data_version) for days in [start_day, end_day] whose data changed since their last report"""
+        return conn.execute('''
+            SELECT day, data_version FROM daily_report_state
+            WHERE day >= ? AND day <= ? AND data_version > rendered_version
+            ORDER BY day
+        ''', (start_day, end_day)).fetchall()
+
+    def day_rows(self, conn: sqlite3.Connection, start_day: str, end_day: str) -> Dict[str, List[Tuple[str, str, float]]]:
+        """Latest value per (source, metric) for each day in the range, across campaigns and dimensions"""
+        rows_by_day: Dict[str, List[Tuple[str, str, float]]] = {}
+        # last_value is a bare column: it comes from the row holding MAX(last_timestamp)
+        for day, source, metric_name, value, _ in conn.execute('''
+            SELECT day, source, metric_name, last_value, MAX(last_timestamp)
+            FROM daily_metric_rollup
+            WHERE day >= ? AND day <= ?
+            GROUP BY day, source, metric_name
+            ORDER BY day, source, metric_name
+        ''', (start_day, end_day)):
+            rows_by_day.setdefault(day, []).append((source, metric_name, value))
+        return rows_by_day
+
+    def mark_rendered(self, conn: sqlite3.Connection, day: str, data_version: int, report_path: str):
+        """Record that the report for a day reflects data_version"""
+        conn.execute('''
+            UPDATE daily_report_state
+            SET rendered_version = ?, report_path = ?, generated_at = CURRENT_TIMESTAMP
+            WHERE day = ?
+        ''', (data_version, report_path, day))
+        conn.commit()
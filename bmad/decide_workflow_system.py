@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+"""
+BMAD Decide Phase Workflow System
+Decision-making framework and automation for campaign optimization
+"""
+
+import json
+import sqlite3
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict
+from enum import Enum
+import logging
+from pathlib import Path
+from string import Template
+from .metric_pivot import MetricPivot
+from .metric_queries import (MetricRequirement, load_aggregated, load_rollup_aggregated,
+                             aggregate_frame, ensure_metric_name_index)
+from .daily_report import DailyRollup
+from .decision_rules import RuleSet, load_rules
+from .lazy_imports import lazy_import
+from .recommendation_ranking import RankedRecommendations, SegmentedRecommendations
+from .segmented_analysis import Segment, analyze_segments, discover_segments, ensure_campaign_index
+
+pd = lazy_import("pandas")
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class DecisionType(Enum):
+    TACTICAL_OPTIMIZATION = "tactical_optimization"
+    STRATEGIC_PIVOT = "strategic_pivot"
+    RESOURCE_ALLOCATION = "resource_allocation"
+    CAMPAIGN_EXPANSION = "campaign_expansion"
+    EMERGENCY_RESPONSE = "emergency_response"
+
+class Priority(Enum):
+    CRITICAL = 1
+    HIGH = 2
+    MEDIUM = 3
+    LOW = 4
+
+class ImplementationStatus(Enum):
+    PENDING_APPROVAL = "pending_approval"
+    APPROVED = "approved"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+@dataclass
+class DecisionRecommendation:
+    """Single decision recommendation from analysis"""
+    id: str
+    title: str
+    description: str
+    decision_type: DecisionType
+    priority: Priority
+    estimated_impact: float  # Expected percentage improvement
+    confidence_level: float  # 0.0 to 1.0
+    implementation_effort: str  # "low", "medium", "high"
+    implementation_timeline: int  # Days to implement
+    required_resources: List[str]
+    success_metrics: List[str]
+    risk_factors: List[str]
+    supporting_data: Dict[str, Any]
+    created_at: datetime
+    created_by: str
+
+@dataclass
+class DecisionRecord:
+    """Record of a decision made and its implementation"""
+    recommendation_id: str
+    decision: str  # "approve", "reject", "modify", "defer"
+    decision_rationale: str
+    approved_budget: float
+    assigned_team: List[str]
+    target_completion: datetime
+    success_criteria: List[str]
+    decision_maker: str
+    decision_date: datetime
+    status: ImplementationStatus
+    actual_impact: Optional[float] = None
+    lessons_learned: Optional[str] = None
+
+class DecisionMatrix:
+    """Impact vs Effort decision matrix for prioritization"""
+    
+    @staticmethod
+    def calculate_priority_score(impact: float, effort: str, confidence: float) -> float:
+        """Calculate priority score based on impact, effort, and confidence"""
+        effort_weights = {"low": 1.0, "medium": 0.7, "high": 0.4}
+        effort_weight = effort_weights.get(effort.lower(), 0.5)
+        
+        # Priority Score = (Impact × Confidence × Effort_Weight) × 100
+        return (impact * confidence * effort_weight) * 100
+    
+    @staticmethod
+    def categorize_decision(impact: float, effort: str) -> str:
+        """Categorize decision based on impact and effort"""
+        effort_numeric = {"low": 1, "medium": 2, "high": 3}
+        effort_score = effort_numeric.get(effort.lower(), 2)
+        
+        if impact >= 20 and effort_score <= 2:
+            return "quick_win"
+        elif impact >= 20 and effort_score == 3:
+            return "major_project"
+        elif impact < 20 and effort_score <= 2:
+            return "fill_in"
+        else:
+            return "thankless_task"
+
+DECISION_REPORT_TEMPLATE = Template(
+    "# BMAD Decision Report - $day\n\n"
+    "## Pending Decisions Requiring Approval\n\n$pending"
+    "## Recent Decisions (Last 7 Days)\n\n$recent"
+)
+PENDING_TEMPLATE = Template(
+    "### $title\n"
+    "**Type:** $decision_type\n"
+    "**Impact:** $impact% improvement\n"
+    "**Effort:** $effort\n"
+    "**Timeline:** $timeline days\n"
+    "**Category:** $category\n"
+    "**Description:** $description\n\n"
+)
+DECISION_TEMPLATE = Template(
+    "### $title\n"
+    "**Decision:** $decision\n"
+    "**Decision Maker:** $decision_maker\n"
+    "**Date:** $date\n"
+    "**Status:** $status\n"
+    "**Rationale:** $rationale\n\n"
+)
+
+class DecisionEngine:
+    """Main decision-making engine for BMAD system"""
+    
+    def __init__(self, db_path: str = "bmad_decisions.db", rules_path: Optional[str] = None):
+        self.db_path = db_path
+        self.rules = RuleSet(**load_rules(rules_path)) if rules_path else RuleSet()
+        self.init_database()
+    
+    def init_database(self):
+        """Initialize database for decision tracking"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        # Recommendations table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS recommendations (
+                id TEXT PRIMARY KEY,
+                title TEXT,
+                description TEXT,
+                decision_type TEXT,
+                priority INTEGER,
+                estimated_impact REAL,
+                confidence_level REAL,
+                implementation_effort TEXT,
+                implementation_timeline INTEGER,
+                required_resources TEXT,
+                success_metrics TEXT,
+                risk_factors TEXT,
+                supporting_data TEXT,
+                created_at DATETIME,
+                created_by TEXT,
+                content_hash TEXT,
+                last_seen_at DATETIME
+            )
+        ''')
+        
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(recommendations)")}
+        if "content_hash" not in columns:
+            cursor.execute("ALTER TABLE recommendations ADD COLUMN content_hash TEXT")
+        if "last_seen_at" not in columns:
+            cursor.execute("ALTER TABLE recommendations ADD COLUMN last_seen_at DATETIME")
+            cursor.execute("UPDATE recommendations SET last_seen_at = created_at")
+        
+        # Decisions table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS decisions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recommendation_id TEXT,
+                decision TEXT,
+                decision_rationale TEXT,
+                approved_budget REAL,
+                assigned_team TEXT,
+                target_completion DATETIME,
+                success_criteria TEXT,
+                decision_maker TEXT,
+                decision_date DATETIME,
+                status TEXT,
+                actual_impact REAL,
+                lessons_learned TEXT,
+                FOREIGN KEY (recommendation_id) REFERENCES recommendations (id)
+            )
+        ''')
+        
+        # Decision criteria weights table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS decision_criteria (
+                criteria_name TEXT PRIMARY KEY,
+                weight REAL,
+                description TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Latest decision per recommendation, maintained by make_decision
+        has_status_table = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'recommendation_status'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS recommendation_status (
+                recommendation_id TEXT PRIMARY KEY,
+                decision_id INTEGER,
+                decision TEXT,
+                status TEXT,
+                decision_date DATETIME
+            )
+        ''')
+        if not has_status_table:
+            # Seed from existing decision history (bare columns come from the MAX(id) row)
+            cursor.execute('''
+                INSERT INTO recommendation_status
+                (recommendation_id, decision_id, decision, status, decision_date)
+                SELECT recommendation_id, MAX(id), decision, status, decision_date
+                FROM decisions
+                GROUP BY recommendation_id
+            ''')
+        
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recommendation_status_decision ON recommendation_status (decision, status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recommendations_impact ON recommendations (estimated_impact)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_recommendations_last_seen ON recommendations (last_seen_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decisions_recommendation ON decisions (recommendation_id, id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decisions_date ON decisions (decision_date)")
+        
+        conn.commit()
+        conn.close()
+        logger.info("Decision database initialized")
+    
+    def analyze_performance_data(self, metrics_db_path: str, columnar_dir: Optional[str] = None) -> RankedRecommendations:
+        """Analyze performance data and generate recommendations"""
+        logger.info("Analyzing performance data for decision recommendations")
+        
+        # Only the metric prefixes the rules reference are loaded
+        requirements = self.rules.metric_requirements
+        
+        if columnar_dir:
+            # Read only the needed columns from the Parquet export instead of re-querying SQLite
+            df = aggregate_frame(self._load_columnar_metrics(columnar_dir), requirements)
+        else:
+            df = self._load_incremental_metrics(metrics_db_path, requirements)
+        
+        if df.empty:
+            logger.warning("No recent metrics data found")
+            return RankedRecommendations()
+        
+        # Pivot once (metric x day) and evaluate every rule against it in one pass
+        pivot = MetricPivot(df)
+        
+        # Funnel, traffic quality, email and sales pipeline rules
+        created_at = datetime.now()
+        recommendations = (self._build_recommendation(fields, created_at) for fields in self.rules.evaluate(pivot))
+        
+        # Prioritize recommendations
+        return self._prioritize_recommendations(recommendations)
+    
+    def analyze_segmented_performance_data(self, metrics_db_path: str, segment_key: Optional[str] = None,
+                                           max_workers: Optional[int] = None) -> SegmentedRecommendations:
+        """Analyze each campaign (or campaign x segment_key value) separately on a process pool"""
+        conn = sqlite3.connect(metrics_db_path)
+        try:
+            ensure_campaign_index(conn)
+            segments = discover_segments(conn, segment_key)
+            
+            # Fold new rows once here; every worker then reads its segment from the rollup
+            try:
+                DailyRollup.init_schema(conn.cursor())
+                conn.commit()
+                DailyRollup().refresh(conn)
+                use_rollup = True
+            except sqlite3.OperationalError as e:  # Read-only database: workers aggregate raw rows
+                logger.warning(f"Daily rollup unavailable, scanning raw metrics per segment: {e}")
+                use_rollup = False
+        finally:
+            conn.close()
+        
+        logger.info(f"Analyzing {len(segments)} segments for decision recommendations")
+        results = analyze_segments(metrics_db_path, self.rules, segments, max_workers=max_workers,
+                                   use_rollup=use_rollup)
+        
+        # Each partition is prioritized on its own, then merged into one ranked view
+        created_at = datetime.now()
+        merged = SegmentedRecommendations()
+        for segment, fired in results.items():
+            recommendations = (self._build_segment_recommendation(fields, segment, created_at) for fields in fired)
+            merged.add_segment(segment.label, self._prioritize_recommendations(recommendations))
+        
+        return merged
+    
+    def _load_incremental_metrics(self, metrics_db_path: str, requirements: List[MetricRequirement]) -> 'pd.DataFrame':
+        """Fold only rows ingested since the last run into the daily rollup, then read the window from it"""
+        conn = sqlite3.connect(metrics_db_path)
+        
+        try:
+            cursor = conn.cursor()
+            DailyRollup.init_schema(cursor)
+            conn.commit()
+            DailyRollup().refresh(conn)  # Persists the last processed metrics id and running per-day aggregates
+            df = load_rollup_aggregated(conn, requirements)
+        except sqlite3.OperationalError as e:  # Read-only database: aggregate the raw window instead
+            logger.warning(f"Daily rollup unavailable, scanning raw metrics: {e}")
+            ensure_metric_name_index(conn)
+            df = load_aggregated(conn, requirements)
+        finally:
+            conn.close()
+        
+        return df
+    
+    def _load_columnar_metrics(self, columnar_dir: str, days_back: int = 30) -> 'pd.DataFrame':
+        """Load the analysis window from the columnar export"""
+        # pyarrow is an analysis-only dependency; report paths never load it
+        from .metric_export import load_columnar
+        
+        start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        
+        try:
+            df = load_columnar(
+                columnar_dir, "metrics",
+                columns=['metric_name', 'metric_value', 'timestamp', 'source'],
+                start_date=start_date
+            )
+        except FileNotFoundError:
+            logger.warning(f"No columnar metrics export in {columnar_dir}")
+            return pd.DataFrame(columns=['metric_name', 'metric_value', 'timestamp', 'source'])
+        
+        return df
+    
+    def _build_recommendation(self, fields: Dict[str, Any], created_at: datetime) -> DecisionRecommendation:
+        """Recommendation from the fields rendered by a fired rule"""
+        return DecisionRecommendation(
+            **{**fields,
+               "decision_type": DecisionType(fields["decision_type"]),
+               "priority": Priority[fields["priority"].upper()]},
+            created_at=created_at,
+            created_by="DecisionEngine"
+        )
+    
+    def _build_segment_recommendation(self, fields: Dict[str, Any], segment: Segment,
+                                      created_at: datetime) -> DecisionRecommendation:
+        """Recommendation scoped to a segment; the id and title carry the segment label"""
+        rec = self._build_recommendation(fields, created_at)
+        rec.id = f"{rec.id}@{segment.label}"
+        rec.title = f"{rec.title} [{segment.label}]"
+        rec.supporting_data = {**rec.supporting_data, "segment": segment.label}
+        return rec
+    
+    def _prioritize_recommendations(self, recommendations: Iterable[DecisionRecommendation]) -> RankedRecommendations:
+        """Prioritize recommendations using decision matrix"""
+        ranked = RankedRecommendations()
+        
+        for rec in recommendations:
+            rec.priority_score = DecisionMatrix.calculate_priority_score(
+                rec.estimated_impact,
+                rec.implementation_effort,
+                rec.confidence_level
+            )
+            rec.category = DecisionMatrix.categorize_decision(
+                rec.estimated_impact,
+                rec.implementation_effort
+            )
+            
+            # Streamed into per-category top-K heaps; report writers read ranked slices
+            ranked.append(rec)
+        
+        return ranked
+    
+    @staticmethod
+    def _recommendation_row(rec: DecisionRecommendation) -> Tuple:
+        """Serialized recommendations row; content_hash covers everything but the timestamps"""
+        content = (
+            rec.id, rec.title, rec.description, rec.decision_type.value, rec.priority.value,
+            rec.estimated_impact, rec.confidence_level, rec.implementation_effort,
+            rec.implementation_timeline, json.dumps(rec.required_resources),
+            json.dumps(rec.success_metrics), json.dumps(rec.risk_factors),
+            json.dumps(rec.supporting_data, sort_keys=True), rec.created_by
+        )
+        content_hash = hashlib.sha1(json.dumps(content).encode()).hexdigest()
+        return content + (rec.created_at, content_hash, rec.created_at)
+    
+    def save_recommendations(self, recommendations: List[DecisionRecommendation]):
+        """Save recommendations to database, rewriting only rows whose content changed
+        
+        Every saved recommendation has last_seen_at set to its created_at, so a
+        recommendation produced again by a later run stays current even though
+        its row (and original created_at) is otherwise left untouched.
+        """
+        rows = [self._recommendation_row(rec) for rec in recommendations]
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        changes_before = conn.total_changes
+        
+        # Unchanged recommendations keep their content (and original created_at) untouched
+        cursor.executemany('''
+            INSERT INTO recommendations
+            (id, title, description, decision_type, priority, estimated_impact, 
+             confidence_level, implementation_effort, implementation_timeline,
+             required_resources, success_metrics, risk_factors, supporting_data,
+             created_by, created_at, content_hash, last_seen_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                title = excluded.title,
+                description = excluded.description,
+                decision_type = excluded.decision_type,
+                priority = excluded.priority,
+                estimated_impact = excluded.estimated_impact,
+                confidence_level = excluded.confidence_level,
+                implementation_effort = excluded.implementation_effort,
+                implementation_timeline = excluded.implementation_timeline,
+                required_resources = excluded.required_resources,
+                success_metrics = excluded.success_metrics,
+                risk_factors = excluded.risk_factors,
+                supporting_data = excluded.supporting_data,
+                created_by = excluded.created_by,
+                created_at = excluded.created_at,
+                content_hash = excluded.content_hash,
+                last_seen_at = excluded.last_seen_at
+            WHERE recommendations.content_hash IS NOT excluded.content_hash
+        ''', rows)
+        
+        written = conn.total_changes - changes_before
+        cursor.executemany(
+            "UPDATE recommendations SET last_seen_at = ? WHERE id = ? AND last_seen_at IS NOT ?",
+            [(rec.created_at, rec.id, rec.created_at) for rec in recommendations]
+        )
+        conn.commit()
+        conn.close()
+        logger.info(f"Saved {len(recommendations)} recommendations to database ({written} new or changed)")
+        return written
+    
+    def make_decision(self, recommendation_id: str, decision: str, rationale: str,
+                     decision_maker: str, approved_budget: float = 0,
+                     assigned_team: List[str] = None, 
+                     target_completion: datetime = None) -> DecisionRecord:
+        """Record a decision on a recommendation"""
+        
+        if assigned_team is None:
+            assigned_team = []
+        
+        if target_completion is None:
+            target_completion = datetime.now() + timedelta(days=30)
+        
+        # Get recommendation details
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT * FROM recommendations WHERE id = ?', (recommendation_id,))
+        rec_data = cursor.fetchone()
+        
+        if not rec_data:
+            raise ValueError(f"Recommendation {recommendation_id} not found")
+        
+        # Determine initial status
+        if decision == "approve":
+            status = ImplementationStatus.APPROVED
+        elif decision == "reject":
+            status = ImplementationStatus.CANCELLED
+        else:
+            status = ImplementationStatus.PENDING_APPROVAL
+        
+        # Create decision record
+        decision_record = DecisionRecord(
+            recommendation_id=recommendation_id,
+            decision=decision,
+            decision_rationale=rationale,
+            approved_budget=approved_budget,
+            assigned_team=assigned_team,
+            target_completion=target_completion,
+            success_criteria=json.loads(rec_data[11]),  # success_metrics from recommendation
+            decision_maker=decision_maker,
+            decision_date=datetime.now(),
+            status=status
+        )
+        
+        # Save to database
+        cursor.execute('''
+            INSERT INTO decisions
+            (recommendation_id, decision, decision_rationale, approved_budget,
+             assigned_team, target_completion, success_criteria, decision_maker,
+             decision_date, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            decision_record.recommendation_id, decision_record.decision,
+            decision_record.decision_rationale, decision_record.approved_budget,
+            json.dumps(decision_record.assigned_team), decision_record.target_completion,
+            json.dumps(decision_record.success_criteria), decision_record.decision_maker,
+            decision_record.decision_date, decision_record.status.value
+        ))
+        
+        # Keep the latest-decision view in the same transaction
+        cursor.execute('''
+            INSERT INTO recommendation_status
+            (recommendation_id, decision_id, decision, status, decision_date)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (recommendation_id) DO UPDATE SET
+                decision_id = excluded.decision_id,
+                decision = excluded.decision,
+                status = excluded.status,
+                decision_date = excluded.decision_date
+        ''', (
+            decision_record.recommendation_id, cursor.lastrowid, decision_record.decision,
+            decision_record.status.value, decision_record.decision_date
+        ))
+        
+        conn.commit()
+        conn.close()
+        
+        logger.info(f"Decision recorded: {decision} for recommendation {recommendation_id}")
+        return decision_record
+    
+    def generate_decision_report(self) -> str:
+        """Generate decision summary report"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        # Pending recommendations (no decision yet, or latest decision still pending);
+        # walks idx_recommendations_impact and probes recommendation_status by key
+        cursor.execute('''
+            SELECT r.title, r.decision_type, r.estimated_impact, r.implementation_effort,
+                   r.implementation_timeline, r.description
+            FROM recommendations r
+            LEFT JOIN recommendation_status s ON s.recommendation_id = r.id
+            WHERE s.decision IS NULL OR s.decision = 'pending'
+            ORDER BY r.estimated_impact DESC
+            LIMIT 5
+        ''')
+        
+        pending = "".join(
+            PENDING_TEMPLATE.substitute(
+                title=title,
+                decision_type=decision_type.replace('_', ' ').title(),
+                impact=f"{impact:.1f}",
+                effort=effort.title(),
+                timeline=timeline,
+                category=DecisionMatrix.categorize_decision(impact, effort).replace('_', ' ').title(),
+                description=description
+            )
+            for title, decision_type, impact, effort, timeline, description in cursor
+        )
+        
+        # Recent decisions
+        cursor.execute('''
+            SELECT r.title, d.decision, d.decision_rationale, d.decision_maker, 
+                   d.decision_date, d.status
+            FROM decisions d
+            JOIN recommendations r ON d.recommendation_id = r.id
+            WHERE d.decision_date >= date('now', '-7 days')
+            ORDER BY d.decision_date DESC
+        ''')
+        
+        recent = "".join(
+            DECISION_TEMPLATE.substitute(
+                title=title,
+                decision=decision.title(),
+                decision_maker=decision_maker,
+                date=decision_date[:10],
+                status=status.replace('_', ' ').title(),
+                rationale=rationale
+            )
+            for title, decision, rationale, decision_maker, decision_date, status in cursor
+        )
+        conn.close()
+        
+        return DECISION_REPORT_TEMPLATE.substitute(
+            day=datetime.now().strftime('%Y-%m-%d'),
+            pending=pending or "No pending decisions.\n\n",
+            recent=recent or "No recent decisions.\n\n"
+        )
+
+def main(argv: Optional[List[str]] = None):
+    """Main function for decision workflow system"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='BMAD Decision Workflow System')
+    parser.add_argument('--analyze', type=str, help='Path to metrics database for analysis')
+    parser.add_argument('--columnar', type=str, help='Analyze from a columnar export directory (see metric_export.py)')
+    parser.add_argument('--rules', type=str, help='JSON rule file replacing the default recommendation rules')
+    parser.add_argument('--segments', action='store_true', help='With --analyze, analyze each campaign separately')
+    parser.add_argument('--segment-key', type=str, help='With --segments, also split campaigns by this dimension key')
+    parser.add_argument('--workers', type=int, help='With --segments, worker processes (default: CPU count)')
+    parser.add_argument('--report', action='store_true', help='Generate decision report')
+    parser.add_argument('--approve', type=str, help='Approve recommendation by ID')
+    parser.add_argument('--rationale', type=str, help='Decision rationale')
+    parser.add_argument('--decision-maker', type=str, default='System', help='Decision maker name')
+    
+    args = parser.parse_args(argv)
+    
+    engine = DecisionEngine(rules_path=args.rules)
+    
+    if args.analyze:
+        if args.segments or args.segment_key:
+            recommendations = engine.analyze_segmented_performance_data(
+                args.analyze, segment_key=args.segment_key, max_workers=args.workers
+            )
+        else:
+            recommendations = engine.analyze_performance_data(args.analyze, columnar_dir=args.columnar)
+        engine.save_recommendations(recommendations)
+        print(f"Generated {len(recommendations)} recommendations")
+        
+        for label, segment_recommendations in getattr(recommendations, 'segments', {}).items():
+            print(f"  {label}: {len(segment_recommendations)} recommendations")
+        
+        for rec in recommendations.top(5):  # Show top 5
+            print(f"\n{rec.title}")
+            print(f"Impact: {rec.estimated_impact:.1f}% | Effort: {rec.implementation_effort}")
+            print(f"Priority Score: {rec.priority_score:.1f}")
+    
+    elif args.report:
+        report = engine.generate_decision_report()
+        print(report)
+        
+        # Save report to file
+        report_path = f"reports/decision_report_{datetime.now().strftime('%Y%m%d')}.md"
+        Path("reports").mkdir(exist_ok=True)
+        with open(report_path, 'w') as f:
+            f.write(report)
+        print(f"\nReport saved to: {report_path}")
+    
+    elif args.approve and args.rationale:
+        decision = engine.make_decision(
+            recommendation_id=args.approve,
+            decision="approve",
+            rationale=args.rationale,
+            decision_maker=args.decision_maker
+        )
+        print(f"Decision recorded: {decision.decision} for {args.approve}")
+    
+    else:
+        parser.print_help()
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
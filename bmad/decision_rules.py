@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+BMAD Decision Rules
+Declarative recommendation rules compiled into a single vectorized evaluator
+"""
+
+import re
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from .lazy_imports import lazy_import
+from .metric_pivot import MetricPivot
+from .metric_queries import MetricRequirement
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Rule expressions: "<metric>", "<metric> / <metric>" or "<scale> * <metric> / <metric>"
+EXPRESSION = re.compile(
+    r'^\s*(?:(?P<scale>\d+(?:\.\d+)?)\s*\*\s*)?(?P<numerator>\w+)\s*(?:/\s*(?P<denominator>\w+)\s*)?$'
+)
+
+COMPARISONS = ('<', '<=', '>', '>=')
+
+# Recommendation fields rendered with str.format; lists are rendered item by item
+TEXT_FIELDS = ('id', 'title', 'description')
+LIST_FIELDS = ('required_resources', 'success_metrics', 'risk_factors')
+VALUE_FIELDS = ('decision_type', 'priority', 'estimated_impact', 'confidence_level',
+                'implementation_effort', 'implementation_timeline')
+
+TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "funnel_stage": {
+        "id": "funnel_optimization_{denominator_name}_to_{numerator_name}",
+        "title": "Optimize {stage} Conversion",
+        "description": "Current conversion rate ({value:.1f}%) is significantly below benchmark ({benchmark:.1f}%). Implement A/B tests and user experience improvements.",
+        "decision_type": "tactical_optimization",
+        "priority": "high",
+        "estimated_impact": 15.0,  # 15% improvement in overall conversion
+        "confidence_level": 0.8,
+        "implementation_effort": "medium",
+        "implementation_timeline": 14,
+        "required_resources": ["UX Designer", "Developer", "Marketing Manager"],
+        "success_metrics": ["Increase {stage} conversion to {benchmark:.1f}%"],
+        "risk_factors": ["May initially decrease conversion during testing"],
+        "supporting_data": {
+            "current_rate": "value",
+            "benchmark": "benchmark",
+            "improvement_needed": "gap",
+            "rate_change": "change"
+        }
+    },
+    "bounce_rate": {
+        "id": "reduce_bounce_rate",
+        "title": "Reduce High Bounce Rate",
+        "description": "Bounce rate ({value:.1f}%) indicates visitors aren't finding what they expect. Improve landing page relevance and page load speed.",
+        "decision_type": "tactical_optimization",
+        "priority": "high",
+        "estimated_impact": 12.0,
+        "confidence_level": 0.85,
+        "implementation_effort": "medium",
+        "implementation_timeline": 10,
+        "required_resources": ["Content Writer", "UX Designer", "Developer"],
+        "success_metrics": ["Reduce bounce rate below 50%"],
+        "risk_factors": ["Changes may initially impact SEO rankings"],
+        "supporting_data": {"current_bounce_rate": "value"}
+    },
+    "email_open_rate": {
+        "id": "improve_email_open_rates",
+        "title": "Improve Email Open Rates",
+        "description": "Open rate ({value:.1f}%) is below industry average. Test subject lines, sender names, and send times.",
+        "decision_type": "tactical_optimization",
+        "priority": "medium",
+        "estimated_impact": 8.0,
+        "confidence_level": 0.75,
+        "implementation_effort": "low",
+        "implementation_timeline": 7,
+        "required_resources": ["Email Marketing Specialist"],
+        "success_metrics": ["Increase open rate above 35%"],
+        "risk_factors": ["Subject line changes may temporarily confuse subscribers"],
+        "supporting_data": {"current_open_rate": "value"}
+    },
+    "lead_qualification": {
+        "id": "improve_lead_qualification",
+        "title": "Improve Lead Qualification Process",
+        "description": "Lead qualification rate ({value:.1f}%) suggests targeting issues. Refine ideal customer profile and qualification criteria.",
+        "decision_type": "strategic_pivot",
+        "priority": "high",
+        "estimated_impact": 20.0,
+        "confidence_level": 0.7,
+        "implementation_effort": "medium",
+        "implementation_timeline": 21,
+        "required_resources": ["Sales Manager", "Marketing Manager", "Data Analyst"],
+        "success_metrics": ["Increase qualification rate above 70%"],
+        "risk_factors": ["May temporarily reduce lead volume"],
+        "supporting_data": {
+            "total_leads": "denominator",
+            "qualified_leads": "numerator",
+            "qualification_rate": "value"
+        }
+    }
+}
+
+# Funnel rules fire more than 20% below benchmark (tolerance 0.8)
+RULES: List[Dict[str, Any]] = [
+    {"expression": "100 * funnel_calculator_starts / funnel_landing_page_views", "comparison": "<",
+     "benchmark": 25.0, "tolerance": 0.8, "template": "funnel_stage",
+     "context": {"stage": "landing_page_views_to_calculator_starts"}},
+    {"expression": "100 * funnel_calculator_completions / funnel_calculator_starts", "comparison": "<",
+     "benchmark": 60.0, "tolerance": 0.8, "template": "funnel_stage",
+     "context": {"stage": "calculator_starts_to_calculator_completions"}},
+    {"expression": "100 * funnel_form_submissions / funnel_calculator_completions", "comparison": "<",
+     "benchmark": 25.0, "tolerance": 0.8, "template": "funnel_stage",
+     "context": {"stage": "calculator_completions_to_form_submissions"}},
+    {"expression": "100 * funnel_proposal_requests / funnel_form_submissions", "comparison": "<",
+     "benchmark": 95.0, "tolerance": 0.8, "template": "funnel_stage",
+     "context": {"stage": "form_submissions_to_proposal_requests"}},
+    {"expression": "ga4_bounce_rate", "comparison": ">", "benchmark": 60.0, "template": "bounce_rate"},
+    {"expression": "email_open_rate", "comparison": "<", "benchmark": 30.0, "template": "email_open_rate"},
+    {"expression": "100 * crm_leads_qualified / crm_leads_created", "comparison": "<",
+     "benchmark": 60.0, "template": "lead_qualification"},
+]
+
+def load_rules(path: str) -> Dict[str, Any]:
+    """Read a rule file: {"templates": {...}, "rules": [...]} (templates extend the defaults)"""
+    with open(path, 'r') as f:
+        spec = json.load(f)
+
+    return {
+        "templates": {**TEMPLATES, **spec.get("templates", {})},
+        "rules": spec.get("rules", [])
+    }
+
+def metric_prefixes(metric_names: List[str]) -> List[str]:
+    """Source prefixes ("ga4_") covering the names, in first-seen order
+
+    A name without a source prefix ("sessions") is its own prefix; prefixes
+    already covered by a shorter one are dropped so no row is loaded twice.
+    """
+    candidates = dict.fromkeys(
+        name.split('_', 1)[0] + '_' if '_' in name else name
+        for name in metric_names
+    )
+    return [
+        prefix for prefix in candidates
+        if not any(other != prefix and prefix.startswith(other) for other in candidates)
+    ]
+
+class RuleSet:
+    """Rules compiled once into index and threshold arrays
+
+    Every metric a rule references gets one column; evaluating the set
+    against a pivot is one gather of the latest and previous values plus a
+    handful of array operations, regardless of the number of rules. Rules
+    are validated on construction; the arrays are built on first use.
+    """
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None,
+                 templates: Optional[Dict[str, Dict[str, Any]]] = None):
+        rules = RULES if rules is None else rules
+        templates = TEMPLATES if templates is None else templates
+
+        self.metrics: List[str] = []
+        column: Dict[str, int] = {}
+
+        def metric_index(name: Optional[str]) -> int:
+            if name is None:
+                return -1
+            if name not in column:
+                column[name] = len(self.metrics)
+                self.metrics.append(name)
+            return column[name]
+
+        scale, numerator, denominator, comparison, benchmark, tolerance = [], [], [], [], [], []
+        self.templates: List[Dict[str, Any]] = []
+        self.contexts: List[Dict[str, Any]] = []
+
+        for rule in rules:
+            match = EXPRESSION.match(rule["expression"])
+            if not match:
+                raise ValueError(f"Invalid rule expression {rule['expression']!r}")
+            if rule["comparison"] not in COMPARISONS:
+                raise ValueError(f"Unknown comparison {rule['comparison']!r}")
+
+            template = rule["template"]
+            if isinstance(template, str):
+                if template not in templates:
+                    raise ValueError(f"Unknown recommendation template {template!r}")
+                template = templates[template]
+
+            scale.append(float(match.group('scale') or 1.0))
+            numerator.append(metric_index(match.group('numerator')))
+            denominator.append(metric_index(match.group('denominator')))
+            comparison.append(COMPARISONS.index(rule["comparison"]))
+            benchmark.append(float(rule["benchmark"]))
+            tolerance.append(float(rule.get("tolerance", 1.0)))
+            self.templates.append(template)
+            self.contexts.append({
+                "numerator_name": match.group('numerator'),
+                "denominator_name": match.group('denominator'),
+                **rule.get("context", {})
+            })
+
+        # Turned into arrays on the first evaluate(), so constructing a rule set
+        # (every DecisionEngine does) does not load numpy
+        self._columns = (scale, numerator, denominator, comparison, benchmark, tolerance)
+        self._compiled = False
+
+        # Loaded by metric source prefix so hundreds of rules stay a few range scans
+        self.metric_requirements = [MetricRequirement(prefix) for prefix in metric_prefixes(self.metrics)]
+
+        logger.debug(f"Compiled {len(self)} rules over {len(self.metrics)} metrics")
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def _compile(self):
+        """Build the index and threshold arrays (once, before the first evaluation)"""
+        if self._compiled:
+            return
+
+        scale, numerator, denominator, comparison, benchmark, tolerance = self._columns
+        self.scale = np.array(scale)
+        self.numerator = np.array(numerator, dtype=np.int64)
+        self.denominator = np.array(denominator, dtype=np.int64)
+        self.comparison = np.array(comparison, dtype=np.int64)
+        self.benchmark = np.array(benchmark)
+        self.threshold = self.benchmark * np.array(tolerance)
+        self._compiled = True  # Set last: a concurrent first call at worst compiles twice
+
+    def _expression_values(self, metric_values: 'np.ndarray'):
+        """Expression value per rule (NaN where a metric is missing or a denominator is not positive)"""
+        padded = np.append(metric_values, 1.0)  # Index -1 (no denominator) divides by one
+        numerator = padded[self.numerator]
+        denominator = padded[self.denominator]
+
+        values = np.full(len(self), np.nan)
+        np.divide(numerator * self.scale, denominator, out=values, where=denominator > 0)
+        return values, numerator, denominator
+
+    def evaluate(self, pivot: MetricPivot) -> List[Dict[str, Any]]:
+        """Render the recommendation fields of every rule that fires, in rule order"""
+        if not len(self):
+            return []
+        self._compile()
+
+        values, numerators, denominators = self._expression_values(pivot.latest_values(self.metrics))
+        previous, _, _ = self._expression_values(pivot.previous_values(self.metrics))
+        changes = values - previous
+
+        # One row per comparison operator; NaN compares False so missing data never fires
+        with np.errstate(invalid='ignore'):
+            outcomes = np.stack([
+                values < self.threshold,
+                values <= self.threshold,
+                values > self.threshold,
+                values >= self.threshold
+            ])
+        fired = np.flatnonzero(outcomes[self.comparison, np.arange(len(self))])
+
+        return [
+            self._render(i, {
+                "value": float(values[i]),
+                "benchmark": float(self.benchmark[i]),
+                "threshold": float(self.threshold[i]),
+                "gap": float(self.benchmark[i] - values[i]),
+                "change": None if np.isnan(changes[i]) else float(changes[i]),
+                "numerator": float(numerators[i]),
+                "denominator": float(denominators[i])
+            })
+            for i in fired
+        ]
+
+    def _render(self, i: int, values: Dict[str, Any]) -> Dict[str, Any]:
+        template = self.templates[i]
+        fields = {**self.contexts[i], **values}
+
+        rendered = {name: template[name].format(**fields) for name in TEXT_FIELDS}
+        rendered.update({name: [item.format(**fields) for item in template[name]] for name in LIST_FIELDS})
+        rendered.update({name: template[name] for name in VALUE_FIELDS})
+        rendered["supporting_data"] = {
+            key: fields[source] for key, source in template.get("supporting_data", {}).items()
+        }
+        return rendered
+
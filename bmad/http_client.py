@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+BMAD HTTP Client
+Shared pooled HTTP session with keep-alive, jittered retries and conditional GET caching
+"""
+
+import time
+import random
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from .lazy_imports import lazy_import
+
+requests = lazy_import("requests")
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+@dataclass
+class CachedResponse:
+    """A GET response kept for revalidation"""
+    response: 'requests.Response'
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float  # Epoch seconds until which no revalidation is needed
+
+def cache_max_age(response: 'requests.Response') -> Optional[int]:
+    """max-age from Cache-Control, or None when the response must not be cached"""
+    directives = [d.strip().lower() for d in response.headers.get("Cache-Control", "").split(",")]
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    for directive in directives:
+        if directive.startswith("max-age="):
+            try:
+                return max(0, int(directive.split("=", 1)[1]))
+            except ValueError:
+                return 0
+    return 0
+
+def parent_url(url: str) -> Optional[str]:
+    """URL of the collection a resource URL sits in, or None at the root"""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    if not path:
+        return None
+    return urlunsplit((parts.scheme, parts.netloc, path.rsplit("/", 1)[0], "", ""))
+
+class PooledHTTPClient:
+    """requests.Session wrapper shared by connectors and API helpers
+
+    Connections are pooled per host and kept alive between calls. Idempotent
+    requests are retried on connection errors and retryable statuses with
+    exponential backoff and full jitter (honouring Retry-After). GET responses
+    carrying an ETag or Last-Modified are cached and revalidated with
+    If-None-Match / If-Modified-Since; a 304 returns the cached response.
+    PUT, POST and DELETE drop cached GETs for the URL, everything beneath it
+    and its parent collection, so a listing read after a write is fresh.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0,
+                 timeout: float = 30.0, cache_size: int = 256):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.cache_size = cache_size
+
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._cache: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "cache_hits": 0, "not_modified": 0}
+
+    def _count(self, stat: str):
+        """Bump a stats counter under the cache lock (the client is shared across threads)"""
+        with self._lock:
+            self.stats[stat] += 1
+
+    def backoff(self, attempt: int, response: 'Optional[requests.Response]' = None) -> float:
+        """Delay before the next attempt: Retry-After when given, else full-jitter exponential"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(self.max_backoff, float(retry_after))
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    def request(self, method: str, url: str, **kwargs) -> 'requests.Response':
+        """Send a request over the pooled session, retrying idempotent calls"""
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.max_retries if method in IDEMPOTENT_METHODS else 0
+
+        for attempt in range(retries + 1):
+            self._count("requests")
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == retries:
+                    raise
+                delay = self.backoff(attempt)
+                logger.warning(f"{method} {url} failed ({e}); retrying in {delay:.2f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == retries:
+                    return response
+                delay = self.backoff(attempt, response)
+                logger.warning(f"{method} {url} returned {response.status_code}; retrying in {delay:.2f}s")
+
+            self._count("retries")
+            time.sleep(delay)
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Tuple:
+        """Cache entries are scoped to the URL, query and request headers (so per credential)"""
+        return (
+            url,
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+            tuple(sorted((headers or {}).items()))
+        )
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, conditional: bool = True, **kwargs) -> 'requests.Response':
+        """GET with conditional revalidation against the response cache"""
+        if not conditional:
+            return self.request("GET", url, params=params, headers=headers, **kwargs)
+
+        key = self.cache_key(url, params, headers)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if time.time() < cached.expires_at:
+                self._count("cache_hits")
+                return cached.response
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.request("GET", url, params=params, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            max_age = cache_max_age(response)
+            with self._lock:
+                self.stats["not_modified"] += 1
+                cached.expires_at = time.time() + (max_age or 0)
+            return cached.response
+
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+
+    def _store(self, key: Tuple, response: 'requests.Response'):
+        """Cache a response that can be revalidated or is fresh for a while"""
+        max_age = cache_max_age(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if max_age is None or not (etag or last_modified or max_age):
+            return
+
+        response.content  # Read the body so the connection returns to the pool
+        with self._lock:
+            self._cache[key] = CachedResponse(response, etag, last_modified, time.time() + max_age)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, url: str, prefix: bool = False):
+        """Drop cached GETs for a URL (and, with prefix, every URL beneath it)"""
+        url = url.rstrip("/")
+        below = url + "/"
+        with self._lock:
+            for key in [k for k in self._cache
+                        if k[0].rstrip("/") == url or (prefix and k[0].startswith(below))]:
+                del self._cache[key]
+
+    def invalidate_write(self, url: str):
+        """Drop cached GETs a write to url can make stale: the URL, its children and its parent"""
+        self.invalidate(url, prefix=True)
+        parent = parent_url(url)
+        if parent is not None:
+            self.invalidate(parent)
+
+    def put(self, url: str, **kwargs) -> 'requests.Response':
+        response = self.request("PUT", url, **kwargs)
+        self.invalidate_write(url)
+        return response
+
+    def post(self, url: str, **kwargs) -> 'requests.Response':
+        response = self.request("POST", url, **kwargs)
+        self.invalidate_write(url)
+        return response
+
+    def delete(self, url: str, **kwargs) -> 'requests.Response':
+        response = self.request("DELETE", url, **kwargs)
+        self.invalidate_write(url)
+        return response
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def close(self):
+        self.session.close()
+
+_shared_client: Optional[PooledHTTPClient] = None
+_shared_lock = threading.Lock()
+
+def get_shared_client() -> PooledHTTPClient:
+    """Process-wide client so repeated syncs reuse open connections"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = PooledHTTPClient()
+        return _shared_client
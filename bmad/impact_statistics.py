@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+BMAD Impact Statistics
+Vectorized significance tests for before/after optimization comparisons
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from .lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+# Bootstrap resamples are drawn in chunks of at most this many values
+BOOTSTRAP_CHUNK_VALUES = 4_000_000
+
+@dataclass
+class ImpactStatistics:
+    """Before/after comparison of one metric
+
+    p_value is Welch's two-sided t-test for the fixed window. ci_low/ci_high
+    bound impact_percent with a percentile bootstrap. sequential_p_value is
+    an always-valid mSPRT p-value over the after samples in arrival order,
+    so it stays valid however often the window is re-checked; significant
+    is based on it.
+    """
+    before_mean: float
+    after_mean: float
+    before_samples: int
+    after_samples: int
+    impact_percent: float
+    t_statistic: float
+    degrees_of_freedom: float
+    p_value: float
+    ci_low: float
+    ci_high: float
+    sequential_p_value: float
+    significant: bool
+
+def pad(groups: Sequence[Sequence[float]]) -> 'Tuple[np.ndarray, np.ndarray]':
+    """Ragged groups -> (k x n_max values padded with zeros, k sample counts)"""
+    counts = np.array([len(group) for group in groups], dtype=np.int64)
+    values = np.zeros((len(groups), max(counts.max(initial=0), 1)))
+    for i, group in enumerate(groups):
+        values[i, :counts[i]] = group
+    return values, counts
+
+def _moments(values: 'np.ndarray', counts: 'np.ndarray') -> 'Tuple[np.ndarray, np.ndarray]':
+    """Per-row mean and sample variance of padded rows (nan where undefined)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mask = np.arange(values.shape[1]) < counts[:, None]
+        means = values.sum(axis=1) / counts
+        squares = np.where(mask, (values - means[:, None]) ** 2, 0.0).sum(axis=1)
+        variances = np.where(counts > 1, squares / (counts - 1), np.nan)
+    return means, variances
+
+def _log_beta(a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+    lgamma = np.vectorize(math.lgamma, otypes=[np.float64])
+    return lgamma(a) + lgamma(b) - lgamma(a + b)
+
+def _beta_continued_fraction(a: 'np.ndarray', b: 'np.ndarray', x: 'np.ndarray',
+                             iterations: int = 300) -> 'np.ndarray':
+    """Continued fraction for the incomplete beta function (modified Lentz)"""
+    tiny = 1e-300
+
+    def clamp(v):
+        return np.where(np.abs(v) < tiny, tiny, v)
+
+    c = np.ones_like(x)
+    d = 1.0 / clamp(1.0 - (a + b) * x / (a + 1.0))
+    h = d.copy()
+    for m in range(1, iterations + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((a - 1.0 + m2) * (a + m2))
+        d = 1.0 / clamp(1.0 + aa * d)
+        c = clamp(1.0 + aa / c)
+        h *= d * c
+
+        aa = -(a + m) * (a + b + m) * x / ((a + m2) * (a + 1.0 + m2))
+        d = 1.0 / clamp(1.0 + aa * d)
+        c = clamp(1.0 + aa / c)
+        delta = d * c
+        h *= delta
+        if np.all(np.abs(delta - 1.0) < 1e-14):
+            break
+    return h
+
+def regularized_incomplete_beta(a: 'np.ndarray', b: 'np.ndarray', x: 'np.ndarray') -> 'np.ndarray':
+    """I_x(a, b) elementwise"""
+    a, b, x = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (a, b, x)))
+    inner = np.clip(x, 1e-300, 1.0 - 1e-16)
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        front = np.exp(a * np.log(inner) + b * np.log1p(-inner) - _log_beta(a, b))
+        # The fraction converges fast below the mean; use the symmetry I_x(a,b) = 1 - I_1-x(b,a) above it
+        direct = inner < (a + 1.0) / (a + b + 2.0)
+        result = np.where(
+            direct,
+            front * _beta_continued_fraction(a, b, inner) / a,
+            1.0 - front * _beta_continued_fraction(b, a, 1.0 - inner) / b
+        )
+
+    result = np.where(x <= 0.0, 0.0, np.where(x >= 1.0, 1.0, result))
+    return np.where(np.isnan(x), np.nan, result)
+
+def t_two_sided_p_value(t: 'np.ndarray', df: 'np.ndarray') -> 'np.ndarray':
+    """P(|T| >= |t|) for Student's t with df degrees of freedom"""
+    t = np.asarray(t, dtype=np.float64)
+    df = np.asarray(df, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x = df / (df + t * t)
+    return regularized_incomplete_beta(df / 2.0, 0.5, np.where(np.isinf(t), 0.0, x))
+
+def welch_t_test(before: 'np.ndarray', before_n: 'np.ndarray', after: 'np.ndarray',
+                 after_n: 'np.ndarray') -> 'Tuple[np.ndarray, np.ndarray, np.ndarray]':
+    """(t statistic, Welch-Satterthwaite degrees of freedom, two-sided p) per row"""
+    mean_b, var_b = _moments(before, before_n)
+    mean_a, var_a = _moments(after, after_n)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        se_b = var_b / before_n
+        se_a = var_a / after_n
+        se = se_b + se_a
+        t = (mean_a - mean_b) / np.sqrt(se)
+        df = se ** 2 / (se_b ** 2 / (before_n - 1) + se_a ** 2 / (after_n - 1))
+
+    # Constant groups: no evidence either way rather than an infinite statistic
+    undefined = ~(se > 0)
+    t = np.where(undefined, np.nan, t)
+    df = np.where(undefined, np.nan, df)
+    return t, df, t_two_sided_p_value(t, df)
+
+def _bootstrap_means(values: 'np.ndarray', counts: 'np.ndarray', resamples: int,
+                     rng: 'np.random.Generator') -> 'np.ndarray':
+    """k x resamples matrix of resampled row means
+
+    Rows are bucketed by sample count so every draw is exactly as wide as
+    its group; padding is never resampled.
+    """
+    means = np.full((len(counts), resamples), np.nan)
+
+    for n in np.unique(counts[counts > 0]):
+        rows = np.flatnonzero(counts == n)
+        group = values[rows, :n]
+        chunk = max(1, BOOTSTRAP_CHUNK_VALUES // (len(rows) * n))
+        for start in range(0, resamples, chunk):
+            size = min(chunk, resamples - start)
+            idx = rng.integers(0, n, size=(len(rows), size, n), dtype=np.int32)
+            drawn = np.take_along_axis(group[:, None, :], idx, axis=2)
+            means[rows, start:start + size] = drawn.mean(axis=2)
+    return means
+
+def bootstrap_impact_interval(before: 'np.ndarray', before_n: 'np.ndarray', after: 'np.ndarray',
+                              after_n: 'np.ndarray', confidence: float = 0.95, resamples: int = 2000,
+                              seed: Optional[int] = 0) -> 'Tuple[np.ndarray, np.ndarray]':
+    """Percentile bootstrap interval of the percent change in mean, per row"""
+    rng = np.random.default_rng(seed)
+    mean_b = _bootstrap_means(before, before_n, resamples, rng)
+    mean_a = _bootstrap_means(after, after_n, resamples, rng)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lift = (mean_a - mean_b) / mean_b * 100
+    lift = np.where(np.isfinite(lift), lift, np.nan)
+
+    tail = (1 - confidence) / 2 * 100
+    low = np.full(len(before_n), np.nan)
+    high = np.full(len(before_n), np.nan)
+    defined = ~np.all(np.isnan(lift), axis=1)
+    if defined.any():
+        low[defined], high[defined] = np.nanpercentile(lift[defined], [tail, 100 - tail], axis=1)
+    return low, high
+
+def sequential_p_value(before: 'np.ndarray', before_n: 'np.ndarray', after: 'np.ndarray',
+                       after_n: 'np.ndarray', tau: 'np.ndarray') -> 'np.ndarray':
+    """Always-valid p-value of a mixture SPRT, looking after every after-sample
+
+    The mean difference estimate at each look is treated as normal with its
+    Welch standard error, the after variance floored at the before variance;
+    tau is the standard deviation of the normal mixture over effect sizes
+    (roughly the effect worth detecting).
+    """
+    mean_b, var_b = _moments(before, before_n)
+    looks = np.arange(1, after.shape[1] + 1)
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        # Running sums of the after samples centered on the before mean
+        centered = after - mean_b[:, None]
+        s1 = np.cumsum(centered, axis=1)
+        s2 = np.cumsum(centered ** 2, axis=1)
+        var_a = np.maximum(s2 - s1 ** 2 / looks, 0.0) / (looks - 1)
+        # Early looks underestimate the after variance; never trust it below the before variance
+        var_a = np.fmax(var_a, var_b[:, None])
+        s2_hat = var_b[:, None] / before_n[:, None] + var_a / looks
+        theta = s1 / looks
+        tau2 = (tau ** 2)[:, None]
+
+        log_lambda = (0.5 * np.log(s2_hat / (s2_hat + tau2))
+                      + tau2 * theta ** 2 / (2 * s2_hat * (s2_hat + tau2)))
+
+    valid = (looks >= 2) & (looks <= after_n[:, None]) & (s2_hat > 0)
+    best = np.where(valid, log_lambda, -np.inf).max(axis=1)
+    p = np.minimum(1.0, np.exp(-best))
+    return np.where(best > -np.inf, p, np.nan)
+
+def compare_groups(before: Sequence[Sequence[float]], after: Sequence[Sequence[float]],
+                   tau: Optional[Sequence[float]] = None, alpha: float = 0.05,
+                   resamples: int = 2000, seed: Optional[int] = 0) -> List[ImpactStatistics]:
+    """Welch test, bootstrap interval and sequential test for many comparisons at once
+
+    before[i] and after[i] are the raw samples of comparison i (after in
+    arrival order). tau defaults to 10% of each before mean.
+    """
+    if len(before) != len(after):
+        raise ValueError("before and after must have the same number of groups")
+    if not before:
+        return []
+
+    before_values, before_n = pad(before)
+    after_values, after_n = pad(after)
+
+    mean_b, _ = _moments(before_values, before_n)
+    mean_a, _ = _moments(after_values, after_n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        impact = (mean_a - mean_b) / mean_b * 100
+
+    t, df, p = welch_t_test(before_values, before_n, after_values, after_n)
+    ci_low, ci_high = bootstrap_impact_interval(before_values, before_n, after_values, after_n,
+                                                confidence=1 - alpha, resamples=resamples, seed=seed)
+
+    tau = 0.1 * np.abs(mean_b) if tau is None else np.asarray(tau, dtype=np.float64)
+    tau = np.where(tau > 0, tau, 0.1 * np.abs(mean_b))
+    p_seq = sequential_p_value(before_values, before_n, after_values, after_n, tau)
+
+    return [
+        ImpactStatistics(
+            before_mean=float(mean_b[i]), after_mean=float(mean_a[i]),
+            before_samples=int(before_n[i]), after_samples=int(after_n[i]),
+            impact_percent=float(impact[i]), t_statistic=float(t[i]),
+            degrees_of_freedom=float(df[i]), p_value=float(p[i]),
+            ci_low=float(ci_low[i]), ci_high=float(ci_high[i]),
+            sequential_p_value=float(p_seq[i]),
+            significant=bool(p_seq[i] <= alpha)
+        )
+        for i in range(len(before))
+    ]
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+BMAD Lazy Imports
+Module proxies that defer heavy imports until a command actually uses them
+"""
+
+import sys
+import importlib.util
+from types import ModuleType
+
+def lazy_import(name: str) -> ModuleType:
+    """Register name in sys.modules and return it; its code runs on first attribute access
+
+    Annotations that reference a lazy module (np.ndarray, requests.Response)
+    must be strings, otherwise defining the function triggers the import.
+    Missing modules raise ImportError immediately, like a regular import.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+BMAD Source Connectors
+Base interface for paginated data sources with persisted incremental sync cursors
+"""
+
+import sqlite3
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .http_client import PooledHTTPClient, get_shared_client
+from .response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Page:
+    """One page of records from a source"""
+    records: List[Any]
+    next_token: Optional[str] = None
+    high_water_mark: Optional[str] = None  # Cursor of the newest record in this page
+
+class SyncCursorStore:
+    """Persisted high-water-mark cursor per source"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.init_database()
+
+    def init_database(self):
+        """Create the cursor table"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS sync_cursors (
+                source TEXT PRIMARY KEY,
+                cursor TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get(self, source: str) -> Optional[str]:
+        """Last successfully synced cursor for a source"""
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute("SELECT cursor FROM sync_cursors WHERE source = ?", (source,)).fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    @staticmethod
+    def write(db_cursor: sqlite3.Cursor, source: str, cursor: str):
+        """Advance the cursor for a source inside the caller's transaction
+
+        Write it in the transaction that stores the synced metrics, so the
+        cursor never moves past data that was not persisted.
+        """
+        db_cursor.execute('''
+            INSERT INTO sync_cursors (source, cursor, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (source) DO UPDATE SET cursor = excluded.cursor, updated_at = excluded.updated_at
+        ''', (source, cursor))
+
+    def set(self, source: str, cursor: str):
+        """Advance the cursor for a source"""
+        conn = sqlite3.connect(self.db_path)
+        self.write(conn.cursor(), source, cursor)
+        conn.commit()
+        conn.close()
+
+    def reset(self, source: str):
+        """Forget the cursor so the next sync starts from the default lookback"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM sync_cursors WHERE source = ?", (source,))
+        conn.commit()
+        conn.close()
+
+class SourceConnector(ABC):
+    """Base class for metric sources
+
+    Subclasses must implement iter_pages() yielding pages in ascending cursor
+    order and, when records are not already metrics, override to_metrics().
+    """
+
+    source = "custom"
+    default_lookback = timedelta(days=1)
+    response_cache: Optional[ResponseCache] = None
+
+    @abstractmethod
+    def iter_pages(self, since: datetime, until: datetime) -> Iterator[Page]:
+        """Yield pages of records newer than `since` up to `until`"""
+
+    def to_metrics(self, records: List[Any]) -> List[Any]:
+        """Convert raw page records into CampaignMetric objects"""
+        return records
+
+    def cached(self, endpoint: str, since: datetime, until: datetime, fetcher: Callable[[], Any],
+               params: Optional[Dict[str, Any]] = None) -> Any:
+        """Run a fetch through the response cache when one is attached"""
+        if self.response_cache is None:
+            return fetcher()
+        return self.response_cache.fetch(self.source, endpoint, since.isoformat(), until.isoformat(),
+                                         fetcher, params)
+
+    @staticmethod
+    def parse_cursor(cursor: str) -> datetime:
+        """Cursors are ISO timestamps"""
+        return datetime.fromisoformat(cursor)
+
+    def sync(self, cursor_store: Optional[SyncCursorStore],
+             until: Optional[datetime] = None) -> Iterator[Tuple[List[Any], Optional[str]]]:
+        """Stream (metrics, cursor) pages newer than the stored cursor
+
+        Nothing is saved here: once the caller has persisted a page's metrics
+        it stores the page's cursor (ideally in the same transaction, see
+        SyncCursorStore.write), so a failed or abandoned write never skips
+        data. Without a cursor store the sync covers the default lookback.
+        """
+        until = until or datetime.now()
+        stored = cursor_store.get(self.source) if cursor_store else None
+        since = self.parse_cursor(stored) if stored else until - self.default_lookback
+
+        pages = 0
+        for page in self.iter_pages(since, until):
+            if page.high_water_mark and (stored is None or page.high_water_mark > stored):
+                stored = page.high_water_mark
+            yield self.to_metrics(page.records), stored
+            pages += 1
+
+        logger.debug(f"{self.source}: synced {pages} pages, cursor to store {stored}")
+
+    def fetch_since_cursor(self, cursor_store: Optional[SyncCursorStore],
+                           until: Optional[datetime] = None) -> Tuple[List[Any], Optional[str]]:
+        """Collect every new metric from a sync into one list, plus the cursor to store after saving them"""
+        metrics = []
+        cursor = None
+        for page_metrics, cursor in self.sync(cursor_store, until):
+            metrics.extend(page_metrics)
+        return metrics, cursor
+
+class HttpPagedConnector(SourceConnector):
+    """Connector for JSON APIs paginated with a next-page token
+
+    Expects responses shaped like {"records": [...], "next_page_token": "...",
+    "high_water_mark": "..."}; override the *_key attributes for other layouts.
+    """
+
+    records_key = "records"
+    next_token_key = "next_page_token"
+    high_water_mark_key = "high_water_mark"
+
+    def __init__(self, source: str, base_url: str, endpoint: str,
+                 headers: Optional[Dict[str, str]] = None, page_size: int = 500,
+                 timeout: float = 30.0, params: Optional[Dict[str, Any]] = None,
+                 metric_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 client: Optional[PooledHTTPClient] = None):
+        self.source = source
+        self.base_url = base_url.rstrip("/")
+        self.endpoint = endpoint
+        self.headers = headers or {}
+        self.page_size = page_size
+        self.timeout = timeout
+        self.params = params or {}
+        self.metric_factory = metric_factory
+        self.client = client or get_shared_client()
+
+    def to_metrics(self, records: List[Any]) -> List[Any]:
+        """Convert JSON records with metric_factory when one is configured"""
+        if self.metric_factory is None:
+            return records
+        return [self.metric_factory(record) for record in records]
+
+    def request_params(self, since: datetime, until: datetime, page_token: Optional[str]) -> Dict[str, Any]:
+        """Query parameters for one page request"""
+        params = {
+            **self.params,
+            "since": since.isoformat(),
+            "until": until.isoformat(),
+            "page_size": self.page_size
+        }
+        if page_token:
+            params["page_token"] = page_token
+        return params
+
+    def get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page over the shared pooled session"""
+        response = self.client.get(url, headers=self.headers, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_pages(self, since: datetime, until: datetime) -> Iterator[Page]:
+        """Follow next-page tokens until the source is exhausted"""
+        url = f"{self.base_url}{self.endpoint}"
+        page_token = None
+
+        while True:
+            params = self.request_params(since, until, page_token)
+            data = self.cached(self.endpoint, since, until, lambda: self.get_json(url, params), params)
+            page_token = data.get(self.next_token_key)
+
+            yield Page(
+                records=data.get(self.records_key, []),
+                next_token=page_token,
+                high_water_mark=data.get(self.high_water_mark_key)
+            )
+
+            if not page_token:
+                break
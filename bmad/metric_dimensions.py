@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+BMAD Metric Dimensions
+Interns metric dimension dictionaries into shared, indexed dimension sets
+"""
+
+import json
+import sqlite3
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class DimensionRegistry:
+    """Maps dimension dictionaries to integer dimension-set ids
+
+    Ids created inside a transaction stay pending until the caller reports
+    the commit, so a rolled-back set is never served from the cache.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._pending: Dict[str, int] = {}
+
+    @staticmethod
+    def canonical(dimensions: Optional[Dict[str, str]]) -> Optional[str]:
+        """Stable JSON form used as the dimension-set key (None for no dimensions)"""
+        if not dimensions:
+            return None
+        return json.dumps(dimensions, sort_keys=True, separators=(',', ':'))
+
+    @staticmethod
+    def init_schema(cursor: sqlite3.Cursor):
+        """Create the dimension tables and their lookup index"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dimension_sets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dimensions TEXT UNIQUE NOT NULL
+            )
+        ''')
+
+        # One row per key/value pair so a dimension filter is a single index seek
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS dimension_values (
+                dim_key TEXT NOT NULL,
+                dim_value TEXT NOT NULL,
+                dimension_set_id INTEGER NOT NULL,
+                PRIMARY KEY (dim_key, dim_value, dimension_set_id)
+            ) WITHOUT ROWID
+        ''')
+
+    def intern(self, cursor: sqlite3.Cursor, dimensions: Optional[Dict[str, str]]) -> Optional[int]:
+        """Return the dimension-set id for a dictionary, creating it on first use"""
+        key = self.canonical(dimensions)
+        if key is None:
+            return None
+
+        set_id = self._ids.get(key, self._pending.get(key))
+        if set_id is not None:
+            return set_id
+
+        cursor.execute("INSERT OR IGNORE INTO dimension_sets (dimensions) VALUES (?)", (key,))
+        set_id = cursor.execute("SELECT id FROM dimension_sets WHERE dimensions = ?", (key,)).fetchone()[0]
+
+        cursor.executemany('''
+            INSERT OR IGNORE INTO dimension_values (dim_key, dim_value, dimension_set_id)
+            VALUES (?, ?, ?)
+        ''', [(k, str(v), set_id) for k, v in dimensions.items()])
+
+        self._pending[key] = set_id
+        return set_id
+
+    def commit(self):
+        """Cache the ids interned since the last commit; call after the transaction commits"""
+        self._ids.update(self._pending)
+        self._pending.clear()
+
+    def rollback(self):
+        """Forget the ids interned since the last commit; call after the transaction rolls back"""
+        self._pending.clear()
+
+    def intern_many(self, cursor: sqlite3.Cursor, dimension_list: List[Optional[Dict[str, str]]]) -> List[Optional[int]]:
+        """Intern a batch of dimension dictionaries"""
+        return [self.intern(cursor, dims) for dims in dimension_list]
+
+    def migrate_metrics(self, cursor: sqlite3.Cursor) -> int:
+        """Move legacy JSON dimensions on metrics rows into dimension sets
+
+        JSON null clears the column like an empty object. Values that are not
+        JSON, or are JSON lists, strings or numbers, are left in place.
+        """
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(metrics)")}
+        if "dimension_set_id" not in columns:
+            cursor.execute("ALTER TABLE metrics ADD COLUMN dimension_set_id INTEGER")
+
+        legacy = cursor.execute('''
+            SELECT DISTINCT dimensions FROM metrics
+            WHERE dimension_set_id IS NULL AND dimensions IS NOT NULL
+        ''').fetchall()
+
+        migrated = 0
+        skipped = 0
+        for (raw,) in legacy:
+            try:
+                dimensions = json.loads(raw)
+            except (TypeError, ValueError):
+                dimensions = raw
+            if dimensions is not None and not isinstance(dimensions, dict):
+                skipped += 1
+                continue
+
+            set_id = self.intern(cursor, dimensions)
+            cursor.execute('''
+                UPDATE metrics SET dimension_set_id = ?, dimensions = NULL
+                WHERE dimension_set_id IS NULL AND dimensions = ?
+            ''', (set_id, raw))
+            migrated += cursor.rowcount
+
+        if migrated:
+            logger.info(f"Migrated dimensions for {migrated} metric rows")
+        if skipped:
+            logger.warning(f"Left {skipped} distinct legacy dimension values that are not JSON objects")
+        return migrated
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+BMAD Columnar Export
+Syncs the SQLite metric stores to date/source partitioned Parquet files for fast analysis
+"""
+
+import json
+import os
+import sqlite3
+import shutil
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    from pyarrow import fs as pafs
+except ImportError:  # pyarrow is only needed for columnar export/analysis
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+SYNC_STATE_FILE = "_sync_state.json"
+
+@dataclass
+class ExportTable:
+    """Export layout for one SQLite table"""
+    table: str
+    timestamp_column: str = "timestamp"
+    source_column: Optional[str] = "source"  # None = partition by date only
+    incremental: bool = True  # False = rewrite the whole table on every sync (mutable rows)
+    query: Optional[str] = None  # Custom SELECT taking the last exported id; defaults to SELECT *
+
+# Tables exported from each BMAD database
+METRICS_TABLES = [
+    ExportTable("metrics", query='''
+        SELECT m.id, m.timestamp, m.metric_name, m.metric_value, m.metric_type, m.source,
+               COALESCE(ds.dimensions, m.dimensions) AS dimensions, m.campaign_id, m.created_at
+        FROM metrics m
+        LEFT JOIN dimension_sets ds ON ds.id = m.dimension_set_id
+        WHERE m.id > ?
+        ORDER BY m.id
+    ''')
+]
+TRACKING_TABLES = [
+    ExportTable("campaign_metrics"),
+    ExportTable("proposal_tracking", source_column=None, incremental=False)
+]
+
+def arrow_type(declared_type: str):
+    """Map a SQLite declared column type onto a stable Arrow type"""
+    declared = (declared_type or "").upper()
+    if "INT" in declared or "BOOL" in declared:
+        return pa.int64()
+    if any(t in declared for t in ("REAL", "FLOA", "DOUB")):
+        return pa.float64()
+    return pa.string()
+
+def require_pyarrow():
+    """Raise a helpful error when pyarrow is not installed"""
+    if pa is None:
+        raise RuntimeError("Columnar export requires pyarrow: pip install pyarrow")
+
+class ColumnarExporter:
+    """Writes SQLite tables as hive-partitioned Parquet datasets"""
+
+    def __init__(self, export_dir: str = "measure_data/columnar"):
+        require_pyarrow()
+        self.export_dir = Path(export_dir)
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.export_dir / SYNC_STATE_FILE
+        self.state = self.load_state()
+
+    def load_state(self) -> Dict[str, Any]:
+        """Load the per-table export high-water marks"""
+        if self.state_path.exists():
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def save_state(self):
+        """Persist export high-water marks atomically"""
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def remove_unsynced_parts(self, table_dir: Path, last_id: int) -> int:
+        """Delete part files of rows above the high-water mark, left behind by an interrupted sync
+
+        Parts are written before the state is saved, so a crash in between
+        leaves files whose rows the next sync would export again.
+        """
+        removed = 0
+        for part_path in table_dir.glob("date=*/**/part-*"):
+            first_id = int(part_path.name.split("-")[1])
+            if first_id > last_id or part_path.suffix == ".tmp":
+                part_path.unlink()
+                removed += 1
+        if removed:
+            logger.warning(f"Removed {removed} unsynced part files from {table_dir}")
+        return removed
+
+    def sync_table(self, db_path: str, spec: ExportTable) -> int:
+        """Export rows added since the last sync; returns rows written"""
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        table_dir = self.export_dir / spec.table
+        last_id = self.state.get(spec.table, {}).get("last_id", 0) if spec.incremental else 0
+
+        # Declared column types give every partition file the same schema
+        declared = {row[1]: row[2] for row in cursor.execute(f"PRAGMA table_info({spec.table})")}
+
+        try:
+            cursor.execute(spec.query or f"SELECT * FROM {spec.table} WHERE id > ? ORDER BY id", (last_id,))
+        except sqlite3.OperationalError:
+            # Databases created before the custom query's tables existed
+            cursor.execute(f"SELECT * FROM {spec.table} WHERE id > ? ORDER BY id", (last_id,))
+        columns = [d[0] for d in cursor.description]
+        rows = cursor.fetchall()
+        conn.close()
+
+        if not spec.incremental and table_dir.exists():
+            shutil.rmtree(table_dir)
+        elif table_dir.exists():
+            self.remove_unsynced_parts(table_dir, last_id)
+
+        if not rows:
+            return 0
+
+        ts_index = columns.index(spec.timestamp_column)
+        source_index = columns.index(spec.source_column) if spec.source_column else None
+        schema = pa.schema([
+            (col, arrow_type(declared.get(col)))
+            for i, col in enumerate(columns) if i != source_index
+        ])
+
+        # Group rows by partition key
+        partitions: Dict[tuple, List[tuple]] = {}
+        for row in rows:
+            day = str(row[ts_index])[:10]
+            source = (row[source_index] or "unknown") if source_index is not None else None
+            partitions.setdefault((day, source), []).append(row)
+
+        for (day, source), part_rows in partitions.items():
+            part_dir = table_dir / f"date={day}"
+            if source is not None:
+                part_dir = part_dir / f"source={source}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+
+            arrays = []
+            for i, col in enumerate(columns):
+                if i == source_index:
+                    continue
+                values = [r[i] for r in part_rows]
+                if pa.types.is_string(schema.field(col).type):
+                    values = [None if v is None else str(v) for v in values]
+                arrays.append(pa.array(values, type=schema.field(col).type))
+            part_table = pa.Table.from_arrays(arrays, schema=schema)
+
+            first_id, last_row_id = part_rows[0][0], part_rows[-1][0]
+            part_path = part_dir / f"part-{first_id:012d}-{last_row_id:012d}.parquet"
+            tmp_path = part_path.with_suffix(".tmp")
+            pq.write_table(part_table, tmp_path)
+            os.replace(tmp_path, part_path)
+
+        self.state[spec.table] = {
+            "last_id": rows[-1][0],
+            "db_path": str(db_path),
+            "synced_at": datetime.now().isoformat()
+        }
+        self.save_state()
+
+        logger.info(f"Exported {len(rows)} {spec.table} rows into {len(partitions)} partitions")
+        return len(rows)
+
+    def sync(self, db_path: str, tables: List[ExportTable]) -> Dict[str, int]:
+        """Sync every table of a database; tables missing from the database are skipped"""
+        conn = sqlite3.connect(db_path)
+        existing = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        conn.close()
+
+        return {
+            spec.table: self.sync_table(db_path, spec)
+            for spec in tables if spec.table in existing
+        }
+
+def load_columnar(export_dir: str, table: str, columns: Optional[List[str]] = None,
+                  start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """Load only the requested columns and date partitions of an exported table as a DataFrame"""
+    require_pyarrow()
+
+    table_dir = Path(export_dir) / table
+    if not table_dir.exists():
+        raise FileNotFoundError(f"No columnar export found for {table} in {export_dir}")
+
+    # Partition values stay strings so date filters prune directories lexically
+    has_source = any(p.name.startswith("source=") for p in table_dir.glob("date=*/*"))
+    fields = [("date", pa.string())] + ([("source", pa.string())] if has_source else [])
+    partitioning = ds.partitioning(pa.schema(fields), flavor="hive")
+
+    dataset = ds.dataset(
+        str(table_dir),
+        format="parquet",
+        partitioning=partitioning,
+        filesystem=pafs.LocalFileSystem(use_mmap=True)
+    )
+
+    expression = None
+    if start_date:
+        expression = ds.field("date") >= start_date
+    if end_date:
+        end_expr = ds.field("date") <= end_date
+        expression = end_expr if expression is None else expression & end_expr
+
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+def main(argv: Optional[List[str]] = None):
+    """Main function for syncing the columnar export"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='BMAD Columnar Export')
+    parser.add_argument('--metrics-db', type=str, default='bmad_metrics.db', help='Measure phase metrics database')
+    parser.add_argument('--tracking-db', type=str, default='bmad_tracking.db', help='BMAD tracking database')
+    parser.add_argument('--out', type=str, default='measure_data/columnar', help='Export directory')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    exporter = ColumnarExporter(args.out)
+    written = {}
+
+    if os.path.exists(args.metrics_db):
+        written.update(exporter.sync(args.metrics_db, METRICS_TABLES))
+    if os.path.exists(args.tracking_db):
+        written.update(exporter.sync(args.tracking_db, TRACKING_TABLES))
+
+    for table, count in written.items():
+        print(f"{table}: {count} rows exported")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+BMAD Metric Pivot
+Metric x time matrix built once per analysis and shared by every analyzer
+"""
+
+from typing import Dict, List, Optional
+
+from .lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+class MetricPivot:
+    """Dense (time x metric) matrix with the latest and previous value of each metric precomputed
+
+    Built from long-form rows with metric_name, metric_value and timestamp
+    columns. Cells with no sample are NaN.
+    """
+
+    def __init__(self, df: 'pd.DataFrame'):
+        frame = df[['timestamp', 'metric_name', 'metric_value']]
+        if not frame.empty:
+            # ISO timestamps sort lexically; keep the last sample per (time, metric)
+            frame = frame.assign(timestamp=frame['timestamp'].astype(str))
+            frame = frame.drop_duplicates(['timestamp', 'metric_name'], keep='last')
+        wide = frame.pivot(index='timestamp', columns='metric_name', values='metric_value').sort_index()
+
+        self.times = wide.index.to_numpy()
+        self.metrics: List[str] = [str(name) for name in wide.columns]
+        self.column: Dict[str, int] = {name: i for i, name in enumerate(self.metrics)}
+        self.values = wide.to_numpy(dtype=np.float64)
+
+        self.latest, self.previous = self._last_two(self.values)
+
+    @staticmethod
+    def _last_two(values: 'np.ndarray'):
+        """Latest and previous non-NaN value of every column"""
+        rows, cols = values.shape
+        if rows == 0:
+            empty = np.full(cols, np.nan)
+            return empty, empty.copy()
+
+        col_index = np.arange(cols)
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+
+        last_row = rows - 1 - valid[::-1].argmax(axis=0)
+        latest = np.where(counts > 0, values[last_row, col_index], np.nan)
+
+        valid[last_row, col_index] = False
+        prev_row = rows - 1 - valid[::-1].argmax(axis=0)
+        previous = np.where(counts > 1, values[prev_row, col_index], np.nan)
+
+        return latest, previous
+
+    def __contains__(self, metric_name: str) -> bool:
+        return metric_name in self.column
+
+    @property
+    def empty(self) -> bool:
+        return not self.metrics
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Whether any metric name starts with prefix"""
+        return any(name.startswith(prefix) for name in self.metrics)
+
+    def _gather(self, source: 'np.ndarray', names: List[str]) -> 'np.ndarray':
+        index = np.array([self.column.get(name, -1) for name in names], dtype=np.int64)
+        out = np.full(len(names), np.nan)
+        present = index >= 0
+        out[present] = source[index[present]]
+        return out
+
+    def latest_values(self, names: List[str]) -> 'np.ndarray':
+        """Latest value per name (NaN when a metric was never recorded)"""
+        return self._gather(self.latest, names)
+
+    def previous_values(self, names: List[str]) -> 'np.ndarray':
+        """Value before the latest per name (NaN when fewer than two samples)"""
+        return self._gather(self.previous, names)
+
+    def latest_value(self, name: str) -> Optional[float]:
+        value = self.latest_values([name])[0]
+        return None if np.isnan(value) else float(value)
+
+    def series(self, name: str) -> 'np.ndarray':
+        """All recorded values of one metric in time order"""
+        column = self.values[:, self.column[name]] if name in self.column else np.empty(0)
+        return column[~np.isnan(column)]
+
+def conversion_rates(stage_values: 'np.ndarray') -> 'np.ndarray':
+    """Percentage conversion between consecutive stages (NaN where the upstream stage is missing or zero)
+
+    stage_values may be 1-D (one snapshot) or 2-D (time x stage).
+    """
+    upstream = stage_values[..., :-1]
+    downstream = stage_values[..., 1:]
+    rates = np.full(upstream.shape, np.nan)
+    np.divide(downstream * 100.0, upstream, out=rates, where=upstream > 0)
+    return rates
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+BMAD Metric Queries
+Analyzer data requirements pushed down into indexed, pre-aggregated SQL
+"""
+
+import sqlite3
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from .lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+logger = logging.getLogger(__name__)
+
+# SQL aggregate for each supported aggregation; "last" uses SQLite's bare-column
+# rule (the value comes from the row holding MAX(timestamp) in the group)
+AGGREGATIONS = {
+    "last": "metric_value",
+    "avg": "AVG(metric_value)",
+    "sum": "SUM(metric_value)",
+    "min": "MIN(metric_value)",
+    "max": "MAX(metric_value)",
+    "count": "COUNT(*)",
+}
+
+# The same aggregations over daily_metric_rollup (one row per day, source, metric, campaign
+# and dimension set); "last" takes last_value from the row holding MAX(last_timestamp)
+ROLLUP_AGGREGATIONS = {
+    "last": "last_value",
+    "avg": "SUM(value_sum) / SUM(sample_count)",
+    "sum": "SUM(value_sum)",
+    "min": "MIN(value_min)",
+    "max": "MAX(value_max)",
+    "count": "SUM(sample_count)",
+}
+
+COLUMNS = ['metric_name', 'metric_value', 'timestamp']
+
+@dataclass(frozen=True)
+class MetricRequirement:
+    """Metrics an analyzer reads: a name prefix and a per-day aggregation
+
+    Aggregations other than "last" are returned as "<metric_name>__<aggregation>".
+    """
+    prefix: str
+    aggregation: str = "last"
+
+    def __post_init__(self):
+        if self.aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation {self.aggregation!r}")
+
+    def output_name(self, metric_name: str) -> str:
+        return metric_name if self.aggregation == "last" else f"{metric_name}__{self.aggregation}"
+
+@dataclass(frozen=True)
+class Segment:
+    """One analysis partition: a campaign, optionally narrowed to one dimension value
+
+    campaign_id None is the partition of rows recorded without a campaign.
+    """
+    campaign_id: Optional[str]
+    dim_key: Optional[str] = None
+    dim_value: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        label = self.campaign_id or "unassigned"
+        if self.dim_key is not None:
+            label += f"/{self.dim_key}={self.dim_value}"
+        return label
+
+def _segment_filter(segment: Optional[Segment], rollup: bool) -> Tuple[str, Tuple]:
+    """AND clause and parameters restricting a metrics (or rollup) query to one segment"""
+    if segment is None:
+        return "", ()
+
+    # The rollup keys rows without a campaign as ''
+    if rollup:
+        clause, params = "AND campaign_id = ?", (segment.campaign_id or "",)
+    else:
+        clause, params = "AND campaign_id IS ?", (segment.campaign_id,)
+
+    if segment.dim_key is not None:
+        clause += ''' AND dimension_set_id IN (
+                SELECT dimension_set_id FROM dimension_values WHERE dim_key = ? AND dim_value = ?
+            )'''
+        params += (segment.dim_key, segment.dim_value)
+    return clause, params
+
+def prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string starting with prefix"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def cutoff_timestamp(days_back: int) -> str:
+    """UTC cutoff in the stored timestamp text format"""
+    return (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime('%Y-%m-%d %H:%M:%S')
+
+def ensure_metric_name_index(conn: sqlite3.Connection):
+    """(metric_name, timestamp) index that serves prefix + time-range scans"""
+    try:
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_name_timestamp ON metrics (metric_name, timestamp)")
+        conn.commit()
+    except sqlite3.OperationalError as e:  # Read-only database
+        logger.debug(f"Could not create metrics name index: {e}")
+
+def load_aggregated(conn: sqlite3.Connection, requirements: List[MetricRequirement],
+                    days_back: int = 30, segment: Optional[Segment] = None) -> 'pd.DataFrame':
+    """One row per (metric, day, requirement) with timestamp set to the day
+
+    segment restricts the rows to one campaign and, optionally, dimension value.
+    """
+    cutoff = cutoff_timestamp(days_back)
+    segment_clause, segment_params = _segment_filter(segment, rollup=False)
+    rows = []
+
+    for requirement in requirements:
+        value_expr = AGGREGATIONS[requirement.aggregation]
+        cursor = conn.execute(f'''
+            SELECT metric_name, {value_expr}, substr(timestamp, 1, 10) AS day, MAX(timestamp)
+            FROM metrics
+            WHERE metric_name >= ? AND metric_name < ? AND timestamp >= ?
+            {segment_clause}
+            GROUP BY metric_name, day
+        ''', (requirement.prefix, prefix_upper_bound(requirement.prefix), cutoff) + segment_params)
+
+        rows.extend(
+            (requirement.output_name(name), value, day)
+            for name, value, day, _ in cursor
+        )
+
+    logger.info(f"Loaded {len(rows)} aggregated metric rows for {len(requirements)} requirements")
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+def load_rollup_aggregated(conn: sqlite3.Connection, requirements: List[MetricRequirement],
+                           days_back: int = 30, segment: Optional[Segment] = None) -> 'pd.DataFrame':
+    """load_aggregated read from the incrementally maintained daily rollup
+
+    The window starts at the cutoff's day, and raw metric rows are never
+    rescanned. Call DailyRollup.refresh first to fold in newly ingested rows.
+    """
+    cutoff_day = cutoff_timestamp(days_back)[:10]
+    segment_clause, segment_params = _segment_filter(segment, rollup=True)
+    rows = []
+
+    for requirement in requirements:
+        value_expr = ROLLUP_AGGREGATIONS[requirement.aggregation]
+        cursor = conn.execute(f'''
+            SELECT metric_name, {value_expr}, day, MAX(last_timestamp)
+            FROM daily_metric_rollup
+            WHERE day >= ? AND metric_name >= ? AND metric_name < ?
+            {segment_clause}
+            GROUP BY metric_name, day
+        ''', (cutoff_day, requirement.prefix, prefix_upper_bound(requirement.prefix)) + segment_params)
+
+        rows.extend(
+            (requirement.output_name(name), value, day)
+            for name, value, day, _ in cursor
+        )
+
+    logger.info(f"Loaded {len(rows)} rolled-up metric rows for {len(requirements)} requirements")
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+def aggregate_frame(df: 'pd.DataFrame', requirements: List[MetricRequirement]) -> 'pd.DataFrame':
+    """Apply the same per-day aggregation to an already loaded frame (e.g. the columnar export)"""
+    if df.empty:
+        return pd.DataFrame(columns=COLUMNS)
+
+    frame = df[COLUMNS].assign(timestamp=df['timestamp'].astype(str))
+    frame = frame.sort_values('timestamp', kind='stable').assign(day=frame['timestamp'].str[:10])
+
+    parts = []
+    for requirement in requirements:
+        subset = frame[frame['metric_name'].str.startswith(requirement.prefix)]
+        if subset.empty:
+            continue
+
+        grouped = subset.groupby(['metric_name', 'day'])['metric_value']
+        values = grouped.size() if requirement.aggregation == "count" else grouped.agg(
+            {"avg": "mean"}.get(requirement.aggregation, requirement.aggregation)
+        )
+        values = values.reset_index()
+        parts.append(pd.DataFrame({
+            'metric_name': values['metric_name'].map(requirement.output_name),
+            'metric_value': values.iloc[:, -1].astype(float),
+            'timestamp': values['day']
+        }))
+
+    return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=COLUMNS)
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+BMAD Metric Retention Engine
+Compacts old raw metric history into daily rollups and reclaims disk space
+"""
+
+import sqlite3
+import time
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RetentionPolicy:
+    """Retention rule for a single raw history table"""
+    table: str
+    raw_retention_days: int
+    rollup_table: Optional[str] = None  # None = delete expired rows without compaction
+    group_columns: Tuple[str, ...] = ("metric_name", "source")
+    timestamp_column: str = "timestamp"
+    value_column: str = "metric_value"
+    keep_condition: Optional[str] = None  # SQL condition on a raw row that exempts it from expiry
+
+@dataclass
+class RetentionResult:
+    """Outcome of applying a retention policy to one table"""
+    table: str
+    cutoff: str
+    rows_expired: int
+    bytes_reclaimable: int
+    rows_rolled_up: int = 0
+    rows_deleted: int = 0
+    batches: int = 0
+    dry_run: bool = False
+
+# Impact significance tests (BMADTracker.calculate_optimization_impacts) read raw
+# campaign_metrics samples, so rows this close to an optimization stay raw. A
+# sample tagged with an optimization only counts toward that optimization.
+OPTIMIZATION_WINDOW_DAYS = 30
+
+# Default policies for the BMAD databases, keyed by table name
+DEFAULT_POLICIES = {
+    "metrics": RetentionPolicy(
+        table="metrics",
+        raw_retention_days=90,
+        rollup_table="metrics_daily_rollup",
+        group_columns=("metric_name", "source", "campaign_id")
+    ),
+    "campaign_metrics": RetentionPolicy(
+        table="campaign_metrics",
+        raw_retention_days=90,
+        rollup_table="campaign_metrics_daily_rollup",
+        group_columns=("metric_name", "source"),
+        keep_condition=f'''EXISTS (
+            SELECT 1 FROM optimizations o
+            WHERE (campaign_metrics.optimization_id IS NULL OR campaign_metrics.optimization_id = o.id)
+              AND datetime(campaign_metrics.timestamp)
+                BETWEEN datetime(o.implemented_date, '-{OPTIMIZATION_WINDOW_DAYS} days')
+                    AND datetime(o.implemented_date, '+{OPTIMIZATION_WINDOW_DAYS} days')
+        )'''
+    ),
+    "alerts": RetentionPolicy(
+        table="alerts",
+        raw_retention_days=180,
+        timestamp_column="created_at",
+        value_column="current_value"
+    )
+}
+
+class RetentionEngine:
+    """Applies retention policies in small batches so writers are never blocked for long"""
+
+    def __init__(self, db_path: str, policies: Optional[List[RetentionPolicy]] = None,
+                 batch_size: int = 5000, pause_seconds: float = 0.05,
+                 vacuum_pages: int = 1000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.vacuum_pages = vacuum_pages
+
+        if policies is None:
+            policies = list(DEFAULT_POLICIES.values())
+
+        # Only keep policies for tables that exist in this database
+        existing = self._existing_tables()
+        self.policies = [p for p in policies if p.table in existing]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for running alongside concurrent writers"""
+        # isolation_level=None lets us issue explicit short BEGIN IMMEDIATE transactions
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    def _existing_tables(self) -> set:
+        """Return the names of tables present in the database"""
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        conn.close()
+        return {row[0] for row in rows}
+
+    @staticmethod
+    def cutoff_for(policy: RetentionPolicy, now: Optional[datetime] = None) -> str:
+        """UTC timestamp text before which raw rows are expired"""
+        now = now or datetime.now(timezone.utc)
+        cutoff = now.astimezone(timezone.utc) - timedelta(days=policy.raw_retention_days)
+        # The format datetime() produces, which expired_condition compares against
+        return cutoff.strftime('%Y-%m-%d %H:%M:%S')
+
+    def ensure_rollup_table(self, conn: sqlite3.Connection, policy: RetentionPolicy):
+        """Create the rollup table for a policy if it does not exist"""
+        if not policy.rollup_table:
+            return
+
+        group_defs = ", ".join(f"{col} TEXT NOT NULL DEFAULT ''" for col in policy.group_columns)
+        key = ", ".join(("day",) + policy.group_columns)
+
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {policy.rollup_table} (
+                day TEXT NOT NULL,
+                {group_defs},
+                sample_count INTEGER NOT NULL,
+                value_sum REAL,
+                value_min REAL,
+                value_max REAL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY ({key})
+            )
+        ''')
+
+    def ensure_timestamp_index(self, conn: sqlite3.Connection, policy: RetentionPolicy):
+        """Index the normalised timestamp so expired rows are found without a table scan"""
+        conn.execute(f'''
+            CREATE INDEX IF NOT EXISTS idx_{policy.table}_{policy.timestamp_column}_utc
+            ON {policy.table} (datetime({policy.timestamp_column}))
+        ''')
+
+    @staticmethod
+    def expired_condition(policy: RetentionPolicy) -> str:
+        """WHERE clause (one cutoff parameter) selecting the rows a policy expires
+
+        Stored timestamps mix CURRENT_TIMESTAMP text, naive isoformat() and
+        isoformat() with a UTC offset, so the column is normalised with
+        datetime() rather than compared as raw text. Unparseable values
+        normalise to NULL and never expire.
+        """
+        condition = f"datetime({policy.timestamp_column}) < ?"
+        if policy.keep_condition:
+            condition += f" AND NOT {policy.keep_condition}"
+        return condition
+
+    def estimate(self, conn: sqlite3.Connection, policy: RetentionPolicy, cutoff: str) -> Tuple[int, int]:
+        """Return (expired_rows, estimated_bytes) for a policy"""
+        expired = conn.execute(
+            f"SELECT COUNT(*) FROM {policy.table} WHERE {self.expired_condition(policy)}", (cutoff,)
+        ).fetchone()[0]
+
+        if expired == 0:
+            return 0, 0
+
+        total = conn.execute(f"SELECT COUNT(*) FROM {policy.table}").fetchone()[0]
+
+        try:
+            # dbstat reports the real on-disk size of the table and its indexes
+            table_bytes = conn.execute('''
+                SELECT COALESCE(SUM(pgsize), 0) FROM dbstat
+                WHERE name = ? OR name IN (SELECT name FROM sqlite_master
+                                           WHERE type = 'index' AND tbl_name = ?)
+            ''', (policy.table, policy.table)).fetchone()[0]
+        except sqlite3.OperationalError:
+            # SQLite built without dbstat: fall back to the page-level share of the file
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            table_bytes = page_size * page_count
+
+        return expired, int(table_bytes * expired / max(total, 1))
+
+    def _rollup_sql(self, policy: RetentionPolicy) -> str:
+        """Build the upsert that folds a batch of raw rows into the rollup table"""
+        groups = ", ".join(policy.group_columns)
+        group_selects = ", ".join(f"COALESCE({col}, '')" for col in policy.group_columns)
+        key = ", ".join(("day",) + policy.group_columns)
+        value = policy.value_column
+
+        return f'''
+            INSERT INTO {policy.rollup_table}
+            (day, {groups}, sample_count, value_sum, value_min, value_max)
+            SELECT date({policy.timestamp_column}), {group_selects},
+                   COUNT(*), SUM({value}), MIN({value}), MAX({value})
+            FROM {policy.table}
+            WHERE id IN (SELECT id FROM _retention_batch)
+            GROUP BY 1, {", ".join(str(i + 2) for i in range(len(policy.group_columns)))}
+            ON CONFLICT ({key}) DO UPDATE SET
+                sample_count = sample_count + excluded.sample_count,
+                value_sum = COALESCE(value_sum, 0) + COALESCE(excluded.value_sum, 0),
+                value_min = MIN(COALESCE(value_min, excluded.value_min),
+                                COALESCE(excluded.value_min, value_min)),
+                value_max = MAX(COALESCE(value_max, excluded.value_max),
+                                COALESCE(excluded.value_max, value_max)),
+                updated_at = CURRENT_TIMESTAMP
+        '''
+
+    def apply_policy(self, policy: RetentionPolicy, dry_run: bool = False,
+                     now: Optional[datetime] = None) -> RetentionResult:
+        """Compact and delete expired rows for one policy"""
+        cutoff = self.cutoff_for(policy, now)
+        conn = self._connect()
+
+        try:
+            expired, reclaimable = self.estimate(conn, policy, cutoff)
+            result = RetentionResult(
+                table=policy.table,
+                cutoff=cutoff,
+                rows_expired=expired,
+                bytes_reclaimable=reclaimable,
+                dry_run=dry_run
+            )
+
+            if dry_run or expired == 0:
+                return result
+
+            self.ensure_timestamp_index(conn, policy)
+            self.ensure_rollup_table(conn, policy)
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _retention_batch (id INTEGER PRIMARY KEY)")
+            rollup_sql = self._rollup_sql(policy) if policy.rollup_table else None
+
+            while True:
+                # Each batch is its own short write transaction
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("DELETE FROM _retention_batch")
+                    conn.execute(f'''
+                        INSERT INTO _retention_batch (id)
+                        SELECT id FROM {policy.table}
+                        WHERE {self.expired_condition(policy)}
+                        LIMIT ?
+                    ''', (cutoff, self.batch_size))
+                    batch_rows = conn.execute("SELECT COUNT(*) FROM _retention_batch").fetchone()[0]
+
+                    if batch_rows == 0:
+                        conn.execute("COMMIT")
+                        break
+
+                    if rollup_sql:
+                        conn.execute(rollup_sql)
+                        result.rows_rolled_up += batch_rows
+
+                    conn.execute(f'''
+                        DELETE FROM {policy.table}
+                        WHERE id IN (SELECT id FROM _retention_batch)
+                    ''')
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+
+                result.rows_deleted += batch_rows
+                result.batches += 1
+
+                if batch_rows < self.batch_size:
+                    break
+
+                # Give concurrent writers a window between batches
+                if self.pause_seconds:
+                    time.sleep(self.pause_seconds)
+
+            logger.info(f"Retention applied to {policy.table}: {result.rows_deleted} rows deleted "
+                        f"in {result.batches} batches (cutoff {cutoff})")
+            return result
+        finally:
+            conn.close()
+
+    def reclaim_space(self) -> int:
+        """Release free pages back to the filesystem; returns bytes freed"""
+        conn = self._connect()
+
+        try:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if auto_vacuum != 2:
+                # Switching an existing database to incremental mode needs one full VACUUM
+                logger.warning(f"{self.db_path} is not in incremental auto_vacuum mode; "
+                               "run with --enable-incremental-vacuum once to convert it")
+                return 0
+
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            freed = 0
+
+            # Reclaim in bounded steps so each step only holds the write lock briefly
+            while True:
+                free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if free_before == 0:
+                    break
+                conn.execute(f"PRAGMA incremental_vacuum({self.vacuum_pages})").fetchall()
+                free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                freed += (free_before - free_after) * page_size
+                if free_after >= free_before:
+                    break
+
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            logger.info(f"Reclaimed {freed:,} bytes from {self.db_path}")
+            return freed
+        finally:
+            conn.close()
+
+    def enable_incremental_vacuum(self):
+        """One-time conversion of an existing database to incremental auto_vacuum"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        conn.close()
+        logger.info(f"Enabled incremental auto_vacuum on {self.db_path}")
+
+    def run(self, dry_run: bool = False, now: Optional[datetime] = None) -> Dict[str, RetentionResult]:
+        """Apply every policy, then reclaim freed pages"""
+        results = {}
+
+        for policy in self.policies:
+            results[policy.table] = self.apply_policy(policy, dry_run=dry_run, now=now)
+
+        if not dry_run and any(r.rows_deleted for r in results.values()):
+            self.reclaim_space()
+
+        return results
+
+def format_retention_report(results: Dict[str, RetentionResult]) -> str:
+    """Render retention results as a short text summary"""
+    lines = []
+    total_rows = 0
+    total_bytes = 0
+
+    for result in results.values():
+        action = "would reclaim" if result.dry_run else "reclaimed"
+        rows = result.rows_expired if result.dry_run else result.rows_deleted
+        total_rows += rows
+        total_bytes += result.bytes_reclaimable
+        lines.append(f"{result.table}: {action} {rows:,} rows (~{result.bytes_reclaimable:,} bytes, "
+                     f"cutoff {result.cutoff})")
+
+    lines.append(f"Total: {total_rows:,} rows, ~{total_bytes:,} bytes")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    """Main function for running retention against a BMAD database"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='BMAD Metric Retention Engine')
+    parser.add_argument('--db', type=str, default='bmad_metrics.db', help='Path to SQLite database')
+    parser.add_argument('--raw-days', type=int, help='Override raw retention days for all tables')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Rows deleted per transaction')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be reclaimed')
+    parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                        help='Convert the database to incremental auto_vacuum (runs a full VACUUM)')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    policies = list(DEFAULT_POLICIES.values())
+    if args.raw_days is not None:
+        policies = [replace(p, raw_retention_days=args.raw_days) for p in policies]
+
+    engine = RetentionEngine(args.db, policies, batch_size=args.batch_size)
+
+    if args.enable_incremental_vacuum:
+        engine.enable_incremental_vacuum()
+
+    results = engine.run(dry_run=args.dry_run)
+    print(format_retention_report(results))
+
+if __name__ == '__main__':
+    main()
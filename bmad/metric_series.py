@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+BMAD In-Memory Metric Series
+Fixed-capacity ring buffers of recent metric values for live KPI checks and dashboards
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+
+from .lazy_imports import lazy_import
+
+np = lazy_import("numpy")
+
+Timestamp = Union[datetime, float, int]
+
+def to_epoch(timestamp: Timestamp) -> float:
+    """Convert a datetime or epoch value to epoch seconds"""
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+class MetricRingBuffer:
+    """Array-backed ring buffer of (timestamp, value) pairs for a single metric"""
+
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self._head = 0  # Next write position
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: Timestamp, value: float):
+        """Add a point, overwriting the oldest one when full (O(1))"""
+        self.timestamps[self._head] = to_epoch(timestamp)
+        self.values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def ordered(self) -> 'Tuple[np.ndarray, np.ndarray]':
+        """Return (timestamps, values) oldest first"""
+        if self._size < self.capacity:
+            return self.timestamps[:self._size], self.values[:self._size]
+
+        # Full buffer: the oldest point sits at the write head
+        return (
+            np.concatenate((self.timestamps[self._head:], self.timestamps[:self._head])),
+            np.concatenate((self.values[self._head:], self.values[:self._head]))
+        )
+
+    def window(self, seconds: Optional[float] = None, now: Optional[Timestamp] = None) -> 'Tuple[np.ndarray, np.ndarray]':
+        """Return the points inside the trailing window (all points when seconds is None)"""
+        timestamps, values = self.ordered()
+        if seconds is None or self._size == 0:
+            return timestamps, values
+
+        cutoff = (to_epoch(now) if now is not None else time.time()) - seconds
+        mask = timestamps >= cutoff
+        return timestamps[mask], values[mask]
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """Most recently appended (timestamp, value)"""
+        if self._size == 0:
+            return None
+        index = (self._head - 1) % self.capacity
+        return float(self.timestamps[index]), float(self.values[index])
+
+    def mean(self, seconds: Optional[float] = None, now: Optional[Timestamp] = None) -> Optional[float]:
+        """Mean value over the trailing window"""
+        _, values = self.window(seconds, now)
+        return float(values.mean()) if values.size else None
+
+    def percentile(self, q: float, seconds: Optional[float] = None,
+                   now: Optional[Timestamp] = None) -> Optional[float]:
+        """q-th percentile (0-100) over the trailing window"""
+        _, values = self.window(seconds, now)
+        return float(np.percentile(values, q)) if values.size else None
+
+    def rate_of_change(self, seconds: Optional[float] = None, now: Optional[Timestamp] = None,
+                       per: float = 3600.0) -> Optional[float]:
+        """Least-squares slope over the window, in value units per `per` seconds (default per hour)"""
+        timestamps, values = self.window(seconds, now)
+        if values.size < 2:
+            return None
+
+        t = timestamps - timestamps.mean()
+        denom = float(np.dot(t, t))
+        if denom == 0:
+            return None
+        return float(np.dot(t, values - values.mean()) / denom * per)
+
+class TimeSeriesStore:
+    """Thread-safe collection of ring buffers keyed by metric name"""
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self._series: Dict[str, MetricRingBuffer] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, metric_name: str) -> bool:
+        return metric_name in self._series
+
+    def append(self, metric_name: str, timestamp: Timestamp, value: float):
+        """Record a point for a metric"""
+        with self._lock:
+            series = self._series.get(metric_name)
+            if series is None:
+                series = self._series[metric_name] = MetricRingBuffer(self.capacity)
+            series.append(timestamp, value)
+
+    def get(self, metric_name: str) -> Optional[MetricRingBuffer]:
+        """Ring buffer for a metric, if any points were recorded"""
+        return self._series.get(metric_name)
+
+    def _query(self, metric_name: str, method: str, *args, **kwargs):
+        with self._lock:
+            series = self._series.get(metric_name)
+            if series is None:
+                return None
+            return getattr(series, method)(*args, **kwargs)
+
+    def count(self, metric_name: str, seconds: Optional[float] = None, now: Optional[Timestamp] = None) -> int:
+        """Number of points inside the trailing window"""
+        with self._lock:
+            series = self._series.get(metric_name)
+            if series is None:
+                return 0
+            return int(series.window(seconds, now)[1].size)
+
+    def mean(self, metric_name: str, seconds: Optional[float] = None, now: Optional[Timestamp] = None) -> Optional[float]:
+        """Windowed mean for a metric"""
+        return self._query(metric_name, "mean", seconds, now)
+
+    def percentile(self, metric_name: str, q: float, seconds: Optional[float] = None,
+                   now: Optional[Timestamp] = None) -> Optional[float]:
+        """Windowed percentile for a metric"""
+        return self._query(metric_name, "percentile", q, seconds, now)
+
+    def rate_of_change(self, metric_name: str, seconds: Optional[float] = None,
+                       now: Optional[Timestamp] = None, per: float = 3600.0) -> Optional[float]:
+        """Windowed slope for a metric"""
+        return self._query(metric_name, "rate_of_change", seconds, now, per)
+
+    def summary(self, metric_name: str, seconds: Optional[float] = None,
+                now: Optional[Timestamp] = None) -> Optional[Dict[str, float]]:
+        """Dashboard-friendly snapshot of one metric's recent history"""
+        with self._lock:
+            series = self._series.get(metric_name)
+            if series is None:
+                return None
+            _, values = series.window(seconds, now)
+            if not values.size:
+                return None
+
+            p50, p95 = np.percentile(values, [50, 95])
+            return {
+                "count": int(values.size),
+                "latest": series.latest()[1],
+                "mean": float(values.mean()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "rate_per_hour": series.rate_of_change(seconds, now)
+            }
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+BMAD Recommendation Ranking
+Streaming top-K selection of prioritized recommendations, overall and per category
+"""
+
+import heapq
+import itertools
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional
+
+class TopK:
+    """Bounded min-heap keeping the k highest-scoring items seen so far
+
+    Ties keep arrival order (earlier first), matching a stable descending sort.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+
+    def push(self, score: float, item: Any):
+        entry = (score, -next(self._seq), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def ranked(self, n: Optional[int] = None) -> List[Any]:
+        """Kept items, highest score first"""
+        entries = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [item for _, _, item in entries[:n]]
+
+class RankedRecommendations(Sequence):
+    """Recommendations in generation order plus per-category top-K heaps
+
+    Reads like a list for saving and counting; report writers ask for ranked
+    slices with top() instead of sorting the whole list. append, extend and
+    += are the only mutations, so the heaps always match the items. Items
+    need priority_score and category attributes (see _prioritize_recommendations).
+    """
+
+    def __init__(self, recommendations: Iterable = (), capacity: int = 10):
+        self.capacity = capacity
+        self._items: List = []
+        self._overall = TopK(capacity)
+        self._categories: Dict[str, TopK] = {}
+        self.extend(recommendations)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iadd__(self, recommendations: Iterable):
+        self.extend(recommendations)
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r}, capacity={self.capacity})"
+
+    def append(self, rec):
+        self._items.append(rec)
+        self._overall.push(rec.priority_score, rec)
+        if rec.category not in self._categories:
+            self._categories[rec.category] = TopK(self.capacity)
+        self._categories[rec.category].push(rec.priority_score, rec)
+
+    def extend(self, recommendations: Iterable):
+        for rec in recommendations:
+            self.append(rec)
+
+    def top(self, n: Optional[int] = None, category: Optional[str] = None) -> List:
+        """Highest priority recommendations, optionally within one category"""
+        n = self.capacity if n is None else n
+        selector = self._overall if category is None else self._categories.get(category)
+        if selector is None:
+            return []
+
+        if n <= self.capacity:
+            return selector.ranked(n)
+
+        # Deeper than the heaps keep: select from the full list without sorting it
+        candidates = self._items if category is None else (rec for rec in self._items if rec.category == category)
+        indexed = ((rec.priority_score, -i, rec) for i, rec in enumerate(candidates))
+        return [rec for _, _, rec in heapq.nlargest(n, indexed, key=lambda entry: entry[:2])]
+
+class SegmentedRecommendations(RankedRecommendations):
+    """Merged ranked view over per-segment recommendation lists
+
+    The merged list saves and ranks like any RankedRecommendations;
+    segments keeps each partition's own ranking by segment label.
+    """
+
+    def __init__(self, capacity: int = 10):
+        super().__init__(capacity=capacity)
+        self.segments: Dict[str, RankedRecommendations] = {}
+
+    def add_segment(self, label: str, recommendations: RankedRecommendations):
+        self.segments[label] = recommendations
+        self.extend(recommendations)
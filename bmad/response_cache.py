@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+BMAD Response Cache
+Disk-backed cache of connector fetches keyed by source, endpoint and date range,
+with TTL, size-based eviction and record/replay modes for offline runs
+"""
+
+import os
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("live", "record", "replay", "off")
+CACHE_MODE_ENV = "BMAD_CACHE_MODE"
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a fetch was never recorded"""
+
+class ResponseCache:
+    """Cache for connector responses
+
+    Modes:
+        live    serve entries younger than the TTL, fetch and store otherwise
+        record  always fetch and store (refreshes recordings)
+        replay  never fetch; serve stored entries regardless of age, CacheMiss otherwise
+        off     pass every call straight through
+
+    Entries are pickled into a SQLite file inside cache_dir; only use it for
+    data this process fetched itself.
+    """
+
+    def __init__(self, cache_dir: str = "measure_data/response_cache", mode: str = "live",
+                 ttl_seconds: float = 6 * 3600, max_bytes: int = 256 * 1024 * 1024):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r}; expected one of {', '.join(CACHE_MODES)}")
+
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "responses.db"
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        if mode != "off":
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.init_database()
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "ResponseCache":
+        """Build a cache whose mode comes from BMAD_CACHE_MODE (default live)"""
+        kwargs.setdefault("mode", os.environ.get(CACHE_MODE_ENV, "live"))
+        return cls(**kwargs)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def init_database(self):
+        """Create the entry table"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                range_start TEXT,
+                range_end TEXT,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def make_key(source: str, endpoint: str, range_start: Any, range_end: Any,
+                 params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable key for one fetch"""
+        raw = json.dumps([source, endpoint, str(range_start), str(range_end), params or {}],
+                         sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Any:
+        """Stored value for a key, or CacheMiss (expired entries count as misses)"""
+        conn = self._connect()
+        row = conn.execute("SELECT payload, created_at FROM responses WHERE cache_key = ?", (key,)).fetchone()
+        if row is None or (max_age is not None and time.time() - row[1] > max_age):
+            conn.close()
+            raise CacheMiss(key)
+
+        conn.execute("UPDATE responses SET last_access = ? WHERE cache_key = ?", (time.time(), key))
+        conn.commit()
+        conn.close()
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any, source: str, endpoint: str, range_start: Any, range_end: Any):
+        """Store a value, then evict least recently used entries beyond max_bytes"""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+
+        conn = self._connect()
+        conn.execute('''
+            INSERT OR REPLACE INTO responses
+                (cache_key, source, endpoint, range_start, range_end, payload, size, created_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (key, source, endpoint, str(range_start), str(range_end), payload, len(payload), now, now))
+        conn.commit()
+        self._evict(conn)
+        conn.close()
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for key, size in conn.execute("SELECT cache_key, size FROM responses ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        conn.commit()
+        self.stats["evictions"] += evicted
+        logger.debug(f"Evicted {evicted} cached responses")
+
+    def fetch(self, source: str, endpoint: str, range_start: Any, range_end: Any,
+              fetcher: Callable[[], Any], params: Optional[Dict[str, Any]] = None) -> Any:
+        """Return a cached response for the fetch, calling fetcher according to the mode"""
+        if self.mode == "off":
+            return fetcher()
+
+        key = self.make_key(source, endpoint, range_start, range_end, params)
+
+        if self.mode in ("live", "replay"):
+            try:
+                value = self.get(key, max_age=self.ttl_seconds if self.mode == "live" else None)
+                self.stats["hits"] += 1
+                return value
+            except CacheMiss:
+                self.stats["misses"] += 1
+                if self.mode == "replay":
+                    raise CacheMiss(f"No recording for {source} {endpoint} {range_start}..{range_end}")
+
+        value = fetcher()
+        self.put(key, value, source, endpoint, range_start, range_end)
+        return value
+
+    def purge_expired(self) -> int:
+        """Delete entries older than the TTL"""
+        conn = self._connect()
+        cursor = conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        conn.commit()
+        conn.close()
+        return cursor.rowcount
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+        conn.close()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+BMAD Scheduler
+Event-driven job scheduler with a worker pool, overlap protection and persisted
+last-run state so missed runs are caught up after a restart
+"""
+
+import heapq
+import sqlite3
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A trigger maps the previous due time to the next one
+Trigger = Callable[[datetime], datetime]
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# Longest single sleep; guards against wall-clock jumps (suspend, DST) without polling
+MAX_SLEEP_SECONDS = 900
+
+def _parse_time(at: str) -> Tuple[int, int]:
+    hour, minute = (int(part) for part in at.split(":"))
+    return hour, minute
+
+def daily_at(at: str) -> Trigger:
+    """Every day at HH:MM local time"""
+    hour, minute = _parse_time(at)
+
+    def next_run(after: datetime) -> datetime:
+        candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return candidate if candidate > after else candidate + timedelta(days=1)
+    return next_run
+
+def weekly_at(weekday: str, at: str) -> Trigger:
+    """Every week on a weekday at HH:MM local time"""
+    target_day = WEEKDAYS.index(weekday.lower())
+    hour, minute = _parse_time(at)
+
+    def next_run(after: datetime) -> datetime:
+        candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        candidate += timedelta(days=(target_day - candidate.weekday()) % 7)
+        return candidate if candidate > after else candidate + timedelta(days=7)
+    return next_run
+
+def every(interval: timedelta) -> Trigger:
+    """Fixed interval after the previous run"""
+    if interval <= timedelta(0):
+        raise ValueError("interval must be positive")
+    return lambda after: after + interval
+
+@dataclass
+class Job:
+    """A scheduled callable"""
+    name: str
+    func: Callable[[], object]
+    trigger: Trigger
+    catch_up: bool = True  # Run once immediately if a due time passed while stopped
+
+@dataclass
+class JobRun:
+    """Outcome of one job execution"""
+    job_name: str
+    started_at: datetime
+    duration_seconds: float
+    status: str  # "success", "failed", "skipped_overlap"
+    error: Optional[str] = None
+
+class Scheduler:
+    """Sleeps until the next due job and runs it on a worker pool
+
+    A job never overlaps itself: if it is still running when it comes due again,
+    that occurrence is skipped. Last-run state lives in scheduler_state so a
+    restarted scheduler runs each overdue job once and then resumes its cadence.
+    on_run receives every JobRun (e.g. to record durations as metrics).
+    """
+
+    def __init__(self, state_db: str, max_workers: int = 4,
+                 on_run: Optional[Callable[[JobRun], None]] = None):
+        self.state_db = state_db
+        self.max_workers = max_workers
+        self.on_run = on_run
+        self.jobs: Dict[str, Job] = {}
+        self.last_runs: Dict[str, JobRun] = {}
+
+        self._queue: List[Tuple[datetime, int, str]] = []
+        self._seq = 0
+        self._running: set = set()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.init_database()
+
+    def init_database(self):
+        """Create the run-state table"""
+        conn = sqlite3.connect(self.state_db)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scheduler_state (
+                job_name TEXT PRIMARY KEY,
+                last_run_at TEXT,
+                last_duration_seconds REAL,
+                last_status TEXT,
+                last_error TEXT,
+                run_count INTEGER DEFAULT 0
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def load_last_run_at(self, job_name: str) -> Optional[datetime]:
+        conn = sqlite3.connect(self.state_db)
+        row = conn.execute("SELECT last_run_at FROM scheduler_state WHERE job_name = ?", (job_name,)).fetchone()
+        conn.close()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def save_run(self, run: JobRun):
+        """Persist a finished run"""
+        conn = sqlite3.connect(self.state_db, timeout=30)
+        conn.execute('''
+            INSERT INTO scheduler_state (job_name, last_run_at, last_duration_seconds, last_status, last_error, run_count)
+            VALUES (?, ?, ?, ?, ?, 1)
+            ON CONFLICT (job_name) DO UPDATE SET
+                last_run_at = excluded.last_run_at,
+                last_duration_seconds = excluded.last_duration_seconds,
+                last_status = excluded.last_status,
+                last_error = excluded.last_error,
+                run_count = run_count + 1
+        ''', (run.job_name, run.started_at.isoformat(), run.duration_seconds, run.status, run.error))
+        conn.commit()
+        conn.close()
+
+    def add_job(self, name: str, func: Callable[[], object], trigger: Trigger, catch_up: bool = True):
+        """Register a job; its first due time accounts for persisted state"""
+        job = Job(name, func, trigger, catch_up)
+        self.jobs[name] = job
+
+        now = datetime.now()
+        last_run_at = self.load_last_run_at(name)
+        if last_run_at is None:
+            due = trigger(now)
+        else:
+            due = trigger(last_run_at)
+            if due <= now:
+                due = now if catch_up else trigger(now)
+                if catch_up:
+                    logger.info(f"Job {name} missed its run at {trigger(last_run_at):%Y-%m-%d %H:%M}; catching up")
+
+        self._push(due, name)
+
+    def _push(self, due: datetime, name: str):
+        with self._condition:
+            self._seq += 1
+            heapq.heappush(self._queue, (due, self._seq, name))
+            self._condition.notify()
+
+    def next_due(self) -> Optional[Tuple[datetime, str]]:
+        """Earliest pending (due time, job name)"""
+        with self._condition:
+            return (self._queue[0][0], self._queue[0][2]) if self._queue else None
+
+    def _execute(self, job: Job):
+        started_at = datetime.now()
+        start = time.perf_counter()
+        status, error = "success", None
+        try:
+            job.func()
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Job {job.name} failed: {e}")
+        finally:
+            with self._condition:
+                self._running.discard(job.name)
+
+        self._finish(JobRun(job.name, started_at, time.perf_counter() - start, status, error))
+
+    def _finish(self, run: JobRun):
+        self.last_runs[run.job_name] = run
+        if run.status != "skipped_overlap":
+            self.save_run(run)
+        logger.info(f"Job {run.job_name} {run.status} in {run.duration_seconds:.2f}s")
+
+        if self.on_run:
+            try:
+                self.on_run(run)
+            except Exception as e:
+                logger.error(f"Scheduler on_run hook failed for {run.job_name}: {e}")
+
+    def _dispatch(self, name: str, due: datetime):
+        """Start a due job (unless it is still running) and queue its next occurrence"""
+        job = self.jobs[name]
+
+        with self._condition:
+            overlapping = name in self._running
+            if not overlapping:
+                self._running.add(name)
+
+        if overlapping:
+            logger.warning(f"Job {name} still running; skipping the {due:%Y-%m-%d %H:%M} run")
+            self._finish(JobRun(name, datetime.now(), 0.0, "skipped_overlap"))
+        else:
+            self._executor.submit(self._execute, job)
+
+        # Never queue a time that is already past (e.g. after a long sleep)
+        now = datetime.now()
+        next_run = job.trigger(due)
+        if next_run <= now:
+            next_run = job.trigger(now)
+        self._push(next_run, name)
+
+    def run_forever(self):
+        """Block and run jobs until stop() is called"""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scheduler")
+        logger.info(f"Scheduler started with {len(self.jobs)} jobs")
+
+        try:
+            while True:
+                with self._condition:
+                    if self._stopped:
+                        break
+                    if not self._queue:
+                        self._condition.wait(MAX_SLEEP_SECONDS)
+                        continue
+
+                    due, _, name = self._queue[0]
+                    delay = (due - datetime.now()).total_seconds()
+                    if delay > 0:
+                        self._condition.wait(min(delay, MAX_SLEEP_SECONDS))
+                        continue
+
+                    heapq.heappop(self._queue)
+
+                self._dispatch(name, due)
+        finally:
+            self._executor.shutdown(wait=True)
+            logger.info("Scheduler stopped")
+
+    def start(self) -> threading.Thread:
+        """Run the scheduler on a background thread"""
+        self._thread = threading.Thread(target=self.run_forever, name="bmad-scheduler", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, wait: bool = True):
+        """Stop dispatching; running jobs are allowed to finish"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if wait and self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
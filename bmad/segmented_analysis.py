@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+BMAD Segmented Analysis
+Decision rules evaluated per campaign (and optional dimension segment) on a process pool
+"""
+
+import sqlite3
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .decision_rules import RuleSet
+from .metric_pivot import MetricPivot
+from .metric_queries import Segment, cutoff_timestamp, load_aggregated, load_rollup_aggregated
+
+logger = logging.getLogger(__name__)
+
+def ensure_campaign_index(conn: sqlite3.Connection):
+    """(campaign_id, metric_name, timestamp) index that serves per-campaign prefix scans"""
+    try:
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_metrics_campaign_name_timestamp
+            ON metrics (campaign_id, metric_name, timestamp)
+        ''')
+        conn.commit()
+    except sqlite3.OperationalError as e:  # Read-only database
+        logger.debug(f"Could not create metrics campaign index: {e}")
+
+def discover_segments(conn: sqlite3.Connection, segment_key: Optional[str] = None,
+                      days_back: int = 30) -> List[Segment]:
+    """Campaigns (or campaign x segment_key values) with metrics in the window"""
+    cutoff = cutoff_timestamp(days_back)
+
+    if segment_key is None:
+        cursor = conn.execute('''
+            SELECT DISTINCT campaign_id FROM metrics WHERE timestamp >= ?
+        ''', (cutoff,))
+        segments = [Segment(campaign_id) for (campaign_id,) in cursor]
+    else:
+        cursor = conn.execute('''
+            SELECT DISTINCT m.campaign_id, dv.dim_value
+            FROM dimension_values dv
+            JOIN metrics m ON m.dimension_set_id = dv.dimension_set_id
+            WHERE dv.dim_key = ? AND m.timestamp >= ?
+        ''', (segment_key, cutoff))
+        segments = [Segment(campaign_id, segment_key, dim_value) for campaign_id, dim_value in cursor]
+
+    return sorted(segments, key=lambda segment: segment.label)
+
+def analyze_segment(metrics_db_path: str, rules: RuleSet, segment: Segment,
+                    days_back: int = 30, use_rollup: bool = True) -> List[Dict[str, Any]]:
+    """Rendered fields of every rule that fires for one segment (runs in a worker process)
+
+    Reads the daily rollup, which the caller refreshes once before fanning
+    out; use_rollup False aggregates the segment's raw rows instead.
+    """
+    load = load_rollup_aggregated if use_rollup else load_aggregated
+    conn = sqlite3.connect(f"file:{metrics_db_path}?mode=ro", uri=True)
+    try:
+        df = load(conn, rules.metric_requirements, days_back, segment)
+    finally:
+        conn.close()
+
+    if df.empty:
+        return []
+    return rules.evaluate(MetricPivot(df))
+
+def analyze_segments(metrics_db_path: str, rules: RuleSet, segments: List[Segment],
+                     max_workers: Optional[int] = None, days_back: int = 30,
+                     use_rollup: bool = True) -> Dict[Segment, List[Dict[str, Any]]]:
+    """Evaluate the rules for every segment, one segment per pool task
+
+    Workers open their own read-only connection and return plain rule
+    fields, so only the rule set and the results cross process boundaries.
+    A single segment is evaluated in-process.
+    """
+    if len(segments) <= 1 or max_workers == 1:
+        return {segment: analyze_segment(metrics_db_path, rules, segment, days_back, use_rollup)
+                for segment in segments}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(analyze_segment, metrics_db_path, rules, segment, days_back, use_rollup)
+            for segment in segments
+        ]
+        return {segment: future.result() for segment, future in zip(segments, futures)}
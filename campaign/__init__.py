@@ -0,0 +1,3 @@
+"""
+Campaign automation - proposal generation and the pricing calculator webhook
+"""
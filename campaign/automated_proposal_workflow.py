@@ -396,7 +396,7 @@ class ProposalGenerator:
         # TODO: Implement actual CRM API calls
         logger.info(f"CRM data prepared: {json.dumps(crm_data, indent=2)}")
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Command line interface for proposal generation"""
     parser = argparse.ArgumentParser(description='Generate automated proposals')
     parser.add_argument('--webhook-data', type=str, help='JSON file with webhook data')
@@ -405,7 +405,7 @@ def main():
     parser.add_argument('--selections', type=str, help='JSON file with pricing selections')
     parser.add_argument('--test', action='store_true', help='Run in test mode')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     generator = ProposalGenerator()
     
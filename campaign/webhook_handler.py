@@ -9,9 +9,10 @@ import json
 import os
 import logging
 from datetime import datetime
+from typing import List, Optional
 import hmac
 import hashlib
-from automated_proposal_workflow import ProposalGenerator
+from .automated_proposal_workflow import ProposalGenerator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -334,8 +335,18 @@ def test_form():
     """
     return render_template_string(form_html)
 
-if __name__ == '__main__':
-    port = int(os.getenv('PORT', 5000))
+def main(argv: Optional[List[str]] = None):
+    """Run the webhook server"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Pricing calculator webhook server')
+    parser.add_argument('--host', type=str, default='0.0.0.0', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=int(os.getenv('PORT', 5000)), help='Port to listen on (default: $PORT or 5000)')
+    
+    args = parser.parse_args(argv)
     debug = os.getenv('FLASK_ENV') == 'development'
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
\ No newline at end of file
+    app.run(host=args.host, port=args.port, debug=debug)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -93,7 +93,7 @@ init_bmad() {
     print_status "Initializing BMAD tracking system..."
     
     if [ ! -f "bmad_tracking.db" ]; then
-        python3 bmad_tracking_system.py --init
+        python3 -m bmad track --init
         print_status "BMAD system initialized with baseline metrics"
     else
         print_status "BMAD system already initialized"
@@ -333,13 +333,13 @@ start_campaign() {
     
     # Generate current performance report
     print_status "Generating current performance report..."
-    python3 bmad_tracking_system.py --report > /dev/null 2>&1 || {
+    python3 -m bmad track --report > /dev/null 2>&1 || {
         print_warning "Could not generate performance report"
     }
     
     # Test proposal generation system
     print_status "Testing proposal generation system..."
-    python3 bmad_tracking_system.py --test-proposal > /dev/null 2>&1 || {
+    python3 -m bmad track --test-proposal > /dev/null 2>&1 || {
         print_warning "Proposal system test had issues"
     }
     
@@ -364,8 +364,8 @@ show_status() {
     # Check for key files
     echo "📁 Core Components:"
     [ -f "components/PricingCalculator.tsx" ] && echo "  ✅ Enhanced Pricing Calculator" || echo "  ❌ Pricing Calculator missing"
-    [ -f "campaign/automated-proposal-workflow.py" ] && echo "  ✅ ROI Proposal Generation" || echo "  ❌ Proposal system missing"
-    [ -f "bmad_tracking_system.py" ] && echo "  ✅ BMAD Tracking System" || echo "  ❌ Tracking system missing"
+    [ -f "campaign/automated_proposal_workflow.py" ] && echo "  ✅ ROI Proposal Generation" || echo "  ❌ Proposal system missing"
+    [ -f "bmad/bmad_tracking_system.py" ] && echo "  ✅ BMAD Tracking System" || echo "  ❌ Tracking system missing"
     
     echo ""
     echo "🗄️ Data Systems:"
@@ -469,7 +469,7 @@ record_metric() {
     fi
     
     print_status "Recording metric: $1 = $2"
-    python3 bmad_tracking_system.py --record-metric "$1" "$2"
+    python3 -m bmad track --record-metric "$1" "$2"
 }
 
 # Main script logic
@@ -526,11 +526,11 @@ main() {
             ;;
         "report")
             print_status "Generating performance report..."
-            python3 bmad_tracking_system.py --report
+            python3 -m bmad track --report
             ;;
         "proposal-test")
             print_status "Testing proposal generation..."
-            python3 bmad_tracking_system.py --test-proposal
+            python3 -m bmad track --test-proposal
             ;;
         "metric")
             shift  # Remove 'metric' from arguments
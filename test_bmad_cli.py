@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test BMAD CLI - Package entry point dispatching subcommands in one process
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from bmad.__main__ import COMMANDS, main, run
+
+REPO_DIR = Path(__file__).parent
+
+def test_help_lists_every_command():
+    result = subprocess.run([sys.executable, "-m", "bmad", "--help"], cwd=REPO_DIR,
+                            capture_output=True, text=True, check=True)
+
+    for command in ("measure", "decide", "orchestrate", "track", "webhook"):
+        assert command in COMMANDS and f"  {command} " in result.stdout
+
+def test_commands_run_in_process_and_reuse_loaded_modules(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+
+    run("decide", ["--report"])
+    module = sys.modules["bmad.decide_workflow_system"]
+    run("decide", ["--report"])
+
+    assert sys.modules["bmad.decide_workflow_system"] is module
+    assert "BMAD Decision Report" in capsys.readouterr().out
+    assert list((tmp_path / "reports").glob("decision_report_*.md"))
+
+def test_unknown_command_is_rejected(capsys):
+    assert main(["bogus"]) == 2
+    assert "Unknown command: bogus" in capsys.readouterr().err
+
+    with pytest.raises(ValueError):
+        run("bogus")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Daily Report - Incremental rollup refresh against a full recompute
+"""
+
+import random
+import sqlite3
+import threading
+
+from bmad.daily_report import DailyRollup
+from bmad.measure_tracking_system import MeasureTracker
+
+FULL_RECOMPUTE = '''
+    SELECT substr(timestamp, 1, 10) AS day, source, metric_name,
+           COUNT(*), SUM(metric_value), MIN(metric_value), MAX(metric_value),
+           (SELECT metric_value FROM metrics latest
+            WHERE substr(latest.timestamp, 1, 10) = substr(m.timestamp, 1, 10)
+              AND latest.source = m.source AND latest.metric_name = m.metric_name
+            ORDER BY latest.timestamp DESC, latest.id DESC LIMIT 1)
+    FROM metrics m
+    GROUP BY day, source, metric_name
+'''
+
+def insert_metrics(path, rows):
+    conn = sqlite3.connect(path)
+    conn.executemany('''
+        INSERT INTO metrics (timestamp, metric_name, metric_value, source, campaign_id) VALUES (?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+
+def random_rows(rng, count):
+    """Out-of-order samples spread over a few days, sources, metrics and campaigns"""
+    return [(f"2026-10-{rng.randint(10, 13)} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00",
+             rng.choice(["sessions", "conversion_rate"]), float(rng.randint(1, 500)), rng.choice(["ga4", "crm"]),
+             rng.choice(["spring", "fall", None]))
+            for _ in range(count)]
+
+def assert_matches_full_recompute(path):
+    conn = sqlite3.connect(path)
+    expected = {row[:3]: row[3:] for row in conn.execute(FULL_RECOMPUTE)}
+    # The rollup is finer (per campaign); add its rows back up to the report's grain
+    rollup = {row[:3]: row[3:] for row in conn.execute('''
+        SELECT day, source, metric_name, SUM(sample_count), SUM(value_sum), MIN(value_min), MAX(value_max),
+               (SELECT last_value FROM daily_metric_rollup latest
+                WHERE latest.day = r.day AND latest.source = r.source AND latest.metric_name = r.metric_name
+                ORDER BY latest.last_timestamp DESC LIMIT 1)
+        FROM daily_metric_rollup r
+        GROUP BY day, source, metric_name
+    ''')}
+    conn.close()
+    assert rollup == expected
+
+def test_incremental_refresh_matches_full_recompute(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    MeasureTracker(path)
+    rng = random.Random(7)
+    rollup = DailyRollup()
+
+    touched = set()
+    for _ in range(5):
+        insert_metrics(path, random_rows(rng, 40))
+        conn = sqlite3.connect(path)
+        touched |= rollup.refresh(conn)
+        conn.close()
+
+    assert touched == {"2026-10-10", "2026-10-11", "2026-10-12", "2026-10-13"}
+    assert_matches_full_recompute(path)
+
+    conn = sqlite3.connect(path)
+    assert rollup.refresh(conn) == set()
+    conn.close()
+    assert_matches_full_recompute(path)
+
+def test_concurrent_refreshes_fold_each_row_once(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    MeasureTracker(path)
+    insert_metrics(path, random_rows(random.Random(11), 500))
+
+    start = threading.Barrier(4)
+    errors = []
+
+    def refresh():
+        conn = sqlite3.connect(path, timeout=30)
+        try:
+            start.wait()
+            DailyRollup().refresh(conn)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=refresh) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert_matches_full_recompute(path)
+
+def test_rollup_without_campaign_key_is_rebuilt(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    MeasureTracker(path)
+    insert_metrics(path, random_rows(random.Random(3), 50))
+
+    # A rollup keyed by (day, source, metric) only, already caught up
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE daily_metric_rollup")
+    conn.execute('''
+        CREATE TABLE daily_metric_rollup (
+            day TEXT NOT NULL, source TEXT NOT NULL, metric_name TEXT NOT NULL,
+            sample_count INTEGER NOT NULL, value_sum REAL NOT NULL, value_min REAL, value_max REAL,
+            last_value REAL, last_timestamp TEXT, PRIMARY KEY (day, source, metric_name)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute("INSERT INTO rollup_watermarks (name, last_id) VALUES ('daily_metric_rollup', 50)")
+    conn.commit()
+
+    DailyRollup.init_schema(conn.cursor())
+    conn.commit()
+    assert DailyRollup().refresh(conn)
+    conn.close()
+    assert_matches_full_recompute(path)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Decide Workflow - Incremental analysis, recommendation storage and decision status
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from bmad.bmad_integration_system import BMADOrchestrator
+from bmad.decide_workflow_system import DecisionEngine, DecisionRecommendation, DecisionType, Priority
+from bmad.measure_tracking_system import CampaignMetric, MeasureTracker
+
+def insert_metrics(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS metrics (
+            id INTEGER PRIMARY KEY, timestamp DATETIME, metric_name TEXT,
+            metric_value REAL, source TEXT, campaign_id TEXT, dimension_set_id INTEGER
+        )
+    ''')
+    conn.executemany("INSERT INTO metrics (timestamp, metric_name, metric_value, source) VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+def test_analysis_folds_only_new_rows_into_persisted_aggregates(tmp_path):
+    metrics_db = str(tmp_path / "metrics.db")
+    engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    now = datetime.now(timezone.utc)
+    yesterday = (now - timedelta(days=1)).isoformat(" ")
+
+    insert_metrics(metrics_db, [(yesterday, "ga4_bounce_rate", 40.0, "ga4"),
+                                (yesterday, "email_open_rate", 45.0, "mailchimp")])
+    assert [r.id for r in engine.analyze_performance_data(metrics_db)] == []
+
+    conn = sqlite3.connect(metrics_db)
+    assert conn.execute("SELECT last_id FROM rollup_watermarks").fetchone() == (2,)
+    conn.close()
+
+    # Only the newly ingested rows are folded in; the latest bounce rate now fires a rule
+    insert_metrics(metrics_db, [(now.isoformat(" "), "ga4_bounce_rate", 72.0, "ga4")])
+    recommendations = engine.analyze_performance_data(metrics_db)
+
+    assert [r.id for r in recommendations] == ["reduce_bounce_rate"]
+    assert recommendations[0].supporting_data == {"current_bounce_rate": 72.0}
+
+    conn = sqlite3.connect(metrics_db)
+    assert conn.execute("SELECT last_id FROM rollup_watermarks").fetchone() == (3,)
+    assert conn.execute("SELECT SUM(sample_count) FROM daily_metric_rollup").fetchone() == (3,)
+    conn.close()
+
+def test_segmented_analysis_ranks_each_campaign_and_merges(tmp_path):
+    metrics_db = str(tmp_path / "metrics.db")
+    tracker = MeasureTracker(metrics_db)
+    engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    now = datetime.now()
+
+    def metric(name, value, campaign_id, tier, minutes_ago=0):
+        return CampaignMetric(now - timedelta(minutes=minutes_ago), name, value, "gauge", name.split("_")[0], {"tier": tier}, campaign_id)
+
+    tracker.record_batch_metrics([
+        metric("ga4_bounce_rate", 72.0, "spring", "smb"),
+        metric("ga4_bounce_rate", 40.0, "spring", "enterprise", minutes_ago=5),
+        metric("email_open_rate", 20.0, "fall", "smb"),
+    ], evaluate_alerts=False)
+
+    by_campaign = engine.analyze_segmented_performance_data(metrics_db, max_workers=2)
+    assert sorted(by_campaign.segments) == ["fall", "spring"]
+    assert [r.id for r in by_campaign.segments["fall"]] == ["improve_email_open_rates@fall"]
+    # The spring campaign's latest bounce rate of the day fires its own rule
+    assert [r.id for r in by_campaign.segments["spring"]] == ["reduce_bounce_rate@spring"]
+    assert [r.id for r in by_campaign.top()] == ["reduce_bounce_rate@spring", "improve_email_open_rates@fall"]
+
+    by_tier = engine.analyze_segmented_performance_data(metrics_db, segment_key="tier", max_workers=2)
+    assert sorted(by_tier.segments) == ["fall/tier=smb", "spring/tier=enterprise", "spring/tier=smb"]
+    assert [r.id for r in by_tier.segments["spring/tier=enterprise"]] == []
+    assert by_tier.segments["spring/tier=smb"][0].supporting_data == {"current_bounce_rate": 72.0,
+                                                                       "segment": "spring/tier=smb"}
+    assert engine.save_recommendations(by_tier) == 2
+
+def make_recommendation(rec_id, impact=12.0, created_at=None):
+    return DecisionRecommendation(
+        id=rec_id, title=f"Fix {rec_id}", description="Below benchmark",
+        decision_type=DecisionType.TACTICAL_OPTIMIZATION, priority=Priority.HIGH,
+        estimated_impact=impact, confidence_level=0.8, implementation_effort="low",
+        implementation_timeline=7, required_resources=["dev"], success_metrics=[f"Improve {rec_id}"],
+        risk_factors=[], supporting_data={"current_rate": 10.0},
+        created_at=created_at or datetime.now(), created_by="test"
+    )
+
+def test_save_recommendations_rewrites_only_changed_content(tmp_path):
+    engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    first_seen = datetime(2026, 10, 1, 9, 0)
+    assert engine.save_recommendations([make_recommendation("bounce", created_at=first_seen),
+                                        make_recommendation("email", created_at=first_seen)]) == 2
+
+    # Regenerated on a later run: same content keeps its row, a new impact rewrites it
+    later = datetime(2026, 10, 2, 9, 0)
+    assert engine.save_recommendations([make_recommendation("bounce", created_at=later),
+                                        make_recommendation("email", impact=20.0, created_at=later)]) == 1
+
+    conn = sqlite3.connect(engine.db_path)
+    rows = dict(conn.execute("SELECT id, estimated_impact || ' ' || created_at FROM recommendations"))
+    last_seen = dict(conn.execute("SELECT id, last_seen_at FROM recommendations"))
+    conn.close()
+    assert rows == {"bounce": f"12.0 {first_seen}", "email": f"20.0 {later}"}
+    assert last_seen == {"bounce": str(later), "email": str(later)}
+
+def latest_status(engine, rec_id):
+    conn = sqlite3.connect(engine.db_path)
+    row = conn.execute('''
+        SELECT s.decision, s.status, d.decision_rationale FROM recommendation_status s
+        JOIN decisions d ON d.id = s.decision_id WHERE s.recommendation_id = ?
+    ''', (rec_id,)).fetchone()
+    conn.close()
+    return row
+
+def test_recommendation_status_follows_the_latest_decision(tmp_path):
+    engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    engine.save_recommendations([make_recommendation("bounce")])
+
+    engine.make_decision("bounce", "defer", "Wait for more data", "alex")
+    assert latest_status(engine, "bounce") == ("defer", "pending_approval", "Wait for more data")
+    engine.make_decision("bounce", "approve", "Clear win", "alex", approved_budget=500)
+    assert latest_status(engine, "bounce") == ("approve", "approved", "Clear win")
+    engine.make_decision("bounce", "reject", "Superseded", "sam")
+    assert latest_status(engine, "bounce") == ("reject", "cancelled", "Superseded")
+
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM decisions").fetchone() == (3,)
+    assert conn.execute("SELECT COUNT(*) FROM recommendation_status").fetchone() == (1,)
+
+    # A database from before the status table is seeded from its decision history
+    conn.execute("DROP TABLE recommendation_status")
+    conn.commit()
+    conn.close()
+    assert latest_status(DecisionEngine(engine.db_path), "bounce") == ("reject", "cancelled", "Superseded")
+
+def test_integration_reads_approved_tasks_and_pending_from_latest_status(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = BMADOrchestrator(str(tmp_path / "bmad_config.json"))
+    engine = orchestrator.decision_engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    engine.save_recommendations([make_recommendation(rec_id, impact)
+                                 for rec_id, impact in (("bounce", 30.0), ("email", 20.0),
+                                                        ("funnel", 10.0), ("leads", 5.0))])
+
+    engine.make_decision("bounce", "approve", "Clear win", "alex", approved_budget=500, assigned_team=["web"])
+    engine.make_decision("email", "approve", "Try it", "alex")
+    engine.make_decision("email", "reject", "Changed our mind", "sam")
+    engine.make_decision("funnel", "defer", "Needs design", "alex")
+
+    # Only the latest decision counts: email's earlier approval is not a build task
+    tasks = orchestrator.get_approved_build_tasks()
+    assert [(t["id"], t["budget"], t["team"], t["resources"]) for t in tasks] == [("bounce", 500, ["web"], ["dev"])]
+
+    # Pending lists only recommendations without a decision; decided ones drop out
+    report = engine.generate_decision_report()
+    pending = report[report.index("Pending"):report.index("Recent")]
+    assert "Fix leads" in pending
+    assert not any(f"Fix {rec_id}" in pending for rec_id in ("bounce", "email", "funnel"))
+
+def test_approved_tasks_include_recommendations_still_produced_after_30_days(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    orchestrator = BMADOrchestrator(str(tmp_path / "bmad_config.json"))
+    engine = orchestrator.decision_engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    first_seen = datetime.now() - timedelta(days=45)
+    engine.save_recommendations([make_recommendation(rec_id, created_at=first_seen) for rec_id in ("bounce", "email")])
+    engine.make_decision("bounce", "approve", "Clear win", "alex")
+    engine.make_decision("email", "approve", "Try it", "alex")
+
+    # Today's run produces bounce again unchanged; email is no longer produced
+    assert engine.save_recommendations([make_recommendation("bounce")]) == 0
+
+    assert [task["id"] for task in orchestrator.get_approved_build_tasks()] == ["bounce"]
+
+def test_analyze_phase_ranks_each_campaign_segment(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "bmad_config.json").write_text(json.dumps({
+        "analysis": {"segment_key": "tier", "max_workers": 1},
+        "email_notifications": {"enabled": False}
+    }))
+    orchestrator = BMADOrchestrator(str(tmp_path / "bmad_config.json"))
+    engine = orchestrator.decision_engine = DecisionEngine(str(tmp_path / "decisions.db"))
+    now = datetime.now()
+    orchestrator.measure_system.tracker.record_batch_metrics([
+        CampaignMetric(now, "ga4_bounce_rate", 72.0, "gauge", "ga4", {"tier": "smb"}, "spring"),
+        CampaignMetric(now, "ga4_bounce_rate", 40.0, "gauge", "ga4", {"tier": "enterprise"}, "spring"),
+    ], evaluate_alerts=False)
+
+    cycle_id = orchestrator.start_new_cycle("cycle")
+    orchestrator.current_cycle.phase = "measure"
+    assert orchestrator.execute_analyze_phase() is True
+
+    assert orchestrator.current_cycle.decisions_pending == 1
+    conn = sqlite3.connect(engine.db_path)
+    assert conn.execute("SELECT id FROM recommendations").fetchall() == [("reduce_bounce_rate@spring/tier=smb",)]
+    conn.close()
+    report = (tmp_path / "bmad_cycles" / cycle_id / "analyze" / "analysis_report.md").read_text()
+    assert "- **spring/tier=enterprise:** 0 recommendations\n" in report
+    assert "- **spring/tier=smb:** 1 recommendations - top: Reduce" in report
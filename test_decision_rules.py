@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Decision Rules - Declarative rules compiled into a vectorized evaluator
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from bmad.decision_rules import RuleSet, load_rules, metric_prefixes
+from bmad.metric_pivot import MetricPivot
+from bmad.metric_queries import MetricRequirement
+
+def make_pivot():
+    rows = [
+        ("2026-01-01", "funnel_landing_page_views", 1000.0),
+        ("2026-01-01", "funnel_calculator_starts", 300.0),
+        ("2026-01-02", "funnel_landing_page_views", 1000.0),
+        ("2026-01-02", "funnel_calculator_starts", 100.0),
+        ("2026-01-02", "ga4_bounce_rate", 72.5),
+        ("2026-01-02", "email_open_rate", 41.0),
+        ("2026-01-02", "crm_leads_created", 0.0),
+        ("2026-01-02", "crm_leads_qualified", 0.0),
+    ]
+    return MetricPivot(pd.DataFrame(rows, columns=["timestamp", "metric_name", "metric_value"]))
+
+def test_default_rules_fire_on_thresholds_and_skip_missing_data():
+    fired = {fields["id"]: fields for fields in RuleSet().evaluate(make_pivot())}
+
+    # Funnel start rate 10% < 25% * 0.8; bounce 72.5 > 60; open rate 41 is fine;
+    # zero leads and absent downstream funnel stages never fire
+    assert set(fired) == {"funnel_optimization_funnel_landing_page_views_to_funnel_calculator_starts",
+                          "reduce_bounce_rate"}
+
+    funnel = fired["funnel_optimization_funnel_landing_page_views_to_funnel_calculator_starts"]
+    assert funnel["supporting_data"] == {"current_rate": 10.0, "benchmark": 25.0,
+                                         "improvement_needed": 15.0, "rate_change": -20.0}
+    assert funnel["success_metrics"] == ["Increase landing_page_views_to_calculator_starts conversion to 25.0%"]
+    assert fired["reduce_bounce_rate"]["description"].startswith("Bounce rate (72.5%)")
+
+def test_many_rules_compile_to_one_pass_and_few_requirements():
+    template = {"id": "rule_{n}", "title": "Rule {n}", "description": "{value:.0f} vs {threshold:.0f}",
+                "decision_type": "tactical_optimization", "priority": "low", "estimated_impact": 1.0,
+                "confidence_level": 0.5, "implementation_effort": "low", "implementation_timeline": 1,
+                "required_resources": [], "success_metrics": [], "risk_factors": [],
+                "supporting_data": {"value": "value"}}
+    rules = [{"expression": "ga4_bounce_rate", "comparison": ">=" if n % 2 else "<",
+              "benchmark": float(n), "template": template, "context": {"n": n}} for n in range(500)]
+
+    rule_set = RuleSet(rules)
+    fired = rule_set.evaluate(make_pivot())
+
+    assert len(rule_set) == 500 and rule_set.metrics == ["ga4_bounce_rate"]
+    assert rule_set.metric_requirements == [MetricRequirement("ga4_")]
+    # >= fires for odd n <= 72, < fires for even n > 72.5
+    assert [f["id"] for f in fired] == [f"rule_{n}" for n in range(500) if (n % 2 and n <= 72) or (not n % 2 and n > 72)]
+
+def test_rule_file_extends_templates(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"rules": [
+        {"expression": "email_open_rate", "comparison": "<", "benchmark": 45.0, "template": "email_open_rate"}
+    ]}))
+
+    fired = RuleSet(**load_rules(str(path))).evaluate(make_pivot())
+    assert [f["id"] for f in fired] == ["improve_email_open_rates"]
+
+    with pytest.raises(ValueError):
+        RuleSet([{"expression": "a + b", "comparison": "<", "benchmark": 1.0, "template": "email_open_rate"}])
+
+def test_unprefixed_metric_names_are_loaded_by_full_name():
+    assert metric_prefixes(["sessions", "ga4_bounce_rate", "sessions_per_user", "ga4_sessions"]) == ["sessions", "ga4_"]
+
+    rule = {"expression": "100 * conversions / sessions", "comparison": "<", "benchmark": 5.0,
+            "template": "email_open_rate"}
+    rule_set = RuleSet([rule])
+    assert rule_set.metric_requirements == [MetricRequirement("conversions"), MetricRequirement("sessions")]
+
+    rows = [("2026-01-02", "sessions", 1000.0), ("2026-01-02", "conversions", 20.0)]
+    pivot = MetricPivot(pd.DataFrame(rows, columns=["timestamp", "metric_name", "metric_value"]))
+    assert [f["id"] for f in rule_set.evaluate(pivot)] == ["improve_email_open_rates"]
@@ -4,13 +4,8 @@ Test the enhanced proposal generation with ROI calculations
 """
 
 import json
-import sys
 import os
 
-# Add current directory to path
-sys.path.append('.')
-sys.path.append('./campaign')
-
 def test_enhanced_proposal():
     """Test the enhanced proposal generation system"""
     print("🧪 Testing Enhanced Proposal Generation")
@@ -43,7 +38,7 @@ def test_enhanced_proposal():
     
     try:
         # Import and use our enhanced proposal generator
-        from automated_proposal_workflow import ProposalGenerator
+        from campaign.automated_proposal_workflow import ProposalGenerator
         
         generator = ProposalGenerator()
         
@@ -162,7 +157,7 @@ def test_pricing_scenarios():
     ]
     
     try:
-        from automated_proposal_workflow import ProposalGenerator
+        from campaign.automated_proposal_workflow import ProposalGenerator
         generator = ProposalGenerator()
         
         for scenario in scenarios:
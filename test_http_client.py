@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test BMAD HTTP Client - Keep-alive pooling, retries and conditional GET caching
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bmad.http_client import PooledHTTPClient
+
+@pytest.fixture
+def fake_server():
+    """Local server with an ETag resource, an endpoint that fails before succeeding
+    and a writable collection whose GETs stay fresh for a minute"""
+    state = {"etag": '"v1"', "body": {"value": 1}, "flaky_failures": 2, "hits": [], "ports": set(),
+             "records": {"1": "a", "2": "b"}}
+    fresh = {"Cache-Control": "max-age=60"}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive
+
+        def send_json(self, status, payload=None, headers=None):
+            body = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            state["hits"].append((self.path, self.headers.get("If-None-Match")))
+            state["ports"].add(self.client_address[1])
+
+            if self.path == "/resource":
+                if self.headers.get("If-None-Match") == state["etag"]:
+                    self.send_json(304, headers={"ETag": state["etag"]})
+                else:
+                    self.send_json(200, state["body"], {"ETag": state["etag"]})
+            elif self.path == "/flaky":
+                if state["flaky_failures"] > 0:
+                    state["flaky_failures"] -= 1
+                    self.send_json(503, {"error": "busy"}, {"Retry-After": "0"})
+                else:
+                    self.send_json(200, {"ok": True})
+            elif self.path in ("/records", "/records-archive"):
+                self.send_json(200, state["records"], fresh)
+            elif self.path.startswith("/records/"):
+                self.send_json(200, state["records"].get(self.path.split("/")[2]), fresh)
+
+        def do_PUT(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            state["records"][self.path.split("/")[2]] = body
+            self.send_json(200, {"success": True})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            state["records"][str(len(state["records"]) + 1)] = body
+            self.send_json(200, {"success": True})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    state["base_url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+
+    server.shutdown()
+    server.server_close()
+
+def test_conditional_get_reuses_cached_body(fake_server):
+    """A 304 revalidation returns the cached response over the same connection"""
+    client = PooledHTTPClient()
+    url = fake_server["base_url"] + "/resource"
+
+    first = client.get(url)
+    second = client.get(url)
+
+    assert first.json() == second.json() == {"value": 1}
+    assert [h[1] for h in fake_server["hits"]] == [None, '"v1"']
+    assert client.stats["not_modified"] == 1
+    assert len(fake_server["ports"]) == 1
+
+    fake_server["etag"], fake_server["body"] = '"v2"', {"value": 2}
+    assert client.get(url).json() == {"value": 2}
+
+def test_retries_retryable_status(fake_server):
+    """503s are retried with backoff until the endpoint recovers"""
+    client = PooledHTTPClient(backoff_factor=0.01)
+
+    response = client.get(fake_server["base_url"] + "/flaky", conditional=False)
+
+    assert response.status_code == 200
+    assert client.stats["retries"] == 2
+
+def test_writes_drop_the_resource_its_children_and_its_collection(fake_server):
+    """A listing read after PUT or POST reflects the write despite a fresh cache entry"""
+    client = PooledHTTPClient()
+    base = fake_server["base_url"]
+
+    assert client.get(base + "/records").json() == {"1": "a", "2": "b"}
+    assert client.get(base + "/records/1").json() == "a"
+    assert client.get(base + "/records-archive").json() == {"1": "a", "2": "b"}
+    assert client.get(base + "/records").json() == {"1": "a", "2": "b"}
+    assert client.stats["cache_hits"] == 1
+
+    client.put(base + "/records/1", json="z")
+    assert client.get(base + "/records").json() == {"1": "z", "2": "b"}
+    assert client.get(base + "/records/1").json() == "z"
+    assert client.get(base + "/records/2").json() == "b"
+
+    client.post(base + "/records", json="c")
+    assert client.get(base + "/records").json() == {"1": "z", "2": "b", "3": "c"}
+    assert client.get(base + "/records/2").json() == "b"  # A child of the collection, fetched again
+
+    # Neither write touched a sibling path that only shares a string prefix
+    assert client.get(base + "/records-archive").json() == {"1": "a", "2": "b"}
+    assert [path for path, _ in fake_server["hits"]].count("/records/2") == 2
+
+def test_prefix_invalidation_keeps_paths_outside_the_prefix(fake_server):
+    client = PooledHTTPClient()
+    base = fake_server["base_url"]
+    for path in ("/records", "/records/1", "/records/2", "/records-archive"):
+        client.get(base + path)
+
+    client.invalidate(base + "/records/", prefix=True)
+    hits = len(fake_server["hits"])
+    for path in ("/records", "/records/1", "/records/2", "/records-archive"):
+        client.get(base + path)
+
+    assert [path for path, _ in fake_server["hits"][hits:]] == ["/records", "/records/1", "/records/2"]
+
+def test_stats_stay_exact_under_concurrent_cache_hits(fake_server):
+    client = PooledHTTPClient()
+    url = fake_server["base_url"] + "/records"
+    client.get(url)
+
+    def read():
+        for _ in range(500):
+            client.get(url)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.stats["cache_hits"] == 4000
+    assert client.stats["requests"] == 1
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Impact Statistics - Welch, bootstrap and sequential tests in one batch
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from bmad.bmad_tracking_system import BMADTracker
+from bmad.impact_statistics import compare_groups, t_two_sided_p_value
+
+def test_t_distribution_tail_matches_reference_values():
+    p = t_two_sided_p_value([2.228, 1.96, 1.0, 0.0, np.inf], [10, 1e6, 1, 5, 4])
+    np.testing.assert_allclose(p, [0.05, 0.05, 0.5, 1.0, 0.0], atol=2e-4)
+
+def test_batch_matches_individual_comparisons_and_flags_real_lifts():
+    rng = np.random.default_rng(7)
+    before = [rng.normal(10, 2, 60), rng.normal(10, 2, 35), [3.0]]
+    after = [rng.normal(13, 2, 40), rng.normal(10, 2, 80), [4.0, 5.0]]
+
+    batch = compare_groups(before, after)
+    lifted, flat, tiny = batch
+
+    assert lifted.significant and lifted.p_value < 1e-6
+    assert lifted.ci_low < lifted.impact_percent < lifted.ci_high and lifted.ci_low > 0
+    assert not flat.significant and flat.p_value > 0.05 and flat.ci_low < 0 < flat.ci_high
+    # A single before sample has no variance: no test result, never significant
+    assert np.isnan(tiny.p_value) and not tiny.significant
+
+    single = compare_groups(before[1:2], after[1:2])[0]
+    assert single.p_value == pytest.approx(flat.p_value)
+    assert single.sequential_p_value == pytest.approx(flat.sequential_p_value)
+
+def test_optimization_impacts_are_tested_from_raw_samples(tmp_path):
+    tracker = BMADTracker(str(tmp_path / "tracking.db"))
+    tracker.record_optimization("calc", "Calculator", 20)
+    tracker.record_optimization("quiet", "No data", 10)
+
+    rng = np.random.default_rng(3)
+    implemented = datetime(2026, 3, 1)
+    conn = sqlite3.connect(tracker.db_path)
+    conn.execute("UPDATE optimizations SET implemented_date = ? WHERE id = 'calc'", (implemented.strftime('%Y-%m-%d %H:%M:%S'),))
+    for hours in range(1, 150):
+        for direction, mean in ((-1, 50.0), (1, 60.0)):
+            timestamp = (implemented + timedelta(hours=direction * hours)).strftime('%Y-%m-%d %H:%M:%S')
+            conn.executemany("INSERT INTO campaign_metrics (timestamp, metric_name, metric_value) VALUES (?, ?, ?)", [
+                (timestamp, "calculator_completion_rate", rng.normal(mean, 5)),
+                (timestamp, "form_submission_rate", rng.normal(25, 3)),
+            ])
+    conn.commit()
+    conn.close()
+
+    impacts = tracker.calculate_optimization_impacts()
+    assert set(impacts) == {"calc", "quiet"} and impacts["quiet"]["impact_analysis"] == {}
+
+    analysis = impacts["calc"]["impact_analysis"]
+    completion, submission = analysis["calculator_completion_rate"], analysis["form_submission_rate"]
+    assert completion["before_samples"] == completion["after_samples"] == 149
+    assert completion["significant"] and 15 < completion["impact_percent"] < 25
+    assert not submission["significant"]
+
+    assert tracker.calculate_optimization_impact("calc")["impact_analysis"] == analysis
+    assert tracker.calculate_optimization_impact("missing") is None
+    assert set(tracker.calculate_optimization_impacts(["quiet", "missing"])) == {"quiet"}
+    assert tracker.calculate_optimization_impacts([]) == {}
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Measure Tracking - Daily collection, sync cursors, KPI targets and alerts
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from bmad.measure_tracking_system import (BMADMeasureSystem, CampaignMetric, KPITarget, KPITargetRegistry,
+                                         MeasureTracker)
+from bmad.response_cache import ResponseCache
+
+END = datetime(2026, 10, 18)
+
+@pytest.fixture
+def system(tmp_path):
+    measure = BMADMeasureSystem(source_timeouts={"ga4": 5, "email": 5, "crm": 5},
+                                response_cache=ResponseCache(str(tmp_path / "cache"), mode="off"),
+                                db_path=str(tmp_path / "metrics.db"))
+    measure.tracker.send_alert_notification = lambda *args: None
+    return measure
+
+def metric_count(system, source=None):
+    conn = sqlite3.connect(system.tracker.db_path)
+    query, params = "SELECT COUNT(*) FROM metrics", ()
+    if source:
+        query, params = query + " WHERE source = ?", (source,)
+    count = conn.execute(query, params).fetchone()[0]
+    conn.close()
+    return count
+
+def test_timed_out_source_keeps_its_cursor(system):
+    release = threading.Event()
+
+    def stuck(start_date, end_date):
+        release.wait(5)
+        return []
+
+    system.crm.fetch_sales_metrics = stuck
+    system.source_timeouts["crm"] = 0.2
+
+    try:
+        report = system.collect_daily_metrics(END)
+    finally:
+        release.set()
+
+    assert report["crm"].error == "timed out" and report["ga4"].error is None
+    assert system.cursor_store.get("hubspot") is None
+    assert system.cursor_store.get("ga4") == system.cursor_store.get("mailchimp") == END.isoformat()
+    assert metric_count(system, "hubspot") == 0 and metric_count(system, "ga4") > 0
+
+def test_failed_write_keeps_every_cursor(system, monkeypatch):
+    def fail(cursor, metrics, feed_series=True):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(system.tracker, "_insert_metrics", fail)
+    sent = []
+    system.tracker.send_alert_notification = lambda alert_type, message: sent.append(alert_type)
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        system.collect_daily_metrics(END)
+
+    assert [system.cursor_store.get(s) for s in ("ga4", "mailchimp", "hubspot")] == [None, None, None]
+    assert metric_count(system) == 0
+
+    # The failed write still raises a system-health alert
+    conn = sqlite3.connect(system.tracker.db_path)
+    failures = conn.execute("SELECT metric_name, message FROM alerts WHERE alert_type = 'data_collection_failure'").fetchall()
+    conn.close()
+    assert [name for name, _ in failures] == ["system_health_storage"] and "disk full" in failures[0][1]
+    assert sent == ["data_collection_failure"]
+
+def test_record_then_replay_against_the_same_database(tmp_path):
+    db_path = str(tmp_path / "metrics.db")
+    cache_dir = str(tmp_path / "cache")
+
+    recorder = BMADMeasureSystem(response_cache=ResponseCache(cache_dir, mode="record"), db_path=db_path)
+    recorded = recorder.collect_daily_metrics(END)
+    assert all(result.error is None for result in recorded.values())
+
+    replayer = BMADMeasureSystem(response_cache=ResponseCache(cache_dir, mode="replay"), db_path=db_path)
+    for name in ("fetch_traffic_metrics", "fetch_conversion_funnel"):
+        setattr(replayer.ga4, name, lambda *args: pytest.fail("replay fetched"))
+    replayer.email.fetch_email_metrics = lambda *args: pytest.fail("replay fetched")
+    replayer.crm.fetch_sales_metrics = lambda *args: pytest.fail("replay fetched")
+
+    replayed = replayer.collect_daily_metrics(END)
+
+    assert {name: (r.metrics_collected, r.error) for name, r in replayed.items()} == \
+        {name: (r.metrics_collected, None) for name, r in recorded.items()}
+    assert metric_count(replayer) == 2 * sum(r.metrics_collected for r in recorded.values())
+    assert replayer.cursor_store.get("ga4") is None
+
+def test_daily_report_rerenders_every_day_whose_data_changed(system, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    days = [(datetime.now() - timedelta(days=back)).strftime('%Y-%m-%d') for back in (5, 3, 1, 0)]
+
+    def reports(*indexes):
+        return [f"reports/daily_report_{days[i]}.md" for i in indexes]
+
+    def add_sessions(day):
+        conn = sqlite3.connect(system.tracker.db_path)
+        conn.execute("INSERT INTO metrics (timestamp, metric_name, metric_value, source) VALUES (?, 'sessions', 1, 'ga4')",
+                     (f"{day} 12:00:00",))
+        conn.commit()
+        conn.close()
+
+    # Every day with data up to yesterday; today is not over yet
+    for day in days:
+        add_sessions(day)
+    assert system.generate_daily_report() == reports(0, 1, 2)
+    assert system.generate_daily_report() == []
+
+    # Late rows for a day reported long ago re-render that day
+    add_sessions(days[0])
+    assert system.generate_daily_report() == reports(0)
+
+    # start_day narrows the range; days before it stay stale for the next run
+    add_sessions(days[0])
+    add_sessions(days[2])
+    assert system.generate_daily_report(start_day=days[1]) == reports(2)
+    assert system.generate_daily_report() == reports(0)
+
+def test_backfilled_metrics_stay_out_of_the_live_series(system):
+    tracker = system.tracker
+    now = datetime.now()
+    tracker.record_batch_metrics([CampaignMetric(now, "ga4_sessions", 500.0, "gauge", "ga4", {})])
+
+    history = [
+        CampaignMetric(now - timedelta(days=30, minutes=i), "ga4_sessions", 10.0, "gauge", "ga4", {})
+        for i in range(tracker.series.capacity + 10)
+    ]
+    tracker.record_batch_metrics(history, evaluate_alerts=False)
+
+    assert metric_count(system) == len(history) + 1
+    assert tracker.series.get("ga4_sessions").latest()[1] == 500.0
+    assert len(tracker.series.get("ga4_sessions")) == 1
+
+def test_backfill_stores_each_chunk_on_its_own_day(system):
+    start = datetime(2026, 9, 1)
+    end = start + timedelta(days=3)
+    result = system.backfill(start, end)
+    assert result.chunks_done == result.chunks_total == 9
+
+    conn = sqlite3.connect(system.tracker.db_path)
+    timestamps = [datetime.fromisoformat(row[0]) for row in conn.execute("SELECT timestamp FROM metrics")]
+    days = conn.execute("SELECT source, COUNT(DISTINCT substr(timestamp, 1, 10)) FROM metrics GROUP BY source").fetchall()
+    conn.close()
+
+    assert len(timestamps) == result.metrics_written
+    assert all(start <= timestamp < end for timestamp in timestamps)
+    assert sorted(days) == [("ga4", 3), ("hubspot", 3), ("mailchimp", 3)]
+
+@pytest.fixture
+def tracker(tmp_path):
+    measure = MeasureTracker(str(tmp_path / "alerts.db"), alert_cooldown_seconds=3600)
+    measure.send_alert_notification = lambda *args: None
+    measure.set_kpi_target(KPITarget("ga4_sessions", 2000, "monthly", 15, 25))
+    measure.set_kpi_target(KPITarget("email_open_rate", 35, "monthly", 10, 15))
+    return measure
+
+def sample(metric_name, value, minutes_ago=0):
+    return CampaignMetric(datetime.now() - timedelta(minutes=minutes_ago), metric_name, value, "gauge", "test", {})
+
+def stored_alerts(tracker):
+    conn = sqlite3.connect(tracker.db_path)
+    rows = conn.execute("SELECT alert_type, metric_name, current_value FROM alerts ORDER BY id").fetchall()
+    conn.close()
+    return rows
+
+def test_repeat_alert_is_suppressed_within_the_cooldown(tracker):
+    tracker.record_metric(sample("ga4_sessions", 1000))
+    tracker.record_metric(sample("ga4_sessions", 900))
+
+    assert stored_alerts(tracker) == [("kpi_underperformance", "ga4_sessions", 1000.0)]
+
+def test_alert_fires_again_after_the_cooldown(tracker):
+    tracker.record_metric(sample("ga4_sessions", 1000))
+
+    conn = sqlite3.connect(tracker.db_path)
+    conn.execute("UPDATE alerts SET created_at = datetime('now', '-2 hours')")
+    conn.commit()
+    conn.close()
+
+    tracker.record_metric(sample("ga4_sessions", 900))
+    assert stored_alerts(tracker) == [("kpi_underperformance", "ga4_sessions", 1000.0),
+                                      ("kpi_underperformance", "ga4_sessions", 900.0)]
+
+def test_batch_raises_the_same_alerts_as_one_row_at_a_time(tmp_path, tracker):
+    rows = [sample("ga4_sessions", 1500, 3), sample("email_open_rate", 34, 3), sample("ga4_sessions", 1600, 2),
+            sample("email_open_rate", 20, 1), sample("ga4_sessions", 1900, 0)]
+
+    one_at_a_time = MeasureTracker(str(tmp_path / "single.db"), alert_cooldown_seconds=3600)
+    one_at_a_time.send_alert_notification = lambda *args: None
+    one_at_a_time.kpi_registry.upsert(list(tracker.kpi_targets.values()))
+    for row in rows:
+        one_at_a_time.record_metric(row)
+
+    tracker.record_batch_metrics(rows)
+
+    # The batch keeps the worst breach per metric; the cooldown keeps the first one row by row.
+    # The last sessions value recovers but the window mean (1666.67) is still below 1700
+    assert {row[:2] for row in stored_alerts(tracker)} == {row[:2] for row in stored_alerts(one_at_a_time)} == {
+        ("kpi_underperformance", "ga4_sessions"), ("kpi_underperformance", "email_open_rate"),
+        ("kpi_trend_underperformance", "ga4_sessions")
+    }
+    assert len(stored_alerts(tracker)) == len(stored_alerts(one_at_a_time)) == 3
+
+def test_kpi_registry_is_shared_per_database_and_looks_up_targets(tracker):
+    registry = KPITargetRegistry.for_database(tracker.db_path)
+    assert registry is tracker.kpi_registry
+    assert MeasureTracker(tracker.db_path).kpi_registry is registry
+
+    index, targets, thresholds = registry.arrays()
+    position = index["ga4_sessions"]
+    assert targets[position] == 2000 and thresholds[position] == pytest.approx(1700)
+    assert tracker.kpi_targets["email_open_rate"] == KPITarget("email_open_rate", 35, "monthly", 10, 15)
+
+def test_kpi_registry_writes_only_overridden_targets(tracker):
+    registry = tracker.kpi_registry
+    seen = []
+    registry.subscribe(lambda changed: seen.append(changed.version))
+    version = registry.version
+
+    assert registry.upsert(list(tracker.kpi_targets.values())) == 0
+    assert registry.upsert([KPITarget("ga4_sessions", 2500, "monthly", 20, 25),
+                            KPITarget("email_open_rate", 35, "monthly", 10, 15)]) == 1
+
+    assert registry.version == version + 1 and seen == [version + 1]
+    index, targets, thresholds = registry.arrays()
+    assert targets[index["ga4_sessions"]] == 2500 and thresholds[index["ga4_sessions"]] == pytest.approx(2000)
+
+def test_kpi_registry_picks_up_overrides_from_other_processes(tracker):
+    registry = tracker.kpi_registry
+    assert registry.refresh() is False
+
+    # A separate registry instance stands in for another process writing the same database
+    KPITargetRegistry(tracker.db_path).upsert([KPITarget("crm_leads_created", 50, "monthly", 20, 40)])
+
+    assert registry.refresh() is True
+    assert "crm_leads_created" in registry.arrays()[0]
+    assert registry.refresh() is False
+
+    # The alert path refreshes on its own cursor before checking the batch
+    KPITargetRegistry(tracker.db_path).upsert([KPITarget("crm_deals_closed_won", 8, "monthly", 25, 50)])
+    tracker.record_metric(sample("crm_deals_closed_won", 2))
+    assert stored_alerts(tracker)[-1] == ("kpi_underperformance", "crm_deals_closed_won", 2.0)
+
+def test_kpi_registry_diffs_against_targets_written_by_other_processes(tracker):
+    registry = tracker.kpi_registry
+    registry.upsert([KPITarget("crm_leads_created", 50, "monthly", 20, 40)])
+
+    # Another process changes the target after this registry cached it
+    KPITargetRegistry(tracker.db_path).upsert([KPITarget("crm_leads_created", 60, "monthly", 20, 40)])
+
+    # Writing back the value this registry last saw is still a change
+    assert registry.upsert([KPITarget("crm_leads_created", 50, "monthly", 20, 40)]) == 1
+    assert KPITargetRegistry.for_database(tracker.db_path) is registry
+    fresh = KPITargetRegistry(tracker.db_path)
+    fresh.load()
+    assert fresh.targets["crm_leads_created"].target_value == 50
+    assert fresh.version == registry.version
+
+    # And a value another process already wrote is not rewritten
+    KPITargetRegistry(tracker.db_path).upsert([KPITarget("crm_leads_created", 70, "monthly", 20, 40)])
+    assert registry.upsert([KPITarget("crm_leads_created", 70, "monthly", 20, 40)]) == 0
+    assert registry.targets["crm_leads_created"].target_value == 70
+
+def test_sources_are_collected_in_parallel(system):
+    # Every fetch waits for the other two; a sequential run would break the barrier
+    together = threading.Barrier(3, timeout=2)
+    for connector in (system.ga4, system.email, system.crm):
+        fetch = connector.fetch_since_cursor
+
+        def fetch_together(*args, fetch=fetch):
+            together.wait()
+            return fetch(*args)
+
+        connector.fetch_since_cursor = fetch_together
+
+    report = system.collect_daily_metrics(END)
+
+    assert [result.error for result in report.values()] == [None, None, None]
+    assert all(metric_count(system, source) > 0 for source in ("ga4", "mailchimp", "hubspot"))
+
+def test_slow_source_times_out_without_holding_up_the_run(system):
+    release = threading.Event()
+
+    def stuck(*args):
+        release.wait(5)
+        return [], None
+
+    system.email.fetch_since_cursor = stuck
+    system.source_timeouts["email"] = 0.2
+
+    started = time.perf_counter()
+    try:
+        report = system.collect_daily_metrics(END)
+    finally:
+        release.set()
+
+    assert time.perf_counter() - started < 2
+    assert report["email"].error == "timed out" and report["email"].latency_ms >= 200
+    assert report["ga4"].error is None and report["crm"].error is None
+    assert metric_count(system, "mailchimp") == 0 and metric_count(system, "hubspot") > 0
+
+def test_failing_source_does_not_affect_the_others(system):
+    def broken(*args):
+        raise ConnectionError("HTTP 503 from hubspot")
+
+    system.crm.fetch_since_cursor = broken
+    report = system.collect_daily_metrics(END)
+
+    assert report["crm"].error == "HTTP 503 from hubspot" and report["crm"].metrics_collected == 0
+    assert report["ga4"].metrics_collected == metric_count(system, "ga4") > 0
+    assert report["email"].metrics_collected == metric_count(system, "mailchimp") > 0
+    assert system.cursor_store.get("hubspot") is None
+
+    conn = sqlite3.connect(system.tracker.db_path)
+    failures = conn.execute("SELECT metric_name FROM alerts WHERE alert_type = 'data_collection_failure'").fetchall()
+    conn.close()
+    assert failures == [("system_health_crm",)]
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Source Connectors - Pagination and incremental cursors against a local fake API
+"""
+
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from bmad.metric_connectors import HttpPagedConnector, Page, SourceConnector, SyncCursorStore
+
+class FakeMetricsAPI:
+    """In-memory metric feed served with since/page_token pagination"""
+
+    def __init__(self):
+        self.records = []
+        self.requests = []
+
+    def add_records(self, start_hour: int, count: int):
+        for hour in range(start_hour, start_hour + count):
+            self.records.append({
+                "timestamp": f"2026-01-01T{hour:02d}:00:00",
+                "metric_name": "sessions",
+                "metric_value": float(hour)
+            })
+
+    def page(self, params):
+        self.requests.append(params)
+        since = params.get("since", "")
+        until = params.get("until", "9999")
+        page_size = int(params.get("page_size", 500))
+        offset = int(params.get("page_token", 0))
+
+        matching = [r for r in self.records if since < r["timestamp"] <= until]
+        records = matching[offset:offset + page_size]
+        next_offset = offset + page_size
+        return {
+            "records": records,
+            "next_page_token": str(next_offset) if next_offset < len(matching) else None,
+            "high_water_mark": records[-1]["timestamp"] if records else None
+        }
+
+@pytest.fixture
+def fake_api():
+    """Serve a FakeMetricsAPI on a local port for the duration of a test"""
+    api = FakeMetricsAPI()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            body = json.dumps(api.page(params)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    api.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield api
+
+    server.shutdown()
+    server.server_close()
+
+def make_connector(api, page_size=4):
+    return HttpPagedConnector("fake", api.base_url, "/metrics", page_size=page_size)
+
+UNTIL = datetime(2026, 1, 2)
+SINCE = "2025-12-31T00:00:00"
+
+def test_pagination_fetches_every_page(fake_api, tmp_path):
+    """All pages are followed and the cursor lands on the newest record"""
+    fake_api.add_records(0, 10)
+    store = SyncCursorStore(str(tmp_path / "cursors.db"))
+    store.set("fake", SINCE)
+
+    records, cursor = make_connector(fake_api).fetch_since_cursor(store, UNTIL)
+
+    assert [r["metric_value"] for r in records] == [float(h) for h in range(10)]
+    assert len(fake_api.requests) == 3
+    assert cursor == "2026-01-01T09:00:00"
+    # Saving the cursor is left to the caller, after it has stored the records
+    assert store.get("fake") == SINCE
+
+def test_resume_fetches_only_new_records(fake_api, tmp_path):
+    """A second sync starts from the stored high-water mark"""
+    fake_api.add_records(0, 5)
+    store = SyncCursorStore(str(tmp_path / "cursors.db"))
+    store.set("fake", SINCE)
+    connector = make_connector(fake_api)
+
+    records, cursor = connector.fetch_since_cursor(store, UNTIL)
+    assert len(records) == 5
+    store.set("fake", cursor)
+
+    fake_api.add_records(5, 3)
+    records, cursor = connector.fetch_since_cursor(store, UNTIL)
+
+    assert [r["metric_value"] for r in records] == [5.0, 6.0, 7.0]
+    assert cursor == "2026-01-01T07:00:00"
+
+def test_interrupted_sync_resumes_after_last_consumed_page(fake_api, tmp_path):
+    """Stopping mid-sync keeps the cursor at the last page the caller stored"""
+    fake_api.add_records(0, 10)
+    store = SyncCursorStore(str(tmp_path / "cursors.db"))
+    store.set("fake", SINCE)
+    connector = make_connector(fake_api)
+
+    pages = connector.sync(store, UNTIL)
+    for _ in range(2):
+        _, cursor = next(pages)
+        store.set("fake", cursor)
+    next(pages)  # Fetched but never stored
+    pages.close()
+
+    assert store.get("fake") == "2026-01-01T07:00:00"
+
+    records, _ = connector.fetch_since_cursor(store, UNTIL)
+    assert [r["metric_value"] for r in records] == [float(h) for h in range(8, 10)]
+
+def test_connectors_must_implement_iter_pages(tmp_path):
+    class Incomplete(SourceConnector):
+        source = "incomplete"
+
+    with pytest.raises(TypeError, match="iter_pages"):
+        Incomplete()
+
+    class Daily(SourceConnector):
+        source = "daily"
+
+        def iter_pages(self, since, until):
+            yield Page([since.day, until.day], high_water_mark=until.isoformat())
+
+    store = SyncCursorStore(str(tmp_path / "cursors.db"))
+    store.set("daily", SINCE)
+    assert Daily().fetch_since_cursor(store, UNTIL) == ([31, 2], UNTIL.isoformat())
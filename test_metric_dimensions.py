@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Metric Dimensions - Interning, rollback safety and legacy JSON migration
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from bmad.measure_tracking_system import CampaignMetric, MeasureTracker
+from bmad.metric_dimensions import DimensionRegistry
+
+def make_db():
+    conn = sqlite3.connect(":memory:")
+    DimensionRegistry.init_schema(conn.cursor())
+    return conn
+
+def test_intern_shares_one_set_per_dictionary():
+    conn = make_db()
+    registry = DimensionRegistry()
+    cursor = conn.cursor()
+
+    first = registry.intern(cursor, {"device": "mobile", "country": "US"})
+    assert registry.intern(cursor, {"country": "US", "device": "mobile"}) == first
+    assert registry.intern(cursor, {"device": "desktop"}) != first
+    assert registry.intern(cursor, None) is None and registry.intern(cursor, {}) is None
+    conn.commit()
+    registry.commit()
+
+    # Committed ids come from the cache; a fresh registry finds the same row
+    assert DimensionRegistry().intern(cursor, {"device": "mobile", "country": "US"}) == first
+    assert conn.execute("SELECT COUNT(*) FROM dimension_sets").fetchone() == (2,)
+    assert conn.execute('''
+        SELECT dim_key, dim_value FROM dimension_values WHERE dimension_set_id = ? ORDER BY dim_key
+    ''', (first,)).fetchall() == [("country", "US"), ("device", "mobile")]
+
+def test_rolled_back_set_is_not_served_from_the_cache():
+    conn = make_db()
+    registry = DimensionRegistry()
+
+    registry.intern(conn.cursor(), {"device": "tablet"})
+    conn.rollback()
+    registry.rollback()
+
+    set_id = registry.intern(conn.cursor(), {"device": "tablet"})
+    conn.commit()
+    registry.commit()
+    assert conn.execute("SELECT dimensions FROM dimension_sets WHERE id = ?", (set_id,)).fetchone() == ('{"device":"tablet"}',)
+
+def test_failed_batch_does_not_leave_a_stale_dimension_id(tmp_path):
+    tracker = MeasureTracker(str(tmp_path / "metrics.db"))
+    tracker.send_alert_notification = lambda *args: None
+    metric = CampaignMetric(datetime.now(), "ga4_sessions", 10.0, "gauge", "ga4", {"channel": "organic"})
+
+    def fail(cursor):
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        tracker.record_batch_metrics([metric], before_commit=fail)
+    tracker.record_batch_metrics([metric])
+
+    conn = sqlite3.connect(tracker.db_path)
+    assert conn.execute('''
+        SELECT ds.dimensions FROM metrics m JOIN dimension_sets ds ON ds.id = m.dimension_set_id
+    ''').fetchall() == [('{"channel":"organic"}',)]
+    conn.close()
+
+def test_migrate_metrics_moves_legacy_json_into_sets():
+    conn = make_db()
+    conn.execute("CREATE TABLE metrics (id INTEGER PRIMARY KEY, metric_name TEXT, dimensions TEXT)")
+    conn.executemany("INSERT INTO metrics (metric_name, dimensions) VALUES (?, ?)", [
+        ("ga4_sessions", '{"device": "mobile"}'),
+        ("ga4_users", '{"device":"mobile"}'),
+        ("ga4_sessions", '{"device": "desktop"}'),
+        ("ga4_sessions", None),
+        ("ga4_sessions", "not json"),
+        ("ga4_sessions", '["mobile", "organic"]'),
+        ("ga4_sessions", '"mobile"'),
+        ("ga4_sessions", "42"),
+        ("ga4_sessions", "null"),
+        ("ga4_sessions", "{}"),
+    ])
+
+    registry = DimensionRegistry()
+    assert registry.migrate_metrics(conn.cursor()) == 5
+    conn.commit()
+    registry.commit()
+
+    rows = conn.execute('''
+        SELECT m.id, m.dimensions, ds.dimensions FROM metrics m
+        LEFT JOIN dimension_sets ds ON ds.id = m.dimension_set_id ORDER BY m.id
+    ''').fetchall()
+    assert rows == [
+        (1, None, '{"device":"mobile"}'),
+        (2, None, '{"device":"mobile"}'),
+        (3, None, '{"device":"desktop"}'),
+        (4, None, None),
+        (5, "not json", None),
+        (6, '["mobile", "organic"]', None),  # Not an object: left for inspection
+        (7, '"mobile"', None),
+        (8, "42", None),
+        (9, None, None),  # null and {} carry no dimensions
+        (10, None, None),
+    ]
+
+    # Already migrated rows are left alone
+    assert registry.migrate_metrics(conn.cursor()) == 0
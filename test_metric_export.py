@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Columnar Export - Parquet sync round trips, pruning and crash recovery
+"""
+
+import sqlite3
+
+import pytest
+
+from bmad.bmad_tracking_system import BMADTracker
+from bmad.measure_tracking_system import MeasureTracker
+from bmad.metric_export import METRICS_TABLES, TRACKING_TABLES, ColumnarExporter, load_columnar
+
+def add_metrics(path, rows):
+    conn = sqlite3.connect(path)
+    conn.executemany('''
+        INSERT INTO metrics (timestamp, metric_name, metric_value, source) VALUES (?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+
+@pytest.fixture
+def metrics_db(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    MeasureTracker(path)
+    add_metrics(path, [
+        ("2026-10-01 09:00:00", "sessions", 120.0, "ga4"),
+        ("2026-10-01 10:00:00", "open_rate", 31.5, "mailchimp"),
+        ("2026-10-02 09:00:00", "sessions", 140.0, "ga4"),
+        ("2026-10-03 09:00:00", "sessions", 90.0, "ga4"),
+    ])
+    return path
+
+def exported(export_dir, table="metrics", **filters):
+    df = load_columnar(str(export_dir), table, **filters)
+    return sorted(zip(df["id"], df["date"], df["metric_name"], df["metric_value"]))
+
+def test_sync_round_trips_through_load_columnar(tmp_path, metrics_db):
+    export_dir = tmp_path / "columnar"
+    assert ColumnarExporter(str(export_dir)).sync(metrics_db, METRICS_TABLES) == {"metrics": 4}
+
+    df = load_columnar(str(export_dir), "metrics")
+    assert sorted(zip(df["id"], df["source"], df["metric_value"])) == [
+        (1, "ga4", 120.0), (2, "mailchimp", 31.5), (3, "ga4", 140.0), (4, "ga4", 90.0)
+    ]
+
+def test_incremental_sync_writes_only_new_rows(tmp_path, metrics_db):
+    export_dir = tmp_path / "columnar"
+    ColumnarExporter(str(export_dir)).sync(metrics_db, METRICS_TABLES)
+    add_metrics(metrics_db, [("2026-10-03 12:00:00", "sessions", 95.0, "ga4")])
+
+    # A fresh exporter resumes from the saved high-water mark
+    exporter = ColumnarExporter(str(export_dir))
+    assert exporter.sync(metrics_db, METRICS_TABLES) == {"metrics": 1}
+    assert exporter.sync(metrics_db, METRICS_TABLES) == {"metrics": 0}
+    assert [row[0] for row in exported(export_dir)] == [1, 2, 3, 4, 5]
+    assert len(list((export_dir / "metrics" / "date=2026-10-03").glob("*/part-*.parquet"))) == 2
+
+def test_date_filters_prune_partitions(tmp_path, metrics_db):
+    export_dir = tmp_path / "columnar"
+    ColumnarExporter(str(export_dir)).sync(metrics_db, METRICS_TABLES)
+
+    # Pruned partitions are never opened, so an unreadable one outside the range is harmless
+    for part in (export_dir / "metrics" / "date=2026-10-03").glob("*/part-*.parquet"):
+        part.write_bytes(b"not parquet")
+
+    assert exported(export_dir, end_date="2026-10-02") == [
+        (1, "2026-10-01", "sessions", 120.0), (2, "2026-10-01", "open_rate", 31.5),
+        (3, "2026-10-02", "sessions", 140.0)
+    ]
+    assert exported(export_dir, start_date="2026-10-02", end_date="2026-10-02") == [
+        (3, "2026-10-02", "sessions", 140.0)
+    ]
+
+def test_interrupted_sync_does_not_duplicate_rows(tmp_path, metrics_db, monkeypatch):
+    export_dir = tmp_path / "columnar"
+    crashing = ColumnarExporter(str(export_dir))
+
+    def crash():
+        raise OSError("disk full")
+
+    # Parts are written but the high-water mark is never saved
+    monkeypatch.setattr(crashing, "save_state", crash)
+    with pytest.raises(OSError):
+        crashing.sync(metrics_db, METRICS_TABLES)
+    monkeypatch.undo()
+
+    add_metrics(metrics_db, [("2026-10-03 12:00:00", "sessions", 95.0, "ga4")])
+    assert ColumnarExporter(str(export_dir)).sync(metrics_db, METRICS_TABLES) == {"metrics": 5}
+    assert [row[0] for row in exported(export_dir)] == [1, 2, 3, 4, 5]
+
+def test_proposal_tracking_is_rewritten_on_every_sync(tmp_path):
+    tracker = BMADTracker(str(tmp_path / "tracking.db"))
+    first = tracker.record_proposal_generation("Acme", "growth", 12000, 240)
+    tracker.record_proposal_generation("Globex", "starter", 4000, 180)
+
+    export_dir = tmp_path / "columnar"
+    exporter = ColumnarExporter(str(export_dir))
+    assert exporter.sync(tracker.db_path, TRACKING_TABLES)["proposal_tracking"] == 2
+
+    # Mutable rows: the status change replaces the old copy instead of adding one
+    tracker.update_proposal_status(first, opened=True, closed_won=True)
+    assert exporter.sync(tracker.db_path, TRACKING_TABLES)["proposal_tracking"] == 2
+
+    df = load_columnar(str(export_dir), "proposal_tracking")
+    assert sorted(zip(df["client_name"], df["closed_won"])) == [("Acme", 1), ("Globex", 0)]
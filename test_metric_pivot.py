@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Metric Pivot - Latest/previous values and vectorized conversion rates
+"""
+
+import numpy as np
+import pandas as pd
+
+from bmad.metric_pivot import MetricPivot, conversion_rates
+
+def make_frame():
+    rows = [
+        ("2026-01-03 00:00:00+00:00", "funnel_views", 1000.0),
+        ("2026-01-03 00:00:00+00:00", "funnel_starts", 200.0),
+        ("2026-01-01 00:00:00+00:00", "funnel_views", 800.0),
+        ("2026-01-01 00:00:00+00:00", "funnel_starts", 240.0),
+        ("2026-01-02 00:00:00+00:00", "email_open_rate", 31.0),
+    ]
+    return pd.DataFrame(rows, columns=["timestamp", "metric_name", "metric_value"])
+
+def test_latest_and_previous_follow_time_order_not_row_order():
+    pivot = MetricPivot(make_frame())
+
+    assert pivot.latest_value("funnel_views") == 1000.0
+    assert pivot.previous_values(["funnel_views"])[0] == 800.0
+    assert pivot.latest_value("email_open_rate") == 31.0
+    assert np.isnan(pivot.previous_values(["email_open_rate"])[0])
+    assert pivot.latest_value("missing") is None
+    assert pivot.has_prefix("funnel_") and not pivot.has_prefix("crm_")
+
+def test_conversion_rates_and_deltas_are_vectorized():
+    pivot = MetricPivot(make_frame())
+    stages = ["funnel_views", "funnel_starts"]
+
+    latest = conversion_rates(pivot.latest_values(stages))
+    delta = latest - conversion_rates(pivot.previous_values(stages))
+
+    assert latest.tolist() == [20.0]
+    assert delta.tolist() == [-10.0]
+
+    rates = conversion_rates(np.array([[0.0, 5.0, 1.0], [np.nan, 5.0, 5.0]]))
+    assert np.isnan(rates[0, 0]) and rates[0, 1] == 20.0
+    assert np.isnan(rates[1, 0]) and rates[1, 1] == 100.0
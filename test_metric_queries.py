@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Metric Queries - Pushed-down prefix filters and per-day aggregation
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from bmad.daily_report import DailyRollup
+from bmad.measure_tracking_system import CampaignMetric, MeasureTracker
+from bmad.metric_queries import (MetricRequirement, Segment, ensure_metric_name_index, load_aggregated,
+                                 load_rollup_aggregated, prefix_upper_bound)
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE metrics (id INTEGER PRIMARY KEY, timestamp DATETIME, metric_name TEXT, metric_value REAL)")
+    now = datetime.now(timezone.utc).replace(hour=12)
+    rows = []
+    for day in (0, 1, 45):
+        for hour, value in ((1, 10.0), (5, 30.0)):
+            ts = (now - timedelta(days=day)).replace(hour=hour).isoformat(" ")
+            rows += [(ts, "funnel_views", value), (ts, "funnelx_other", value), (ts, "ga4_sessions", value)]
+    conn.executemany("INSERT INTO metrics (timestamp, metric_name, metric_value) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    return conn
+
+def test_prefix_upper_bound():
+    assert prefix_upper_bound("funnel_") == "funnel`"
+    assert "funnel_views" < prefix_upper_bound("funnel_") <= "funnelx"
+
+def test_load_aggregated_pushes_down_prefix_window_and_aggregation(tmp_path):
+    conn = make_db(str(tmp_path / "metrics.db"))
+    ensure_metric_name_index(conn)
+
+    df = load_aggregated(conn, [MetricRequirement("funnel_"), MetricRequirement("funnel_", "avg")], days_back=30)
+
+    last = df[df.metric_name == "funnel_views"]
+    avg = df[df.metric_name == "funnel_views__avg"]
+    assert len(last) == 2 and set(last.metric_value) == {30.0}
+    assert len(avg) == 2 and set(avg.metric_value) == {20.0}
+    assert not df.metric_name.str.startswith("funnelx").any()
+
+    plan = " ".join(str(row) for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM metrics WHERE metric_name >= 'funnel_' AND metric_name < 'funnel`'"))
+    assert "idx_metrics_name_timestamp" in plan
+
+def test_segment_filter_reads_the_same_from_raw_rows_and_the_rollup(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    tracker = MeasureTracker(path)
+    now = datetime.now(timezone.utc).replace(hour=12)
+
+    def metric(name, value, campaign_id, tier, minutes_ago):
+        return CampaignMetric(now - timedelta(minutes=minutes_ago), name, value, "gauge", "ga4",
+                              {"tier": tier} if tier else {}, campaign_id)
+
+    tracker.record_batch_metrics([
+        metric("ga4_bounce_rate", 72.0, "spring", "smb", 1),
+        metric("ga4_bounce_rate", 50.0, "spring", "smb", 2),
+        metric("ga4_bounce_rate", 40.0, "spring", "enterprise", 0),
+        metric("ga4_bounce_rate", 65.0, "fall", "smb", 3),
+        metric("ga4_bounce_rate", 30.0, None, None, 4),
+    ], evaluate_alerts=False)
+
+    conn = sqlite3.connect(path)
+    DailyRollup().refresh(conn)
+    requirements = [MetricRequirement("ga4_"), MetricRequirement("ga4_", "avg"), MetricRequirement("ga4_", "count")]
+
+    def frame(load, segment):
+        df = load(conn, requirements, segment=segment)
+        return sorted(zip(df.metric_name, df.metric_value))
+
+    expected = {
+        Segment("spring"): [("ga4_bounce_rate", 40.0), ("ga4_bounce_rate__avg", 54.0), ("ga4_bounce_rate__count", 3.0)],
+        Segment("spring", "tier", "smb"): [("ga4_bounce_rate", 72.0), ("ga4_bounce_rate__avg", 61.0),
+                                           ("ga4_bounce_rate__count", 2.0)],
+        Segment(None): [("ga4_bounce_rate", 30.0), ("ga4_bounce_rate__avg", 30.0), ("ga4_bounce_rate__count", 1.0)],
+        None: [("ga4_bounce_rate", 40.0), ("ga4_bounce_rate__avg", 51.4), ("ga4_bounce_rate__count", 5.0)],
+    }
+    for segment, rows in expected.items():
+        assert frame(load_aggregated, segment) == frame(load_rollup_aggregated, segment) == rows
+    conn.close()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Metric Retention - Batched rollup, delete and rollback of expired raw rows
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from bmad.bmad_tracking_system import BMADTracker
+from bmad.metric_retention import DEFAULT_POLICIES, RetentionEngine, RetentionPolicy
+
+NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+POLICY = RetentionPolicy(table="metrics", raw_retention_days=90, rollup_table="metrics_daily_rollup")
+
+def make_metrics_db(path):
+    """Expired rows over two days and two metrics, plus recent rows that must survive"""
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE metrics (
+            id INTEGER PRIMARY KEY, timestamp TEXT, metric_name TEXT, source TEXT, metric_value REAL
+        )
+    ''')
+    rows = [(f"2026-01-0{day} {hour:02d}:00:00", name, "ga4", float(day * 100 + hour + offset))
+            for day in (1, 2) for hour in range(7) for name, offset in (("sessions", 0), ("users", 0.5))]
+    rows += [("2026-09-30 12:00:00", "sessions", "ga4", 1.0)] * 3
+    conn.executemany("INSERT INTO metrics (timestamp, metric_name, source, metric_value) VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+def grouped(conn, query):
+    return {row[:3]: row[3:] for row in conn.execute(query)}
+
+def test_batches_roll_up_then_delete_expired_rows(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    make_metrics_db(path)
+    conn = sqlite3.connect(path)
+    expected = grouped(conn, '''
+        SELECT substr(timestamp, 1, 10), metric_name, source,
+               COUNT(*), SUM(metric_value), MIN(metric_value), MAX(metric_value)
+        FROM metrics WHERE timestamp < '2026-07-01' GROUP BY 1, 2, 3
+    ''')
+    conn.close()
+
+    # Batches of 5 split every (day, metric) group, so partial rollups must merge
+    result = RetentionEngine(path, [POLICY], batch_size=5, pause_seconds=0).apply_policy(POLICY, now=NOW)
+    assert (result.rows_expired, result.rows_rolled_up, result.rows_deleted, result.batches) == (28, 28, 28, 6)
+
+    conn = sqlite3.connect(path)
+    rollup = grouped(conn, '''
+        SELECT day, metric_name, source, sample_count, value_sum, value_min, value_max FROM metrics_daily_rollup
+    ''')
+    assert rollup == expected
+    assert conn.execute("SELECT COUNT(*), MIN(timestamp) FROM metrics").fetchone() == (3, "2026-09-30 12:00:00")
+    conn.close()
+
+def test_failed_batch_rolls_back_its_rollup_and_delete(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    make_metrics_db(path)
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TRIGGER fail_on_day_two BEFORE DELETE ON metrics
+        WHEN old.timestamp >= '2026-01-02' BEGIN SELECT RAISE(ABORT, 'disk full'); END
+    ''')
+    conn.commit()
+    conn.close()
+
+    # The timestamp index yields day one first: batch one commits, batch two fails
+    engine = RetentionEngine(path, [POLICY], batch_size=14, pause_seconds=0)
+    with pytest.raises(sqlite3.DatabaseError):
+        engine.apply_policy(POLICY, now=NOW)
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT DISTINCT day FROM metrics_daily_rollup").fetchall() == [("2026-01-01",)]
+    assert conn.execute("SELECT SUM(sample_count) FROM metrics_daily_rollup").fetchone() == (14,)
+    assert conn.execute("SELECT COUNT(*) FROM metrics WHERE timestamp < '2026-01-02'").fetchone() == (0,)
+    assert conn.execute("SELECT COUNT(*) FROM metrics WHERE timestamp >= '2026-01-02'").fetchone() == (17,)
+    conn.close()
+
+def test_campaign_metrics_keep_optimization_windows_raw(tmp_path):
+    tracker = BMADTracker(str(tmp_path / "tracking.db"))
+    tracker.record_optimization("calc", "Calculator", 20)
+
+    conn = sqlite3.connect(tracker.db_path)
+    conn.execute("UPDATE optimizations SET implemented_date = '2026-03-01 00:00:00'")
+    conn.executemany("INSERT INTO campaign_metrics (timestamp, metric_name, metric_value) VALUES (?, ?, ?)", [
+        ("2026-01-01 00:00:00", "form_submission_rate", 20.0),  # Outside the window: rolled up
+        ("2026-02-20 00:00:00", "form_submission_rate", 21.0),  # Baseline sample: kept
+        ("2026-03-05 00:00:00", "form_submission_rate", 25.0),  # After sample: kept
+    ])
+    conn.commit()
+    conn.close()
+
+    policy = DEFAULT_POLICIES["campaign_metrics"]
+    result = RetentionEngine(tracker.db_path, [policy], pause_seconds=0).apply_policy(policy, now=NOW)
+    assert result.rows_deleted == 1
+
+    analysis = tracker.calculate_optimization_impact("calc", days_back=30)["impact_analysis"]
+    assert analysis["form_submission_rate"]["before"] == 21.0
+    assert analysis["form_submission_rate"]["after"] == 25.0
+    conn = sqlite3.connect(tracker.db_path)
+    assert conn.execute("SELECT timestamp FROM campaign_metrics ORDER BY timestamp").fetchall() == \
+        [("2026-02-20 00:00:00",), ("2026-03-05 00:00:00",)]
+    conn.close()
+
+def test_cutoff_compares_timestamps_in_utc_whatever_their_format(tmp_path):
+    path = str(tmp_path / "metrics.db")
+    make_metrics_db(path)
+    conn = sqlite3.connect(path)
+    conn.execute("DELETE FROM metrics")
+    # The cutoff is 2026-07-03 00:00:00 UTC
+    conn.executemany("INSERT INTO metrics (timestamp, metric_name, source, metric_value) VALUES (?, 'sessions', 'ga4', ?)", [
+        ("2026-07-02 23:59:59", 1.0),               # CURRENT_TIMESTAMP style: expired
+        ("2026-07-02T12:00:00", 2.0),               # Naive isoformat(): expired
+        ("2026-07-02 18:00:00.250000+00:00", 3.0),  # sqlite3 adapter style: expired
+        ("2026-07-03 01:00:00+02:00", 4.0),         # 23:00 UTC the day before: expired
+        ("2026-07-02 23:30:00-02:00", 5.0),         # 01:30 UTC on the cutoff day: kept
+        ("2026-07-03T00:00:00", 6.0),               # On the cutoff: kept
+        ("not a timestamp", 7.0),                   # Never expired
+    ])
+    conn.commit()
+    conn.close()
+
+    result = RetentionEngine(path, [POLICY], pause_seconds=0).apply_policy(POLICY, now=NOW)
+    assert result.rows_deleted == 4
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT day, sample_count, value_sum FROM metrics_daily_rollup").fetchall() == \
+        [("2026-07-02", 4, 10.0)]
+    assert [row[0] for row in conn.execute("SELECT metric_value FROM metrics ORDER BY id")] == [5.0, 6.0, 7.0]
+    conn.close()
+
+def test_tagged_campaign_metrics_are_only_kept_by_their_own_optimization(tmp_path):
+    tracker = BMADTracker(str(tmp_path / "tracking.db"))
+    tracker.record_optimization("calc", "Calculator", 20)
+    tracker.record_optimization("form", "Shorter form", 10)
+
+    conn = sqlite3.connect(tracker.db_path)
+    conn.execute("UPDATE optimizations SET implemented_date = '2026-03-01 00:00:00' WHERE id = 'calc'")
+    conn.execute("UPDATE optimizations SET implemented_date = '2026-05-01 00:00:00' WHERE id = 'form'")
+    conn.executemany('''
+        INSERT INTO campaign_metrics (timestamp, metric_name, metric_value, optimization_id) VALUES (?, ?, ?, ?)
+    ''', [
+        ("2026-04-28 00:00:00", "form_submission_rate", 30.0, "calc"),  # Only in the form window: rolled up
+        ("2026-04-28 00:00:00", "form_submission_rate", 21.0, "form"),  # Its own window: kept
+        ("2026-04-29 00:00:00", "form_submission_rate", 22.0, None),    # Untagged in a window: kept
+        ("2026-05-03 00:00:00+00:00", "form_submission_rate", 26.0, None),
+    ])
+    conn.commit()
+    conn.close()
+
+    analysis = tracker.calculate_optimization_impact("form", days_back=30)["impact_analysis"]
+    assert analysis["form_submission_rate"]["before"] == pytest.approx(21.5)
+
+    policy = DEFAULT_POLICIES["campaign_metrics"]
+    result = RetentionEngine(tracker.db_path, [policy], pause_seconds=0).apply_policy(policy, now=NOW)
+    assert result.rows_deleted == 1
+
+    conn = sqlite3.connect(tracker.db_path)
+    assert conn.execute("SELECT COUNT(*) FROM campaign_metrics WHERE optimization_id = 'calc'").fetchone() == (0,)
+    conn.close()
+    after_retention = tracker.calculate_optimization_impact("form", days_back=30)["impact_analysis"]
+    assert after_retention["form_submission_rate"]["before"] == pytest.approx(21.5)
+    assert after_retention["form_submission_rate"]["before_samples"] == 2
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Metric Series - Ring buffer windows, statistics and wraparound
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from bmad.metric_series import MetricRingBuffer, TimeSeriesStore
+
+NOW = 1_800_000_000.0
+
+def filled(points, capacity=8):
+    series = MetricRingBuffer(capacity)
+    for timestamp, value in points:
+        series.append(timestamp, value)
+    return series
+
+def test_window_includes_points_on_the_cutoff_and_none_for_an_empty_buffer():
+    series = filled([(NOW - 120, 1.0), (NOW - 60, 2.0), (NOW - 59, 3.0), (NOW, 4.0)])
+
+    assert series.window(60, now=NOW)[1].tolist() == [2.0, 3.0, 4.0]
+    assert series.window(now=NOW)[1].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert series.window(0, now=NOW)[1].tolist() == [4.0]
+    assert series.mean(60, now=NOW) == pytest.approx(3.0)
+
+    empty = MetricRingBuffer(4)
+    assert empty.window(60, now=NOW)[1].size == 0
+    assert empty.latest() is None and empty.mean() is None and empty.percentile(50) is None
+
+    with pytest.raises(ValueError):
+        MetricRingBuffer(0)
+
+def test_timestamps_can_be_datetimes_or_epoch_seconds():
+    moment = datetime.fromtimestamp(NOW, tz=timezone.utc)
+    series = filled([(moment, 5.0), (NOW + 30, 7.0)])
+
+    assert series.window(10, now=NOW + 30)[1].tolist() == [7.0]
+    assert series.latest() == (NOW + 30, 7.0)
+
+def test_percentile_interpolates_within_the_window():
+    series = filled([(NOW - 100, 100.0)] + [(NOW - 40 + i, float(i)) for i in range(1, 5)])
+
+    assert series.percentile(50, 60, now=NOW) == pytest.approx(2.5)
+    assert series.percentile(0, 60, now=NOW) == 1.0
+    assert series.percentile(100, now=NOW) == 100.0
+
+def test_rate_of_change_is_the_least_squares_slope():
+    # Rises 2 per minute with noise around the trend
+    series = filled([(NOW + 60 * i, 10.0 + 2 * i + noise) for i, noise in enumerate([0.5, -0.5, 0.5, -0.5])])
+
+    assert series.rate_of_change(per=60) == pytest.approx(1.8)
+    assert series.rate_of_change() == pytest.approx(108.0)
+    assert series.rate_of_change(30, now=NOW + 180) is None  # One point in the window
+    assert filled([(NOW, 1.0), (NOW, 3.0)]).rate_of_change() is None  # No time spread
+
+def test_full_buffer_overwrites_the_oldest_points():
+    series = filled([(NOW + i, float(i)) for i in range(11)], capacity=4)
+
+    timestamps, values = series.ordered()
+    assert len(series) == 4
+    assert values.tolist() == [7.0, 8.0, 9.0, 10.0]
+    assert timestamps.tolist() == [NOW + 7, NOW + 8, NOW + 9, NOW + 10]
+    assert series.latest() == (NOW + 10, 10.0)
+    assert series.mean() == pytest.approx(8.5)
+
+def test_out_of_order_points_are_windowed_by_timestamp_not_arrival():
+    series = filled([(NOW, 1.0), (NOW - 300, 2.0), (NOW - 10, 3.0)])
+
+    assert series.ordered()[1].tolist() == [1.0, 2.0, 3.0]
+    assert series.window(60, now=NOW)[1].tolist() == [1.0, 3.0]
+    assert series.latest() == (NOW - 10, 3.0)  # Last appended, not newest
+    # The slope does not depend on arrival order
+    assert series.rate_of_change(per=1) == pytest.approx(filled(
+        [(NOW - 300, 2.0), (NOW - 10, 3.0), (NOW, 1.0)]).rate_of_change(per=1))
+
+    # When full, the earliest arrival is evicted even if a later arrival is older
+    series = filled([(NOW, 1.0), (NOW - 300, 2.0), (NOW - 10, 3.0)], capacity=2)
+    assert series.ordered()[0].tolist() == [NOW - 300, NOW - 10]
+
+def test_store_keeps_one_buffer_per_metric_and_summarizes_it():
+    store = TimeSeriesStore(capacity=3)
+    for i in range(5):
+        store.append("ga4_sessions", NOW + 60 * i, 100.0 + 10 * i)
+    store.append("email_open_rate", NOW, 30.0)
+
+    assert "ga4_sessions" in store and "crm_leads_created" not in store
+    assert len(store.get("ga4_sessions")) == 3 and store.get("crm_leads_created") is None
+    assert store.count("ga4_sessions") == 3 and store.count("crm_leads_created") == 0
+    assert store.count("ga4_sessions", 90, now=NOW + 240) == 2
+    assert store.mean("ga4_sessions") == pytest.approx(130.0)
+    assert store.percentile("ga4_sessions", 50) == pytest.approx(130.0)
+    assert store.rate_of_change("ga4_sessions") == pytest.approx(600.0)
+    assert store.mean("crm_leads_created") is None
+
+    assert store.summary("ga4_sessions") == {
+        "count": 3, "latest": 140.0, "mean": pytest.approx(130.0), "min": 120.0, "max": 140.0,
+        "p50": pytest.approx(130.0), "p95": pytest.approx(139.0), "rate_per_hour": pytest.approx(600.0)
+    }
+    assert store.summary("ga4_sessions", 10, now=NOW + 3600) is None
+    assert store.summary("crm_leads_created") is None
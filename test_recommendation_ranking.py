@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Recommendation Ranking - Streaming per-category top-K selection
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from bmad.recommendation_ranking import RankedRecommendations, TopK
+
+def make_recommendations(count, seed=7):
+    rnd = random.Random(seed)
+    return [SimpleNamespace(id=i, priority_score=float(rnd.randint(0, 50)),
+                            category=rnd.choice(["quick_win", "major_project", "fill_in"]))
+            for i in range(count)]
+
+def stable_ranking(recs, category=None):
+    subset = [r for r in recs if category is None or r.category == category]
+    return sorted(subset, key=lambda r: r.priority_score, reverse=True)
+
+def test_top_k_matches_stable_sort_overall_and_per_category():
+    recs = make_recommendations(2000)
+    ranked = RankedRecommendations(recs, capacity=10)
+
+    assert list(ranked) == recs
+    assert ranked.top(10) == stable_ranking(recs)[:10]
+    assert ranked.top(3, category="quick_win") == stable_ranking(recs, "quick_win")[:3]
+    assert ranked.top(10, category="major_project") == stable_ranking(recs, "major_project")[:10]
+    assert ranked.top(5, category="thankless_task") == []
+
+def test_deeper_slices_fall_back_to_selection():
+    recs = make_recommendations(300, seed=3)
+    ranked = RankedRecommendations(recs, capacity=5)
+
+    assert ranked.top(40) == stable_ranking(recs)[:40]
+    assert ranked.top(40, category="fill_in") == stable_ranking(recs, "fill_in")[:40]
+
+def test_top_k_keeps_earliest_on_ties():
+    top = TopK(2)
+    for name in ["a", "b", "c"]:
+        top.push(1.0, name)
+    top.push(0.5, "d")
+
+    assert top.ranked() == ["a", "b"]
+
+def test_only_appends_can_change_the_ranked_items():
+    recs = make_recommendations(60, seed=11)
+    ranked = RankedRecommendations(recs[:40], capacity=5)
+    ranked += recs[40:50]
+    ranked.extend(recs[50:])
+
+    assert list(ranked) == recs and len(ranked) == 60
+    assert ranked[0] is recs[0] and ranked[-3:] == recs[-3:]
+    assert recs[7] in ranked and ranked.index(recs[7]) == 7
+    assert ranked.top(5) == stable_ranking(recs)[:5]
+    assert ranked.top(5, category="fill_in") == stable_ranking(recs, "fill_in")[:5]
+
+    for mutate in (lambda: ranked.insert(0, recs[0]), lambda: ranked.remove(recs[0]), lambda: ranked.pop(),
+                   lambda: ranked.sort(key=lambda r: r.id), lambda: ranked.clear()):
+        with pytest.raises(AttributeError):
+            mutate()
+    with pytest.raises(TypeError):
+        ranked[0] = recs[1]
+    with pytest.raises(TypeError):
+        ranked[:2] = []
+    with pytest.raises(TypeError):
+        del ranked[0]
+
+    assert list(ranked) == recs
+    assert ranked.top(5) == stable_ranking(recs)[:5]
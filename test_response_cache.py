@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Response Cache - TTL, size eviction and record/replay modes
+"""
+
+import pytest
+
+from bmad.response_cache import CacheMiss, ResponseCache
+
+RANGE = ("2026-01-01T00:00:00", "2026-01-02T00:00:00")
+
+def counting_fetcher(value):
+    calls = []
+    def fetch():
+        calls.append(1)
+        return value
+    return fetch, calls
+
+def test_live_mode_serves_fresh_entries_and_refetches_expired(tmp_path):
+    """Entries are reused within the TTL and refetched after it"""
+    cache = ResponseCache(str(tmp_path), mode="live", ttl_seconds=3600)
+    fetch, calls = counting_fetcher({"sessions": 10})
+
+    assert cache.fetch("ga4", "traffic", *RANGE, fetch) == {"sessions": 10}
+    assert cache.fetch("ga4", "traffic", *RANGE, fetch) == {"sessions": 10}
+    assert len(calls) == 1
+
+    cache.ttl_seconds = 0
+    cache.fetch("ga4", "traffic", *RANGE, fetch)
+    assert len(calls) == 2
+
+def test_replay_uses_recordings_and_never_fetches(tmp_path):
+    """Replay serves recorded responses and fails loudly on anything unrecorded"""
+    recorder = ResponseCache(str(tmp_path), mode="record")
+    recorder.fetch("crm", "pipeline", *RANGE, lambda: [1, 2, 3])
+
+    replay = ResponseCache(str(tmp_path), mode="replay", ttl_seconds=0)
+    assert replay.fetch("crm", "pipeline", *RANGE, lambda: pytest.fail("replay fetched")) == [1, 2, 3]
+
+    with pytest.raises(CacheMiss):
+        replay.fetch("crm", "pipeline", RANGE[1], "2026-01-03T00:00:00", lambda: pytest.fail("replay fetched"))
+
+def test_size_eviction_drops_least_recently_used(tmp_path):
+    """Exceeding max_bytes evicts the oldest-accessed entries first"""
+    cache = ResponseCache(str(tmp_path), mode="live", max_bytes=2500)
+    payload = "x" * 1000
+
+    cache.fetch("email", "a", *RANGE, lambda: payload)
+    cache.fetch("email", "b", *RANGE, lambda: payload)
+    cache.fetch("email", "a", *RANGE, lambda: pytest.fail("a should be cached"))
+    cache.fetch("email", "c", *RANGE, lambda: payload)
+
+    assert cache.stats["evictions"] == 1
+    fetch, calls = counting_fetcher(payload)
+    cache.fetch("email", "b", *RANGE, fetch)
+    assert len(calls) == 1
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Scheduler - Triggers, catch-up after restart and overlap protection
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from bmad.scheduler import Scheduler, daily_at, every, weekly_at
+
+def test_triggers_compute_next_occurrence():
+    monday_noon = datetime(2026, 1, 5, 12, 0)
+    assert daily_at("02:00")(monday_noon) == datetime(2026, 1, 6, 2, 0)
+    assert daily_at("13:30")(monday_noon) == datetime(2026, 1, 5, 13, 30)
+    assert weekly_at("monday", "10:00")(monday_noon) == datetime(2026, 1, 12, 10, 0)
+    assert weekly_at("wednesday", "09:00")(monday_noon) == datetime(2026, 1, 7, 9, 0)
+    assert every(timedelta(days=28))(monday_noon) == datetime(2026, 2, 2, 12, 0)
+
+def test_missed_run_is_caught_up_once_after_restart(tmp_path):
+    """A job whose due time passed while stopped runs immediately, once"""
+    db = str(tmp_path / "state.db")
+    Scheduler(db)
+    conn = sqlite3.connect(db)
+    conn.execute("INSERT INTO scheduler_state (job_name, last_run_at) VALUES (?, ?)",
+                 ("collect", (datetime.now() - timedelta(days=3)).isoformat()))
+    conn.commit()
+    conn.close()
+
+    runs = []
+    scheduler = Scheduler(db, on_run=runs.append)
+    scheduler.add_job("collect", lambda: None, daily_at("02:00"))
+    scheduler.add_job("never_run", lambda: None, daily_at("02:00"))
+
+    assert scheduler.next_due()[1] == "collect"
+
+    scheduler.start()
+    deadline = time.time() + 5
+    while not runs and time.time() < deadline:
+        time.sleep(0.01)
+    scheduler.stop()
+
+    assert [r.job_name for r in runs] == ["collect"]
+    assert runs[0].status == "success"
+    assert Scheduler(db).load_last_run_at("collect").date() == datetime.now().date()
+
+def test_overlapping_runs_are_skipped(tmp_path):
+    """A job still running when it comes due again is not started twice"""
+    release = threading.Event()
+    started = []
+    runs = []
+
+    def slow_job():
+        started.append(time.time())
+        release.wait(5)
+
+    scheduler = Scheduler(str(tmp_path / "state.db"), on_run=runs.append)
+    scheduler.add_job("slow", slow_job, every(timedelta(milliseconds=50)))
+    scheduler.start()
+
+    time.sleep(0.4)
+    release.set()
+    scheduler.stop()
+
+    assert len(started) == 1
+    assert any(r.status == "skipped_overlap" for r in runs)
+    assert [r.status for r in runs if r.status != "skipped_overlap"] == ["success"]
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test BMAD Startup Time - Cold import budget measured with python -X importtime
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).parent
+
+# Cumulative import time (microseconds) a cold start of each tool may spend on
+# its own import graph, and modules that must stay deferred until used
+STARTUP_BUDGET_US = 150_000
+HEAVY_MODULES = {"numpy", "pandas", "pyarrow", "requests", "smtplib"}
+
+def import_times(code: str) -> dict:
+    """Top-level module -> cumulative import microseconds for a fresh interpreter"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=REPO_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):  # Nested imports are included in their parent
+            times[name.strip()] = int(cumulative)
+        times.setdefault("_all", set()).add(name.strip())
+    return times
+
+@pytest.mark.parametrize("tool", [
+    "bmad.__main__",
+    "bmad.measure_tracking_system",
+    "bmad.decide_workflow_system",
+    "bmad.bmad_integration_system"
+])
+def test_cold_start_stays_within_import_budget(tool):
+    interpreter = import_times("pass")
+    times = import_times(f"import {tool}")
+
+    loaded = times.pop("_all")
+    assert not HEAVY_MODULES & loaded, f"{tool} eagerly imports {sorted(HEAVY_MODULES & loaded)}"
+
+    own = {name: us for name, us in times.items() if name not in interpreter}
+    total = sum(own.values())
+    slowest = sorted(own.items(), key=lambda item: item[1], reverse=True)[:5]
+    assert total <= STARTUP_BUDGET_US, f"{tool} imports took {total}us (budget {STARTUP_BUDGET_US}us): {slowest}"
+
+def test_decision_report_does_not_load_numpy(tmp_path):
+    # Engine construction and the --report path never evaluate rules. Lazy
+    # modules sit in sys.modules as proxies until first used, so check the type
+    code = ("import sys, types; from bmad.decide_workflow_system import DecisionEngine, main; "
+            "DecisionEngine(); main(['--report']); "
+            "print(sorted(name for name in ('numpy', 'pandas') if type(sys.modules.get(name)) is types.ModuleType))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True, check=True,
+                            env={**os.environ, "PYTHONPATH": str(REPO_DIR)})
+
+    assert result.stdout.splitlines()[-1] == "[]"
+    assert list((tmp_path / "reports").glob("decision_report_*.md"))
@@ -6,7 +6,7 @@ Update DNS records for mybenefitsvideos.com using Cloudflare API
 import os
 import json
 import subprocess
-import requests
+from bmad.http_client import get_shared_client
 import sys
 
 def get_github_secret(secret_name, org="Mojo-Solo"):
@@ -36,7 +36,7 @@ def get_zone_id(domain, email, api_token):
     }
     
     params = {"name": domain}
-    response = requests.get(url, headers=headers, params=params)
+    response = get_shared_client().get(url, headers=headers, params=params)
     
     if response.status_code != 200:
         print(f"Failed to get zone info: {response.status_code} - {response.text}")
@@ -58,7 +58,7 @@ def list_dns_records(zone_id, email, api_token):
         "Content-Type": "application/json"
     }
     
-    response = requests.get(url, headers=headers)
+    response = get_shared_client().get(url, headers=headers)
     
     if response.status_code != 200:
         print(f"Failed to list DNS records: {response.status_code} - {response.text}")
@@ -80,7 +80,7 @@ def update_dns_record(zone_id, record_id, record_data, email, api_token):
         "Content-Type": "application/json"
     }
     
-    response = requests.put(url, headers=headers, json=record_data)
+    response = get_shared_client().put(url, headers=headers, json=record_data)
     
     if response.status_code != 200:
         print(f"Failed to update DNS record: {response.status_code} - {response.text}")
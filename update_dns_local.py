@@ -7,7 +7,7 @@ This version runs locally and prompts for credentials if not in env
 import os
 import json
 import subprocess
-import requests
+from bmad.http_client import get_shared_client
 import sys
 import getpass
 
@@ -56,7 +56,7 @@ def get_zone_id(domain, email, api_token):
     }
     
     params = {"name": domain}
-    response = requests.get(url, headers=headers, params=params)
+    response = get_shared_client().get(url, headers=headers, params=params)
     
     if response.status_code != 200:
         print(f"Failed to get zone info: {response.status_code} - {response.text}")
@@ -78,7 +78,7 @@ def list_dns_records(zone_id, email, api_token):
         "Content-Type": "application/json"
     }
     
-    response = requests.get(url, headers=headers)
+    response = get_shared_client().get(url, headers=headers)
     
     if response.status_code != 200:
         print(f"Failed to list DNS records: {response.status_code} - {response.text}")
@@ -100,7 +100,7 @@ def update_dns_record(zone_id, record_id, record_data, email, api_token):
         "Content-Type": "application/json"
     }
     
-    response = requests.put(url, headers=headers, json=record_data)
+    response = get_shared_client().put(url, headers=headers, json=record_data)
     
     if response.status_code != 200:
         print(f"Failed to update DNS record: {response.status_code} - {response.text}")